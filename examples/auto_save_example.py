@@ -6,10 +6,24 @@
 backup_intervalとsave_intervalを活用した定期処理の実装
 """
 
+import heapq
 import threading
 import time
 from typing import Optional
 
+# スケジューラのイベント種別
+_SAVE = "save"
+_BACKUP = "backup"
+
+# 保存とバックアップの期限がこの秒数以内に重なった場合は1回の書き込みにまとめる
+COALESCE_WINDOW = 0.5
+
+# 実行間隔の下限（秒）。設定値が0以下でもスケジューラが空回りしないようにする
+MIN_INTERVAL = 1
+
+# stop() でスケジューラスレッドの終了を待つ最大時間（秒）
+STOP_TIMEOUT = 1.5
+
 
 class AutoSaveManager:
     """自動保存・バックアップ管理クラス"""
@@ -19,8 +33,10 @@ class AutoSaveManager:
         self.data_store = data_store
         self.logger = logger
 
-        self.save_timer: Optional[threading.Timer] = None
-        self.backup_timer: Optional[threading.Timer] = None
+        # 単一のスケジューラスレッドで保存・バックアップの両方を処理する
+        # （停止要求はスレッドごとのイベントで通知する）
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
         self.running = False
 
     def start(self):
@@ -29,76 +45,92 @@ class AutoSaveManager:
             return
 
         self.running = True
+        # 終了待ちがタイムアウトした前回のスレッドと混ざらないよう、イベントは毎回作り直す
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop_event,), name="auto-save", daemon=True
+        )
+        self._thread.start()
         self.logger.info("自動保存・バックアップ機能を開始しました")
 
-        # 自動保存タイマーを開始
-        if self.config.is_auto_save_enabled():
-            self._schedule_next_save()
-
-        # 自動バックアップタイマーを開始
-        self._schedule_next_backup()
-
     def stop(self):
         """自動保存・バックアップを停止"""
         self.running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
 
-        if self.save_timer:
-            self.save_timer.cancel()
-            self.save_timer = None
-
-        if self.backup_timer:
-            self.backup_timer.cancel()
-            self.backup_timer = None
+        if self._thread and self._thread is not threading.current_thread():
+            # 書き込み中でも長くは待たない（スレッドは書き込みが終わり次第終了する）
+            self._thread.join(timeout=STOP_TIMEOUT)
+            if self._thread.is_alive():
+                self.logger.warning("自動保存スレッドの終了待ちがタイムアウトしました")
+        self._thread = None
+        self._stop_event = None
 
         self.logger.info("自動保存・バックアップ機能を停止しました")
 
-    def _schedule_next_save(self):
-        """次回の自動保存をスケジュール"""
-        if not self.running:
-            return
-
-        save_interval = self.config.get_save_interval()
-        self.save_timer = threading.Timer(save_interval, self._auto_save)
-        self.save_timer.daemon = True
-        self.save_timer.start()
-
-    def _auto_save(self):
+    def _run(self, stop_event: threading.Event):
+        """期限順のヒープで保存・バックアップを実行するスケジューラループ"""
+        now = time.monotonic()
+        heap = [(now + self._get_interval(_BACKUP), _BACKUP)]
+        if self.config.is_auto_save_enabled():
+            heap.append((now + self._get_interval(_SAVE), _SAVE))
+        heapq.heapify(heap)
+
+        while not stop_event.is_set():
+            timeout = heap[0][0] - time.monotonic()
+            if timeout > 0 and stop_event.wait(timeout):
+                # stop() による起床
+                break
+
+            due = [heapq.heappop(heap)]
+            if heap and heap[0][1] != due[0][1] and heap[0][0] - time.monotonic() < COALESCE_WINDOW:
+                # バックアップは保存を兼ねるため、重なった保存は省略する
+                due.append(heapq.heappop(heap))
+
+            intervals = {kind: self._get_interval(kind) for _, kind in due}
+            if _BACKUP in intervals:
+                self._auto_backup(intervals[_BACKUP])
+            else:
+                self._auto_save(intervals[_SAVE])
+
+            # 実行完了時刻ではなく前回の期限を基準に次回期限を決める（処理時間によるずれを防ぐ）
+            now = time.monotonic()
+            for deadline, kind in due:
+                interval = intervals[kind]
+                deadline += interval
+                if deadline <= now:
+                    # 処理が長引いて過ぎた回は追いかけずにスキップする
+                    deadline += ((now - deadline) // interval + 1) * interval
+                heapq.heappush(heap, (deadline, kind))
+
+    def _get_interval(self, kind: str) -> int:
+        """イベント種別に応じた実行間隔（秒）を取得（下限はMIN_INTERVAL）"""
+        if kind == _SAVE:
+            interval = self.config.get_save_interval()
+        else:
+            interval = self.config.get_backup_interval()
+        return max(interval, MIN_INTERVAL)
+
+    def _auto_save(self, interval: int):
         """自動保存を実行"""
         try:
             if self.config.is_auto_save_enabled() and self.running:
                 self.data_store.save_data()
-                self.logger.info(f"定期自動保存を実行しました (間隔: {self.config.get_save_interval()}秒)")
-
-            # 次回の保存をスケジュール
-            self._schedule_next_save()
+                self.logger.info("定期自動保存を実行しました (間隔: %d秒)", interval)
 
         except Exception as e:
-            self.logger.error(f"自動保存中にエラーが発生しました: {e}")
-            self._schedule_next_save()  # エラーが発生してもタイマーを継続
+            self.logger.error("自動保存中にエラーが発生しました: %s", e)
 
-    def _schedule_next_backup(self):
-        """次回のバックアップをスケジュール"""
-        if not self.running:
-            return
-
-        backup_interval = self.config.get_backup_interval()
-        self.backup_timer = threading.Timer(backup_interval, self._auto_backup)
-        self.backup_timer.daemon = True
-        self.backup_timer.start()
-
-    def _auto_backup(self):
+    def _auto_backup(self, interval: int):
         """自動バックアップを実行"""
         try:
             if self.running:
                 self.data_store.save_data(create_backup=True)
-                self.logger.info(f"定期バックアップを実行しました (間隔: {self.config.get_backup_interval()}秒)")
-
-            # 次回のバックアップをスケジュール
-            self._schedule_next_backup()
+                self.logger.info("定期バックアップを実行しました (間隔: %d秒)", interval)
 
         except Exception as e:
-            self.logger.error(f"自動バックアップ中にエラーが発生しました: {e}")
-            self._schedule_next_backup()  # エラーが発生してもタイマーを継続
+            self.logger.error("自動バックアップ中にエラーが発生しました: %s", e)
 
 
 # KeyboardMonitorクラスへの統合例
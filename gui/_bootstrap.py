@@ -0,0 +1,35 @@
+"""
+バックエンド初期化
+
+GUIの各エントリーポイントで共通のバックエンドコンポーネントを生成する
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    from analyzer import StatisticsAnalyzer
+    from config import ConfigManager
+    from data_store import DataStore
+    from logger import KeyboardLogger
+
+
+@lru_cache(maxsize=1)
+def backend() -> Tuple["ConfigManager", "DataStore", "KeyboardLogger", "StatisticsAnalyzer"]:
+    """
+    バックエンドコンポーネントを取得（プロセス内で1回だけ生成し、以降は同じものを返す）
+
+    Returns:
+        (設定, データストア, キーロガー, 統計分析) のタプル
+    """
+    # srcディレクトリは呼び出し元のエントリーポイントでパスに追加済み
+    from analyzer import StatisticsAnalyzer
+    from config import get_config
+    from data_store import DataStore
+    from logger import KeyboardLogger
+
+    config = get_config()
+    data_store = DataStore(str(config.get_data_file_path()))
+    keyboard_logger = KeyboardLogger(data_store)
+    statistics_analyzer = StatisticsAnalyzer(data_store)
+    return config, data_store, keyboard_logger, statistics_analyzer
@@ -0,0 +1,42 @@
+"""
+ワーカースレッドからUIへの受け渡し
+
+ワーカースレッドの処理結果をTkのメインスレッドで実行するためのミックスイン
+"""
+
+import tkinter as tk
+from typing import Any, Callable
+
+
+class UiPostMixin:
+    """ワーカースレッドからメインスレッドへ処理を渡すミックスイン（Tkウィジェットと組み合わせる）
+
+    destroy()後やTkの終了後に渡された処理は実行せずに捨てる。
+    """
+
+    # 破棄後はワーカースレッドから処理を渡さない
+    _destroyed = False
+
+    def _post_to_ui(self, callback: Callable[..., Any], *args: Any, idle: bool = False) -> None:
+        """処理をメインスレッドで実行するよう予約（ワーカースレッドから呼ぶ）"""
+        if self._destroyed:
+            return
+        try:
+            if idle:
+                self.after_idle(self._run_posted, callback, args)
+            else:
+                self.after(0, self._run_posted, callback, args)
+        except (RuntimeError, tk.TclError):
+            # Tkが既に終了している場合は通知しない
+            self._destroyed = True
+
+    def _run_posted(self, callback: Callable[..., Any], args: tuple) -> None:
+        """予約された処理を実行（メインスレッドで実行）"""
+        if self._destroyed or not self.winfo_exists():
+            return
+        callback(*args)
+
+    def destroy(self) -> None:
+        """破棄済みにしてからウィジェットを破棄"""
+        self._destroyed = True
+        super().destroy()
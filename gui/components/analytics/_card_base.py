@@ -0,0 +1,69 @@
+"""
+分析カード共通の基底クラス
+"""
+
+import tkinter as tk
+from typing import Optional, Tuple
+
+import customtkinter as ctk
+
+
+class DeferredUpdateCard(ctk.CTkFrame):
+    """更新を遅延して反映する分析カードの基底クラス
+
+    連続した更新要求は最後の1回にまとめ、非表示中（親ごと隠されている場合を含む）は
+    表示されるまで保留する。親を再表示した時は flush_pending_update を呼ぶ。
+    サブクラスは update_data から _schedule_update を呼び、_do_update_data で表示を更新する。
+    """
+
+    # 連続した更新要求をまとめる待ち時間（ミリ秒）
+    UPDATE_DELAY_MS = 50
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        # 連続した更新要求は最後の1回にまとめて反映する
+        self._pending: Optional[Tuple] = None
+        self._pending_after_id: Optional[str] = None
+        # CTkFrame.bindは内部のキャンバスに登録されるため、フレーム自体に登録する
+        tk.Misc.bind(self, "<Map>", self._on_map, "+")
+
+    def _schedule_update(self, *args) -> None:
+        """_do_update_data の呼び出しを予約（予約済みなら引数だけ差し替える）"""
+        self._pending = args
+        if self._pending_after_id is None:
+            self._pending_after_id = self.after(self.UPDATE_DELAY_MS, self._flush_update)
+
+    def _do_update_data(self, *args) -> None:
+        """予約された更新を表示に反映（サブクラスで実装）"""
+        raise NotImplementedError
+
+    def _flush_update(self):
+        """予約された更新を実行（非表示中は表示されるまで保留）"""
+        self._pending_after_id = None
+        # 親ごと隠されている場合も保留するため、winfo_ismappedではなくwinfo_viewableで判定
+        if not self.winfo_viewable():
+            return
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self._do_update_data(*pending)
+
+    def flush_pending_update(self):
+        """保留中の更新があれば反映を予約"""
+        if self._pending is not None and self._pending_after_id is None:
+            self._pending_after_id = self.after_idle(self._flush_update)
+
+    def _on_map(self, event=None):
+        """表示された時に保留中の更新を反映"""
+        self.flush_pending_update()
+
+    def _cancel_pending(self):
+        """予約済みの更新を取り消す"""
+        if self._pending_after_id is not None:
+            self.after_cancel(self._pending_after_id)
+            self._pending_after_id = None
+
+    def destroy(self):
+        """予約済みの更新を取り消してから破棄"""
+        self._cancel_pending()
+        super().destroy()
@@ -0,0 +1,79 @@
+"""
+分析カード共通の表示フォーマット（キー名・順位の表記と色）
+"""
+
+from functools import lru_cache
+from typing import Tuple, Union
+
+# 特殊キーの表示名マッピング
+SPECIAL_KEYS = {
+    'space': 'Space',
+    'backspace': 'BS',
+    'enter': 'Enter',
+    'shift': 'Shift',
+    'ctrl': 'Ctrl',
+    'alt': 'Alt',
+    'tab': 'Tab',
+    'escape': 'Esc',
+    'delete': 'Del',
+    'insert': 'Ins',
+    'home': 'Home',
+    'end': 'End',
+    'page_up': 'PgUp',
+    'page_down': 'PgDn',
+    'up': '↑',
+    'down': '↓',
+    'left': '←',
+    'right': '→',
+    'caps_lock': 'Caps',
+    'num_lock': 'Num',
+    'scroll_lock': 'Scrl'
+}
+
+
+# よく使われる表記（小文字・先頭大文字・大文字）をそのまま引けるようにしたもの
+_SPECIAL_KEYS_CI = {
+    variant: display
+    for key, display in SPECIAL_KEYS.items()
+    for variant in (key, key.capitalize(), key.upper())
+}
+
+
+@lru_cache(maxsize=256)
+def format_key_name(key: str) -> str:
+    """キー名を表示用にフォーマット（キー名の種類は限られるためキャッシュする）"""
+    display = _SPECIAL_KEYS_CI.get(key)
+    if display is not None:
+        return display
+
+    # それ以外の表記の特殊キー
+    display = SPECIAL_KEYS.get(key.lower())
+    if display is not None:
+        return display
+
+    # ファンクションキーを含む通常のキー（大文字で表示）
+    return key.upper()
+
+
+# 順位の表示文字列（"1." 〜 "10."）
+RANK_LABELS = tuple(f"{i}." for i in range(1, 11))
+
+
+def rank_label(rank: int) -> str:
+    """順位の表示文字列を取得"""
+    return RANK_LABELS[rank - 1] if 1 <= rank <= len(RANK_LABELS) else f"{rank}."
+
+
+# 順位ごとの表示色（ゴールド, シルバー, ブロンズ, グリーン, グリーン）
+RANK_COLORS = ("#FFD700", "#C0C0C0", "#CD7F32", "#4CAF50", "#4CAF50")
+# 上位3位のみ色分けする場合
+MEDAL_COLORS = RANK_COLORS[:3]
+
+
+def rank_color(
+    rank: int,
+    palette: Tuple[str, ...] = RANK_COLORS,
+    default: Union[str, Tuple[str, str]] = ("gray20", "gray80")
+) -> Union[str, Tuple[str, str]]:
+    """順位に応じた色を取得（パレット外の順位はdefault）"""
+    return palette[rank - 1] if 1 <= rank <= len(palette) else default
@@ -0,0 +1,16 @@
+"""
+gui直下の共通モジュールの読み込み
+
+起動方法によってgui直下のモジュールの位置が異なるため、どちらでも読み込めるようにする
+"""
+
+try:
+    # gui/ がパスにある場合（main_window.pyなどから起動）
+    from _ui_thread import UiPostMixin
+    from styles.fonts import font_set
+except ImportError:
+    # プロジェクトルートがパスにある場合（run_analytics.pyなどから起動）
+    from gui._ui_thread import UiPostMixin
+    from gui.styles.fonts import font_set
+
+__all__ = ["UiPostMixin", "font_set"]
@@ -6,21 +6,61 @@
 """
 
 import json
+import logging
+import os
 import threading
-from datetime import datetime
+import time
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from heapq import nlargest
+from operator import itemgetter
+from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import customtkinter as ctk
 
+try:
+    import orjson
+except ImportError:  # orjsonがない環境では標準のjsonで書き出す
+    orjson = None
+
+from ._shared import UiPostMixin, font_set
 # from .basic_stats_card import BasicStatsCard  # ヘッダー表示に変更したため不要
 from .data_analyzer import DataAnalyzer
 from .integrated_sequence_card import IntegratedSequenceCard
 from .key_frequency_card import KeyFrequencyCard
 from .modifier_analysis_card import ModifierAnalysisCard
 
+logger = logging.getLogger(__name__)
+
+# デフォルトのデータファイルパス（プロジェクトルート/data/keyboard_log.json）
+_DEFAULT_DATA_PATH = str(Path(__file__).resolve().parents[3] / "data" / "keyboard_log.json")
+
+# エクスポート時の書き込みバッファサイズ
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# 記録期間の表示変換（yyyy/mm/dd → yyyy-mm-dd）
+_PERIOD_TT = str.maketrans({"/": "-"})
+
+# 更新完了ステータスのテンプレート
+_STATUS_TMPL = "データ更新完了 ({})"
+
+# 配色（ライトモード, ダークモード）
+_HEADER_BG = ("gray90", "gray15")
+_TITLE_FG = ("gray10", "gray90")
+_MUTED_FG = ("gray50", "gray60")
+
+# ページ共通のフォント（用途名 -> (サイズ, 太さ)）
+_FONT_SPECS = {
+    "title": (24, "bold"),
+    "button": (12, "bold"),
+    "status": (11, "normal"),
+}
 
-class AnalyticsPage(ctk.CTkFrame):
+
+class AnalyticsPage(UiPostMixin, ctk.CTkFrame):
     """分析ページのメインクラス"""
 
     def __init__(self, parent, data_file_path: Optional[str] = None, **kwargs):
@@ -29,13 +69,21 @@ class AnalyticsPage(ctk.CTkFrame):
         # データファイルパスの設定
         if data_file_path is None:
             # デフォルトパスを使用
-            from pathlib import Path
-            project_root = Path(__file__).parent.parent.parent.parent
-            data_file_path = str(project_root / "data" / "keyboard_log.json")
+            data_file_path = _DEFAULT_DATA_PATH
 
         # データアナライザーの初期化
         self.data_analyzer = DataAnalyzer(data_file_path)
         self.current_data = None
+        # current_data はワーカーで差し替え、UIスレッドで読むため参照の入れ替えを保護する
+        self._data_lock = threading.Lock()
+
+        # 読み込み処理は単一のワーカースレッドで直列に実行する
+        self._io_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analytics-io")
+        self._pending_future: Optional[Future] = None
+
+        # 前回読み込み時のデータファイルの状態（変更がなければ再読み込みを省略）
+        self._last_mtime = -1.0
+        self._last_size = -1
 
         # 自動更新状態の初期化
         self.auto_refresh_enabled = False
@@ -43,6 +91,10 @@ class AnalyticsPage(ctk.CTkFrame):
         # UIの初期化
         self._setup_ui()
 
+        # ページが再表示された時に、非表示中に保留したカードの更新を反映する
+        # （カード自身の<Map>はページごと隠された場合には発生しないため）
+        tk.Misc.bind(self, "<Map>", self._on_map, "+")
+
         # 初期データ読み込み
         self._load_initial_data()
 
@@ -59,15 +111,17 @@ class AnalyticsPage(ctk.CTkFrame):
 
     def _create_header(self):
         """ヘッダー部分の作成"""
-        header_frame = ctk.CTkFrame(self, fg_color=("gray90", "gray15"))
+        fonts = font_set(_FONT_SPECS)
+
+        header_frame = ctk.CTkFrame(self, fg_color=_HEADER_BG)
         header_frame.pack(fill="x", padx=20, pady=(20, 10))
 
         # タイトル
         title_label = ctk.CTkLabel(
             header_frame,
             text="📈 キーボード使用統計",
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color=("gray10", "gray90")
+            font=fonts["title"],
+            text_color=_TITLE_FG
         )
         title_label.pack(side="left", padx=20, pady=15)
 
@@ -82,7 +136,7 @@ class AnalyticsPage(ctk.CTkFrame):
             command=self._refresh_data,
             width=120,
             height=35,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=fonts["button"]
         )
         self.refresh_button.pack(side="left", padx=5)
 
@@ -93,7 +147,7 @@ class AnalyticsPage(ctk.CTkFrame):
             command=self._export_data_simple,
             width=140,
             height=35,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=fonts["button"],
             fg_color=("green", "darkgreen")
         )
         self.export_button.pack(side="left", padx=5)
@@ -102,8 +156,8 @@ class AnalyticsPage(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             header_frame,
             text="",
-            font=ctk.CTkFont(size=11),
-            text_color=("gray50", "gray60")
+            font=fonts["status"],
+            text_color=_MUTED_FG
         )
         self.status_label.pack(side="bottom", padx=20, pady=(0, 10))
 
@@ -147,149 +201,150 @@ class AnalyticsPage(ctk.CTkFrame):
     def _load_initial_data(self):
         """初期データの読み込み"""
         self._update_status("データを読み込み中...")
+        self._pending_future = self._io_exec.submit(self._load_job, True)
 
-        # バックグラウンドで読み込み
-        def load_data():
-            try:
-                # デバッグ情報を取得
-                debug_info = self.data_analyzer.debug_data_loading()
-                print(f"=== デバッグ情報 ===")
-                print(f"データファイルパス: {debug_info['data_file_path']}")
-                print(f"ファイル存在: {debug_info['file_exists']}")
-                print(f"ファイルサイズ: {debug_info['file_size']} bytes")
-                print(f"データキー: {debug_info['data_keys']}")
-                print(f"総計統計キー: {debug_info.get('total_stats_keys', [])}")
-                print(f"キー統計数: {debug_info.get('key_stats_count', 0)}")
-                if debug_info['error']:
-                    print(f"エラー: {debug_info['error']}")
-                print("==================")
+    def _refresh_data(self):
+        """データの再読み込み"""
+        # 読み込み中であれば新しい要求は受け付けない（連打対策）
+        if self._pending_future and not self._pending_future.done():
+            return
+
+        # ボタンを無効化
+        self.refresh_button.configure(state="disabled", text="読み込み中...")
+        self._pending_future = self._io_exec.submit(self._load_job, False)
+
+    def _load_job(self, initial: bool):
+        """データ読み込みと分析（ワーカースレッドで実行）"""
+        try:
+            if initial:
+                if logger.isEnabledFor(logging.DEBUG):
+                    # デバッグ情報を取得（ファイルを再読み込みするためDEBUG時のみ）
+                    debug_info = self.data_analyzer.debug_data_loading()
+                    logger.debug(
+                        "データファイル: path=%s exists=%s size=%s bytes keys=%s "
+                        "total_stats_keys=%s key_stats_count=%s error=%s",
+                        debug_info['data_file_path'],
+                        debug_info['file_exists'],
+                        debug_info['file_size'],
+                        debug_info['data_keys'],
+                        debug_info.get('total_stats_keys', []),
+                        debug_info.get('key_stats_count', 0),
+                        debug_info['error'],
+                    )
 
                 # データファイルの存在確認
                 if not self.data_analyzer.has_data():
                     # データがない場合は空のUIを表示
-                    self.current_data = self.data_analyzer.load_data()
-                    self._show_no_data_message()
-                    self._update_status("データファイルが見つかりません。キーボードモニターを実行してデータを生成してください。")
+                    new_data = self.data_analyzer.load_data()
+                    with self._data_lock:
+                        self.current_data = new_data
+                    self._post_to_ui(self._apply_no_data)
                     return
 
-                self.current_data = self.data_analyzer.load_data()
-                print(f"読み込んだデータ: {list(self.current_data.keys()) if self.current_data else 'None'}")
+            signature = self._data_file_signature()
+            if not initial and signature is not None and signature == (self._last_mtime, self._last_size):
+                # 前回から変更がなければ解析を省略
+                self._post_to_ui(self._apply_unchanged)
+                return
 
-                # エラーが含まれているかチェック
-                if "error" in self.current_data:
-                    error_msg = self.current_data["error"]
-                    self.after(0, lambda: [
-                        self._update_status(f"データ読み込みエラー: {error_msg}"),
-                        self._show_error_message(f"データの読み込みに失敗しました:\n{error_msg}")
-                    ])
-                    return
+            data = self.data_analyzer.load_data()
+            with self._data_lock:
+                self.current_data = data
 
-                self._update_ui_with_data()
-                # 基本統計をステータスバーに表示
-                self._update_status_with_basic_stats()
+            # エラーが含まれているかチェック
+            if "error" in data:
+                self._post_to_ui(self._apply_load_error, data["error"], initial)
+                return
 
-            except Exception as e:
-                error_msg = str(e)
-                self.after(0, lambda: [
-                    self._update_status(f"データ読み込みエラー: {error_msg}"),
-                    self._show_error_message(f"データの読み込みに失敗しました:\n{error_msg}")
-                ])
+            views = self._compute_views(data)
+            if signature is not None:
+                self._last_mtime, self._last_size = signature
+            # 1回の更新分のUI変更はアイドル時の1コールバックにまとめる
+            self._post_to_ui(self._apply_views, views, initial, idle=True)
 
-        thread = threading.Thread(target=load_data, daemon=True)
-        thread.start()
+        except Exception as e:
+            self._post_to_ui(self._apply_load_error, str(e), initial)
 
-    def _refresh_data(self):
-        """データの再読み込み"""
-        # ボタンを無効化
-        self.refresh_button.configure(state="disabled", text="読み込み中...")
+    def _data_file_signature(self) -> Optional[Tuple[float, int]]:
+        """データファイルの (更新時刻, サイズ) を取得"""
+        try:
+            st = os.stat(self.data_analyzer.get_data_file_path())
+        except OSError:
+            return None
+        return st.st_mtime, st.st_size
 
-        def refresh():
+    def _safe_call(self, func, default):
+        """分析メソッドを呼び出し、失敗時はデフォルト値を返す"""
+        try:
+            return func()
+        except Exception as e:
+            logger.exception("%s でエラー: %s", func.__name__, e)
+            return default
+
+    def _compute_views(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """表示用の分析結果をまとめて計算（ワーカースレッドで実行）"""
+        if not data:
+            return {"has_data": False, "basic_stats": None}
+
+        key_frequency = self._safe_call(self.data_analyzer.get_key_frequency, {})
+        # カードが表示する上位N件だけを部分選択する
+        top_keys = nlargest(KeyFrequencyCard.TOP_N, key_frequency.items(), key=itemgetter(1))
+
+        return {
+            "has_data": True,
+            "basic_stats": self._safe_call(self.data_analyzer.get_basic_statistics, None),
+            "top_keys": top_keys,
+            "total_keystrokes": sum(key_frequency.values()),
+            "modifier_data": self._safe_call(self.data_analyzer.get_modifier_usage, {}),
+            "sequence_data": self._safe_call(self.data_analyzer.get_integrated_sequence_analysis, {}),
+        }
+
+    def _apply_views(self, views: Dict[str, Any], initial: bool):
+        """計算済みの分析結果をUIに反映（メインスレッドで実行）"""
+        if not views["has_data"]:
+            self._show_no_data_message()
+        else:
             try:
-                self.current_data = self.data_analyzer.load_data()
-                self._update_ui_with_data()
-
-                # メインスレッドでUI更新
-                self.after(0, lambda: [
-                    self.refresh_button.configure(state="normal", text="🔄 データ更新"),
-                    self._update_status(f"データ更新完了 ({datetime.now().strftime('%H:%M:%S')})")
-                ])
-
+                self.key_frequency_card.update_data(views["top_keys"], views["total_keystrokes"])
             except Exception as e:
-                error_msg = str(e)
-                self.after(0, lambda: [
-                    self.refresh_button.configure(state="normal", text="🔄 データ更新"),
-                    self._update_status(f"更新エラー: {error_msg}"),
-                    messagebox.showerror("エラー", f"データの更新に失敗しました:\n{error_msg}")
-                ])
-
-        thread = threading.Thread(target=refresh, daemon=True)
-        thread.start()
-
-    def _update_ui_with_data(self):
-        """データでUIを更新"""
-        if not self.current_data:
-            self._show_no_data_message()
-            return
+                logger.exception("キー頻度の更新でエラー: %s", e)
 
-        def update_ui():
             try:
-                # 基本統計（ヘッダーのステータスバーに表示するため、カード更新は不要）
-                # try:
-                #     basic_stats = self.data_analyzer.get_basic_statistics()
-                #     self.basic_stats_card.update_data(basic_stats)
-                # except Exception as e:
-                #     print(f"基本統計の更新でエラー: {e}")
-                #     self.basic_stats_card.update_data({
-                #         "total_keystrokes": 0,
-                #         "recording_period": "エラー",
-                #         "recording_days": "0日間",
-                #         "daily_average": "0.0回/日"
-                #     })
-
-                # キー頻度
-                try:
-                    key_frequency = self.data_analyzer.get_key_frequency()
-                    print(f"キー頻度データ: {key_frequency}")
-                    print(f"キー頻度データ数: {len(key_frequency)}")
-                    if key_frequency:
-                        sorted_keys = sorted(key_frequency.items(), key=lambda x: x[1], reverse=True)
-                        print(f"上位5キー: {sorted_keys[:5]}")
-                    self.key_frequency_card.update_data(key_frequency)
-                except Exception as e:
-                    print(f"キー頻度の更新でエラー: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    self.key_frequency_card.update_data({})
-
-                # 修飾キー分析
-                try:
-                    modifier_data = self.data_analyzer.get_modifier_usage()
-                    print(f"修飾キー分析データ: {modifier_data}")
-                    self.modifier_analysis_card.update_data(modifier_data)
-                except Exception as e:
-                    print(f"修飾キー分析の更新でエラー: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    self.modifier_analysis_card.update_data({})
-
-                # 統合シーケンス分析
-                try:
-                    sequence_data = self.data_analyzer.get_integrated_sequence_analysis()
-                    print(f"シーケンス分析データキー数: {len(sequence_data)}")
-                    print(f"シーケンス分析データの最初の3キー: {list(sequence_data.keys())[:3] if sequence_data else []}")
-                    self.sequence_card.update_data(sequence_data)
-                except Exception as e:
-                    print(f"シーケンス分析の更新でエラー: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    self.sequence_card.update_data({})
+                self.modifier_analysis_card.update_data(views["modifier_data"])
+            except Exception as e:
+                logger.exception("修飾キー分析の更新でエラー: %s", e)
 
+            try:
+                self.sequence_card.update_data(views["sequence_data"])
             except Exception as e:
-                print(f"UI更新で予期しないエラー: {e}")
-                self._update_status(f"UI更新エラー: {str(e)}")
+                logger.exception("シーケンス分析の更新でエラー: %s", e)
 
-        # メインスレッドでUI更新
-        self.after(0, update_ui)
+        if initial:
+            # 基本統計をステータスバーに表示
+            self._update_status_with_basic_stats(views["basic_stats"])
+        else:
+            self.refresh_button.configure(state="normal", text="🔄 データ更新")
+            self._update_status(_STATUS_TMPL.format(time.strftime('%H:%M:%S')))
+
+    def _apply_unchanged(self):
+        """データに変更がなかった場合の表示（メインスレッドで実行）"""
+        self.refresh_button.configure(state="normal", text="🔄 データ更新")
+        self._update_status(_STATUS_TMPL.format(time.strftime('%H:%M:%S')))
+
+    def _apply_no_data(self):
+        """データファイルがない場合の表示（メインスレッドで実行）"""
+        self._show_no_data_message()
+        self._update_status("データファイルが見つかりません。キーボードモニターを実行してデータを生成してください。")
+
+    def _apply_load_error(self, error_msg: str, initial: bool):
+        """読み込みエラーの表示（メインスレッドで実行）"""
+        if initial:
+            self._update_status(f"データ読み込みエラー: {error_msg}")
+            self._show_error_message(f"データの読み込みに失敗しました:\n{error_msg}")
+        else:
+            self.refresh_button.configure(state="normal", text="🔄 データ更新")
+            self._update_status(f"更新エラー: {error_msg}")
+            messagebox.showerror("エラー", f"データの更新に失敗しました:\n{error_msg}")
 
     def _toggle_auto_refresh(self):
         """自動更新のトグル"""
@@ -303,15 +358,23 @@ class AnalyticsPage(ctk.CTkFrame):
                 self.auto_refresh_button.configure(text="自動更新: OFF", fg_color=("gray", "gray30"))
             self._stop_auto_refresh()
 
+    def _on_map(self, event=None):
+        """ページが表示された時に各カードの保留中の更新を反映"""
+        for card in (self.key_frequency_card, self.modifier_analysis_card, self.sequence_card):
+            card.flush_pending_update()
+
     def refresh_if_needed(self):
-        """必要に応じてデータを更新"""
-        # ファイルの更新時刻をチェックして自動更新する場合の実装
-        # 現在は手動更新のみ
-        pass
+        """必要に応じてデータを更新（データファイルに変更がなければ解析は省略される）"""
+        # 読み込み中であれば、その結果をそのまま使う
+        if self._pending_future and not self._pending_future.done():
+            return
+        self._pending_future = self._io_exec.submit(self._load_job, False)
 
     def _export_data_simple(self):
         """簡単なデータエクスポート機能"""
-        if not self.current_data:
+        with self._data_lock:
+            snapshot = self.current_data
+        if not snapshot:
             messagebox.showwarning("警告", "エクスポートするデータがありません。")
             return
 
@@ -322,12 +385,20 @@ class AnalyticsPage(ctk.CTkFrame):
         )
 
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.current_data, f, ensure_ascii=False, indent=2)
-                messagebox.showinfo("成功", f"データをエクスポートしました:\n{file_path}")
-            except Exception as e:
-                messagebox.showerror("エラー", f"エクスポートに失敗しました:\n{str(e)}")
+            # シリアライズと書き込みはワーカースレッドで行う
+            self._io_exec.submit(self._do_export, file_path, snapshot)
+
+    def _do_export(self, file_path: str, data: Dict[str, Any]):
+        """エクスポートファイルを書き出す（ワーカースレッドで実行）"""
+        try:
+            with open(file_path, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    f.write(json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+            self._post_to_ui(messagebox.showinfo, "成功", f"データをエクスポートしました:\n{file_path}")
+        except Exception as e:
+            self._post_to_ui(messagebox.showerror, "エラー", f"エクスポートに失敗しました:\n{str(e)}")
 
     def _show_no_data_message(self):
         """データなしメッセージを表示"""
@@ -348,11 +419,20 @@ class AnalyticsPage(ctk.CTkFrame):
             self.sequence_card.update_data({})
 
         except Exception as e:
-            print(f"UIの初期化でエラー: {e}")
+            logger.error("UIの初期化でエラー: %s", e)
 
-    def get_current_data(self) -> Optional[Dict[str, Any]]:
-        """現在のデータを取得"""
-        return self.current_data
+    def get_current_data(self) -> Optional[Mapping[str, Any]]:
+        """現在のデータを読み取り専用ビューで取得"""
+        with self._data_lock:
+            snapshot = self.current_data
+        return MappingProxyType(snapshot) if snapshot else None
+
+    def destroy(self):
+        """ページ破棄時にワーカーを停止"""
+        if self._pending_future:
+            self._pending_future.cancel()
+        self._io_exec.shutdown(wait=False)
+        super().destroy()
 
     def _update_status(self, message: str):
         """ステータスメッセージを更新"""
@@ -360,16 +440,16 @@ class AnalyticsPage(ctk.CTkFrame):
             if hasattr(self, 'status_label'):
                 self.status_label.configure(text=message)
         except Exception as e:
-            print(f"ステータス更新エラー: {e}")
+            logger.error("ステータス更新エラー: %s", e)
 
     def _show_error_message(self, message: str):
         """エラーメッセージを表示"""
         try:
             if hasattr(self, 'status_label'):
                 self.status_label.configure(text=f"エラー: {message}", text_color="red")
-            print(f"エラー: {message}")
+            logger.error("エラー: %s", message)
         except Exception as e:
-            print(f"エラーメッセージ表示エラー: {e}")
+            logger.error("エラーメッセージ表示エラー: %s", e)
 
     def _start_auto_refresh(self):
         """自動更新を開始（プレースホルダー）"""
@@ -381,22 +461,30 @@ class AnalyticsPage(ctk.CTkFrame):
         # 将来の実装用プレースホルダー
         pass
 
-    def _update_status_with_basic_stats(self):
+    def _update_status_with_basic_stats(self, basic_stats: Optional[Dict[str, Any]]):
         """基本統計をステータスバーに表示"""
+        if basic_stats is None:
+            self._update_status("データ読み込み完了")
+            return
+
         try:
-            basic_stats = self.data_analyzer.get_basic_statistics()
             total_keystrokes = basic_stats.get("total_keystrokes", 0)
             recording_period = basic_stats.get("recording_period", "記録なし")
 
+            try:
+                formatted_total = format(total_keystrokes, ',d')
+            except (TypeError, ValueError):
+                formatted_total = str(total_keystrokes)
+
             # フォーマット：「キー入力 xxxx回    2025-06-01~2025-06-27」
             if recording_period != "記録なし":
                 # 日付フォーマットを簡潔に変更（yyyy/mm/dd → yyyy-mm-dd）
-                period_formatted = recording_period.replace("/", "-").replace(" ～ ", "~")
-                status_text = f"キー入力 {total_keystrokes:,}回    {period_formatted}"
+                period_formatted = recording_period.translate(_PERIOD_TT).replace(" ～ ", "~")
+                status_text = f"キー入力 {formatted_total}回    {period_formatted}"
             else:
-                status_text = f"キー入力 {total_keystrokes:,}回    記録期間なし"
+                status_text = f"キー入力 {formatted_total}回    記録期間なし"
 
             self._update_status(status_text)
         except Exception as e:
-            print(f"基本統計ステータス更新エラー: {e}")
+            logger.error("基本統計ステータス更新エラー: %s", e)
             self._update_status("データ読み込み完了")
@@ -8,15 +8,29 @@ from typing import Any, Dict
 
 import customtkinter as ctk
 
+from ._shared import font_set
+
+# 配色（ライトモード, ダークモード）
+_HEADER_BG = ("gray90", "gray15")
+_TITLE_FG = ("gray10", "gray90")
+_STATS_FG = ("gray30", "gray70")
+
+# カードのフォント（用途名 -> (サイズ, 太さ)）
+_FONT_SPECS = {
+    "title": (16, "bold"),
+    "stats": (13, "normal"),
+}
+
 
 class BasicStatsCard(ctk.CTkFrame):
     """基本統計をヘッダー形式で表示するコンパクトなコンポーネント"""
 
     def __init__(self, parent, title: str = "📈 キーボード使用統計", **kwargs):
         super().__init__(parent, **kwargs)
+        fonts = font_set(_FONT_SPECS)
 
         # ヘッダー形式の設定（高さを抑制）
-        self.configure(corner_radius=8, fg_color=("gray90", "gray15"), height=50)
+        self.configure(corner_radius=8, fg_color=_HEADER_BG, height=50)
 
         # 横並びのメインフレーム
         self.main_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -26,8 +40,8 @@ class BasicStatsCard(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self.main_frame,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray10", "gray90")
+            font=fonts["title"],
+            text_color=_TITLE_FG
         )
         self.title_label.pack(side="left", anchor="w")
 
@@ -35,35 +49,35 @@ class BasicStatsCard(ctk.CTkFrame):
         self.stats_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         self.stats_frame.pack(side="right", anchor="e")
 
+        # 統計テキスト（更新時はテキストのみ差し替える）
+        self._stats_label = ctk.CTkLabel(
+            self.stats_frame,
+            text="",
+            font=fonts["stats"],
+            text_color=_STATS_FG
+        )
+        self._stats_label.pack(side="right", anchor="e")
+
     def update_data(self, stats: Dict[str, Any]):
         """統計データを更新して表示"""
         try:
-            # 既存のウィジェットをクリア
-            for widget in self.stats_frame.winfo_children():
-                widget.destroy()
-
             # 統計項目のデータ（2項目のみ）
             total_keystrokes = stats.get("total_keystrokes", 0)
             recording_period = stats.get("recording_period", "記録なし")
 
             # 数値のフォーマット処理を安全に行う
             try:
-                if isinstance(total_keystrokes, (int, float)):
+                formatted_total = format(total_keystrokes, ',d') + "回"
+            except (TypeError, ValueError):
+                # 整数以外（12.0など）は整数に変換して表示し、変換できなければそのまま表示
+                try:
                     formatted_total = f"{int(total_keystrokes):,}回"
-                else:
+                except (TypeError, ValueError, OverflowError):
                     formatted_total = str(total_keystrokes)
-            except:
-                formatted_total = str(total_keystrokes)
 
             # コンパクトなヘッダー形式で表示
             stats_text = f"📊 {formatted_total} | 📅 {recording_period}"
-            stats_label = ctk.CTkLabel(
-                self.stats_frame,
-                text=stats_text,
-                font=ctk.CTkFont(size=13, weight="normal"),
-                text_color=("gray30", "gray70")
-            )
-            stats_label.pack(side="right", anchor="e")
+            self._stats_label.configure(text=stats_text, text_color=_STATS_FG)
 
         except Exception as e:
             print(f"基本統計ヘッダーの更新でエラー: {e}")
@@ -71,10 +85,4 @@ class BasicStatsCard(ctk.CTkFrame):
 
     def _show_error_message(self):
         """エラーメッセージを表示"""
-        error_label = ctk.CTkLabel(
-            self.stats_frame,
-            text="統計データエラー",
-            font=ctk.CTkFont(size=11),
-            text_color="red"
-        )
-        error_label.pack(side="right", anchor="e")
+        self._stats_label.configure(text="統計データエラー", text_color="red")
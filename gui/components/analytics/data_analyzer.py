@@ -4,10 +4,213 @@
 keyboard_log.jsonのデータを分析して統計情報を生成する
 """
 
+import csv
+import io
 import json
-from datetime import datetime
+import logging
+import mmap
+import os
+import zlib
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # 任意依存：未インストール時は標準のjsonを使用
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # 任意依存：未インストール時は全体を読み込んで確認
+    ijson = None
+
+try:
+    import xxhash
+except ImportError:  # 任意依存：未インストール時はzlib.crc32を使用
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint(buf) -> int:
+    """ファイル内容のフィンガープリント（内容が同じかの判定用）"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(buf)
+    return zlib.crc32(buf)
+
+
+def _loads(buf) -> Any:
+    """バイト列をJSONとして解析"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(bytes(buf))
+
+
+def _read_json(path: Path) -> Tuple[Any, int]:
+    """JSONファイルをmmap経由で一括解析し、(データ, フィンガープリント) を返す"""
+    with open(path, 'rb') as f:
+        # 空ファイルはmmapできないため、そのまま解析してエラーを揃える
+        if os.fstat(f.fileno()).st_size == 0:
+            return _loads(b""), _fingerprint(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                # 解析とフィンガープリントは同じ内容から求める
+                return _loads(view), _fingerprint(view)
+            finally:
+                view.release()
+
+
+def _file_fingerprint(path: Path) -> int:
+    """JSONを解析せずにファイル内容のフィンガープリントを求める"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _fingerprint(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return _fingerprint(view)
+            finally:
+                view.release()
+
+
+@lru_cache(maxsize=32)
+def _format_record_date(date_str: str) -> str:
+    """記録日 (YYYY-MM-DD) を表示形式 (YYYY/MM/DD) に変換"""
+    # 通常はゼロ埋めされた形式なので、妥当性だけ確認して文字列を置換する
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            date.fromisoformat(date_str)
+            return date_str.replace("-", "/")
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y/%m/%d")
+
+
+# 特殊キーのコード -> キー名
+_SPECIAL_KEYS = {
+    "13": "Enter",
+    "32": "Space",
+    "8": "Backspace",
+    "9": "Tab",
+    "27": "Escape",
+    "16": "Shift",
+    "17": "Ctrl",
+    "18": "Alt"
+}
+
+# 存在しない項目の既定値（読み取り専用の空辞書）
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# 修飾キーの表示順（Ctrl+Shift+Alt+Super）と旧データの別名
+_MOD_ORDER = {"ctrl": 0, "shift": 1, "alt": 2, "super": 3}
+_MOD_ALIAS = {"win": "super"}  # 既存データ互換性のため
+
+
+@lru_cache(maxsize=None)
+def _canonical_modifier(modifier: str) -> str:
+    """修飾キー文字列を表示用に正規化（例: "shift+ctrl" → "Ctrl+Shift"）
+
+    修飾キー文字列の種類は少ないため、分解は文字列ごとに1回だけ行う。
+    """
+    parts = [_MOD_ALIAS.get(p.strip(), p.strip()) for p in modifier.split("+")]
+    parts.sort(key=lambda p: _MOD_ORDER.get(p, len(_MOD_ORDER)))
+    return "+".join(p.title() for p in parts)
+
+
+@lru_cache(maxsize=None)
+def _split_modifier(modifier: str) -> Tuple[str, ...]:
+    """複合修飾キー文字列を分解（文字列ごとに1回だけ行う）"""
+    return tuple(part.strip() for part in modifier.split("+"))
+
+
+# 単独の修飾キー（複合修飾キーの分解が不要なもの）
+_BASIC_MODS = frozenset(("none", "shift", "ctrl", "alt", "super"))
+
+# 修飾キーのビットマスク（winは旧データの表記）
+_SHIFT, _CTRL, _ALT, _SUPER, _WIN = 1, 2, 4, 8, 16
+_MOD_BITS = {"shift": _SHIFT, "ctrl": _CTRL, "alt": _ALT, "super": _SUPER, "win": _WIN}
+# 修飾キー別ランキングの対象（旧データのwinは含めない）
+_RANKING_BITS = (("shift", _SHIFT), ("ctrl", _CTRL), ("alt", _ALT), ("super", _SUPER))
+# 修飾キー自体のキー名 -> ビット（新旧データ互換性のため）
+_MODIFIER_KEY_BITS = {
+    "Left Shift": _SHIFT, "Right Shift": _SHIFT,
+    "Left Ctrl": _CTRL, "Right Ctrl": _CTRL,
+    "Left Alt": _ALT, "Right Alt": _ALT,
+    "Left Super": _SUPER, "Right Super": _SUPER, "Super": _SUPER,
+    "Left Win": _SUPER, "Right Win": _SUPER, "Windows": _SUPER,
+}
+_MOD_MASK_CACHE: Dict[str, int] = {}
+
+
+def _modifier_mask(modifier: str) -> int:
+    """修飾キー文字列をビットマスクに変換（文字列ごとに1回だけ分解）"""
+    mask = _MOD_MASK_CACHE.get(modifier)
+    if mask is None:
+        mask = 0
+        for part in modifier.split("+"):
+            mask |= _MOD_BITS.get(part.strip(), 0)
+        _MOD_MASK_CACHE[modifier] = mask
+    return mask
+
+
+class _ShortcutRow(NamedTuple):
+    """ショートカット1件分の集計（インスタンス辞書を持たない軽量な行）"""
+    combination: str
+    count: int
+    key_name: str
+    modifier: str
+
+
+@dataclass
+class _Aggregates:
+    """key_statisticsを1回走査して得られる集計結果"""
+    # キーごとのコード・名前・総回数（並列リスト、key_statisticsの順序を保持）
+    key_codes: List[str] = field(default_factory=list)
+    key_names: List[str] = field(default_factory=list)
+    key_counts: List[int] = field(default_factory=list)
+    # 修飾キーなしで押されたキーの名前・回数（並列リスト）
+    no_modifier_names: List[str] = field(default_factory=list)
+    no_modifier_counts: List[int] = field(default_factory=list)
+    # 修飾キー別の使用回数
+    modifier_totals: Dict[str, int] = field(
+        default_factory=lambda: {"none": 0, "shift": 0, "ctrl": 0, "alt": 0, "super": 0})
+    # 修飾キー -> {キー名: 回数}
+    modifier_rankings: Dict[str, Counter] = field(
+        default_factory=lambda: {m: Counter() for m in ("shift", "ctrl", "alt", "super")})
+    # 実際に使用されたショートカット（未ソート）
+    shortcuts: List[_ShortcutRow] = field(default_factory=list)
+    # キーコード -> キー名（読み込みごとに1回だけ作成し、各分析で共有する）
+    key_name_by_code: Dict[str, str] = field(default_factory=dict)
+    # キーコード -> 修飾キーなし時のpreceded_by
+    predecessors_index: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # キーコード -> {直後に押されたキー名: 回数}（preceded_byの逆引き）
+    successors_index: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+
+
+def _top_indices(counts: List[int], top_n: int) -> List[int]:
+    """回数の多い順に上位N件のインデックスを返す（同数は元の順序）"""
+    return nlargest(top_n, range(len(counts)), key=counts.__getitem__)
+
+
+def _ranking(names: List[str], counts: List[int], top_n: int) -> List[Dict[str, Any]]:
+    """名前・回数の並列リストから上位N件と全体に対する割合を作成"""
+    total = sum(counts)
+    return [
+        {
+            "key_name": names[i],
+            "count": counts[i],
+            "percentage": (counts[i] / total) * 100 if total > 0 else 0.0
+        }
+        for i in _top_indices(counts, top_n)
+    ]
 
 
 class DataAnalyzer:
@@ -22,24 +225,36 @@ class DataAnalyzer:
         """
         self.data_file_path = Path(data_file_path)
         self._data_cache = None
-        self._cache_timestamp = None
+        # 読み込んだ内容の識別子 (更新時刻, サイズ, フィンガープリント)
+        self._cache_timestamp: Optional[Tuple[float, int, int]] = None
+        # 最後に確認したファイルの (更新時刻, サイズ)
+        self._cache_stat: Optional[Tuple[float, int]] = None
+        # 分析結果のキャッシュ（名前 -> (読み込み時の識別子, 結果)）
+        self._analysis_cache: Dict[str, Tuple[Tuple[float, int, int], Any]] = {}
 
     def _load_data(self) -> Dict[str, Any]:
         """データファイルを読み込み"""
         try:
             # ファイルの更新チェック
             if self.data_file_path.exists():
-                file_mtime = self.data_file_path.stat().st_mtime
-                if self._data_cache is None or self._cache_timestamp != file_mtime:
-                    with open(self.data_file_path, 'r', encoding='utf-8') as f:
-                        self._data_cache = json.load(f)
-                    self._cache_timestamp = file_mtime
+                st = self.data_file_path.stat()
+                file_stat = (st.st_mtime, st.st_size)
+                if self._data_cache is None or self._cache_stat != file_stat:
+                    if (self._data_cache is not None and self._cache_stat[1] == st.st_size
+                            and _file_fingerprint(self.data_file_path) == self._cache_timestamp[2]):
+                        # 更新時刻だけが変わり内容が同じ場合は再解析しない
+                        self._cache_stat = file_stat
+                    else:
+                        self._data_cache, fingerprint = _read_json(self.data_file_path)
+                        self._cache_stat = file_stat
+                        self._cache_timestamp = (st.st_mtime, st.st_size, fingerprint)
+                        self._analysis_cache.clear()
 
                 return self._data_cache
             else:
                 return {"total_statistics": {}, "key_statistics": {}}
         except (json.JSONDecodeError, FileNotFoundError) as e:
-            print(f"データ読み込みエラー: {e}")
+            logger.warning("データ読み込みエラー: %s", e)
             return {"total_statistics": {}, "key_statistics": {}}
 
     def load_data(self) -> Dict[str, Any]:
@@ -57,7 +272,7 @@ class DataAnalyzer:
         try:
             return self._load_data()
         except Exception as e:
-            print(f"データ読み込みでエラーが発生しました: {e}")
+            logger.error("データ読み込みでエラーが発生しました: %s", e)
             # エラーが発生した場合は空のデータ構造を返す
             return {
                 "total_statistics": {},
@@ -65,9 +280,29 @@ class DataAnalyzer:
                 "error": str(e)
             }
 
+    def _cached(self, name: str, compute: Callable[[Dict[str, Any]], Any]) -> Any:
+        """読み込み済みデータに対する分析結果をキャッシュして返す
+
+        キャッシュは読み込んだ内容の識別子に紐付け、再読み込み時にまとめて破棄する。
+        読み込みに失敗した場合（空のデータ構造）はキャッシュしない。
+        """
+        data = self._load_data()
+        if data is not self._data_cache:
+            return compute(data)
+
+        cached = self._analysis_cache.get(name)
+        if cached is not None and cached[0] == self._cache_timestamp:
+            return cached[1]
+
+        result = compute(data)
+        self._analysis_cache[name] = (self._cache_timestamp, result)
+        return result
+
     def calculate_basic_stats(self) -> Dict[str, Any]:
         """基本統計を計算"""
-        data = self._load_data()
+        return self._cached("basic_stats", self._calculate_basic_stats)
+
+    def _calculate_basic_stats(self, data: Dict[str, Any]) -> Dict[str, Any]:
         total_stats = data.get("total_statistics", {})
 
         # デフォルト値
@@ -87,77 +322,111 @@ class DataAnalyzer:
 
         if first_date_str and last_date_str:
             try:
-                start_date = datetime.strptime(first_date_str, "%Y-%m-%d")
-                end_date = datetime.strptime(last_date_str, "%Y-%m-%d")
-
-                basic_stats["recording_period"] = f"{start_date.strftime('%Y/%m/%d')} ～ {end_date.strftime('%Y/%m/%d')}"
+                basic_stats["recording_period"] = (
+                    f"{_format_record_date(first_date_str)} ～ {_format_record_date(last_date_str)}"
+                )
 
             except ValueError as e:
-                print(f"日付解析エラー: {e}")
+                logger.warning("日付解析エラー: %s", e)
 
         return basic_stats
 
-    def analyze_key_frequency(self) -> Dict[str, List[Dict[str, Any]]]:
-        """キー頻度分析を実行"""
-        data = self._load_data()
-        key_stats = data.get("key_statistics", {})
+    def _aggregates(self) -> _Aggregates:
+        """全分析で共有する集計結果を取得（キャッシュ付き）"""
+        return self._cached("aggregates", lambda data: self._compute_all(data.get("key_statistics", {})))
+
+    def _compute_all(self, key_stats: Dict[str, Any]) -> _Aggregates:
+        """key_statisticsを1回だけ走査し、各分析で使う集計をまとめて作成"""
+        agg = _Aggregates()
+        modifier_totals = agg.modifier_totals
+        modifier_rankings = agg.modifier_rankings
+        successors_index = agg.successors_index
+        key_name_by_code = agg.key_name_by_code
+        # 修飾キー文字列ごとの合計（分解は走査後に文字列ごと1回だけ行う）
+        combo_totals: Counter = Counter()
+
+        # ループ内で使うメソッドはローカル変数に束縛しておく
+        _get = dict.get
+        add_code = agg.key_codes.append
+        add_name = agg.key_names.append
+        add_count = agg.key_counts.append
+        add_no_modifier_name = agg.no_modifier_names.append
+        add_no_modifier_count = agg.no_modifier_counts.append
+        add_shortcut = agg.shortcuts.append
+        is_modifier_key_itself = self._is_modifier_key_itself
+        format_shortcut_display = self._format_shortcut_display
 
-        if not key_stats:
-            return {"overall_top5": [], "no_modifier_top5": []}
-
-        # 全体ランキング
-        overall_ranking = []
         for key_code, key_data in key_stats.items():
-            key_name = key_data.get("key_name", f"Key{key_code}")
-            count = key_data.get("count", 0)
-            overall_ranking.append({
-                "key_name": key_name,
-                "count": count,
-                "percentage": 0.0  # 後で計算
-            })
+            key_name = _get(key_data, "key_name")
+            if key_name is None:
+                key_name = f"Key{key_code}"
+                # 修飾キー別ランキングではキーコードから推定した名前を使う
+                ranking_name = self._get_key_name_from_code(key_code)
+            else:
+                ranking_name = key_name
+            key_name_by_code[key_code] = key_name
+            add_code(key_code)
+            add_name(key_name)
+            add_count(_get(key_data, "count", 0))
 
-        overall_ranking.sort(key=lambda x: x["count"], reverse=True)
+            for modifier, mod_data in _get(key_data, "modifier_combinations", _EMPTY).items():
+                count = _get(mod_data, "count", 0)
 
-        # 全体に対する割合を計算
-        total_count = sum(item["count"] for item in overall_ranking)
-        if total_count > 0:
-            for item in overall_ranking:
-                item["percentage"] = (item["count"] / total_count) * 100
+                combo_totals[modifier] += count
 
-        # 修飾キーなしランキング
-        no_modifier_ranking = []
-        for key_code, key_data in key_stats.items():
-            key_name = key_data.get("key_name", f"Key{key_code}")
-            modifier_combos = key_data.get("modifier_combinations", {})
-            none_combo = modifier_combos.get("none", {})
-            count = none_combo.get("count", 0)
+                if modifier == "none":
+                    if count > 0:
+                        add_no_modifier_name(key_name)
+                        add_no_modifier_count(count)
+                    preceded_by = _get(mod_data, "preceded_by", _EMPTY)
+                    if preceded_by:
+                        agg.predecessors_index[key_code] = preceded_by
+                        for pred_code, pred_count in preceded_by.items():
+                            successors_index[pred_code][key_name] += pred_count
+                    continue
 
-            if count > 0:
-                no_modifier_ranking.append({
-                    "key_name": key_name,
-                    "count": count,
-                    "percentage": 0.0
-                })
+                # 修飾キーごとの上位キー（複合修飾キーは各修飾キーに加算）
+                mask = _modifier_mask(modifier)
+                for ranking_modifier, bit in _RANKING_BITS:
+                    if mask & bit:
+                        modifier_rankings[ranking_modifier][ranking_name] += count
+
+                # 実際に使用されたショートカット（修飾キー自体との組み合わせは除外）
+                if count > 0 and not is_modifier_key_itself(key_name, modifier):
+                    add_shortcut(_ShortcutRow(format_shortcut_display(modifier, key_name), count, key_name, modifier))
+
+        # 修飾キー使用回数（複合修飾キーは分解して加算）
+        for modifier, count in combo_totals.items():
+            if modifier in _BASIC_MODS:
+                modifier_totals[modifier] += count
+            elif "+" in modifier:
+                self._add_compound_modifier_counts(modifier, count, modifier_totals)
+
+        return agg
+
+    def analyze_key_frequency(self) -> Dict[str, List[Dict[str, Any]]]:
+        """キー頻度分析を実行"""
+        return self._cached("key_frequency", self._analyze_key_frequency)
 
-        no_modifier_ranking.sort(key=lambda x: x["count"], reverse=True)
+    def _analyze_key_frequency(self, data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        if not data.get("key_statistics", {}):
+            return {"overall_top5": [], "no_modifier_top5": []}
 
-        # 修飾キーなしの割合を計算
-        total_no_modifier = sum(item["count"] for item in no_modifier_ranking)
-        if total_no_modifier > 0:
-            for item in no_modifier_ranking:
-                item["percentage"] = (item["count"] / total_no_modifier) * 100
+        agg = self._aggregates()
 
         return {
-            "overall_top5": overall_ranking[:5],
-            "no_modifier_top5": no_modifier_ranking[:5]
+            # 全体ランキング
+            "overall_top5": _ranking(agg.key_names, agg.key_counts, 5),
+            # 修飾キーなしランキング
+            "no_modifier_top5": _ranking(agg.no_modifier_names, agg.no_modifier_counts, 5)
         }
 
     def analyze_modifier_usage(self) -> Dict[str, Any]:
         """モディファイア使用分析を実行 - ユーザーの実際の使用パターンを忠実に反映"""
-        data = self._load_data()
-        key_stats = data.get("key_statistics", {})
+        return self._cached("modifier_usage", self._analyze_modifier_usage)
 
-        if not key_stats:
+    def _analyze_modifier_usage(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data.get("key_statistics", {}):
             return {
                 "modifier_usage": {"none": 0, "shift": 0, "ctrl": 0, "alt": 0, "super": 0},
                 "usage_ratios": {"none": 100.0, "shift": 0.0, "ctrl": 0.0, "alt": 0.0, "super": 0.0},
@@ -165,23 +434,14 @@ class DataAnalyzer:
                 "top_shortcuts": []
             }
 
-        # モディファイア別の使用回数を集計
-        modifier_counts = {"none": 0, "shift": 0, "ctrl": 0, "alt": 0, "super": 0}
+        agg = self._aggregates()
 
-        # ユーザーが実際に使用したすべての修飾キー組み合わせを抽出
-        shortcuts = self._extract_all_shortcuts(key_stats)
+        # モディファイア別の使用回数
+        modifier_counts = dict(agg.modifier_totals)
 
-        # 基本的な修飾キー使用回数を集計（統計用）
-        for key_code, key_data in key_stats.items():
-            modifier_combos = key_data.get("modifier_combinations", {})
-            for modifier, mod_data in modifier_combos.items():
-                count = mod_data.get("count", 0)
-                # 基本修飾キーの場合のみ統計に加算
-                if modifier in modifier_counts:
-                    modifier_counts[modifier] += count
-                # 複合修飾キー（ctrl+shift等）は適切に分解して加算
-                elif "+" in modifier:
-                    self._add_compound_modifier_counts(modifier, count, modifier_counts)
+        # ユーザーが実際に使用したすべての修飾キー組み合わせ（使用回数順）
+        # 辞書への変換は結果を返す時点で1回だけ行う
+        shortcuts = [row._asdict() for row in sorted(agg.shortcuts, key=itemgetter(1), reverse=True)]
 
         # 使用率を計算
         total = sum(modifier_counts.values())
@@ -205,30 +465,26 @@ class DataAnalyzer:
 
     def create_integrated_sequence_analysis(self) -> List[Dict[str, Any]]:
         """統合シーケンス分析データを作成"""
-        data = self._load_data()
-        key_stats = data.get("key_statistics", {})
+        return self._cached("sequence_analysis", self._create_integrated_sequence_analysis)
 
-        if not key_stats:
+    def _create_integrated_sequence_analysis(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not data.get("key_statistics", {}):
             return []
 
-        # 上位5キーを取得
-        top_keys = []
-        for key_code, key_data in key_stats.items():
-            key_name = key_data.get("key_name", f"Key{key_code}")
-            count = key_data.get("count", 0)
-            top_keys.append((key_code, key_name, count))
+        agg = self._aggregates()
 
-        top_keys.sort(key=lambda x: x[2], reverse=True)
-        top_keys = top_keys[:5]
+        # 上位5キーを取得
+        top_indices = _top_indices(agg.key_counts, 5)
 
         analysis_data = []
 
-        for rank, (key_code, key_name, total_count) in enumerate(top_keys, 1):
+        for rank, i in enumerate(top_indices, 1):
+            key_code, key_name, total_count = agg.key_codes[i], agg.key_names[i], agg.key_counts[i]
             # 直前キー分析（preceded_by）
-            predecessors = self._get_top_predecessors(key_code, key_stats, 3)
+            predecessors = self._get_top_predecessors(key_code, agg, 3)
 
-            # 直後キー分析（このキーが他のキーのpreceded_byに登録されているものを検索）
-            successors = self._get_top_successors(key_code, key_stats, 3)
+            # 直後キー分析（このキーが他のキーのpreceded_byに登録されているもの）
+            successors = self._get_top_successors(key_code, agg, 3)
 
             analysis_data.append({
                 "key_name": key_name,
@@ -242,10 +498,10 @@ class DataAnalyzer:
 
     def analyze_modifier_key_rankings(self) -> Dict[str, List[Dict[str, Any]]]:
         """各修飾キーと組み合わせて使用される上位キーのランキングを分析"""
-        data = self._load_data()
-        key_stats = data.get("key_statistics", {})
+        return self._cached("modifier_key_rankings", self._analyze_modifier_key_rankings)
 
-        if not key_stats:
+    def _analyze_modifier_key_rankings(self, data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        if not data.get("key_statistics", {}):
             return {
                 "shift": [],
                 "ctrl": [],
@@ -253,46 +509,12 @@ class DataAnalyzer:
                 "super": []
             }
 
-        # 各修飾キーごとの上位キーを集計
-        modifier_rankings = {
-            "shift": {},
-            "ctrl": {},
-            "alt": {},
-            "super": {}
-        }
-
-        # 各キーの修飾キー組み合わせを調査
-        for key_code, key_data in key_stats.items():
-            key_name = key_data.get("key_name", self._get_key_name_from_code(key_code))
-            modifier_combos = key_data.get("modifier_combinations", {})
-
-            for modifier, mod_data in modifier_combos.items():
-                count = mod_data.get("count", 0)
-
-                # 基本修飾キーの場合
-                if modifier in modifier_rankings:
-                    if key_name not in modifier_rankings[modifier]:
-                        modifier_rankings[modifier][key_name] = 0
-                    modifier_rankings[modifier][key_name] += count
-
-                # 複合修飾キー（ctrl+shift等）の場合は分解して処理
-                elif "+" in modifier:
-                    parts = [part.strip() for part in modifier.split("+")]
-                    for part in parts:
-                        if part in modifier_rankings:
-                            if key_name not in modifier_rankings[part]:
-                                modifier_rankings[part][key_name] = 0
-                            modifier_rankings[part][key_name] += count
-
         # 各修飾キーのランキングを作成（上位5個）
         result = {}
-        for modifier, key_counts in modifier_rankings.items():
-            # 頻度順でソート
-            sorted_keys = sorted(key_counts.items(), key=lambda x: x[1], reverse=True)
-
-            # 上位5個を取得
+        for modifier, key_counts in self._aggregates().modifier_rankings.items():
+            # 頻度順で上位5個を取得
             top_keys = []
-            for rank, (key_name, count) in enumerate(sorted_keys[:5], 1):
+            for rank, (key_name, count) in enumerate(key_counts.most_common(5), 1):
                 top_keys.append({
                     "rank": rank,
                     "key_name": key_name,
@@ -303,74 +525,31 @@ class DataAnalyzer:
 
         return result
 
-    def _get_top_predecessors(self, target_key_code: str, key_stats: Dict, top_n: int = 3) -> List[Dict[str, Any]]:
+    def _get_top_predecessors(self, target_key_code: str, agg: _Aggregates, top_n: int = 3) -> List[Dict[str, Any]]:
         """指定キーの直前に押されるキーのトップN"""
-        if target_key_code not in key_stats:
-            return []
-
-        key_data = key_stats[target_key_code]
-        modifier_combos = key_data.get("modifier_combinations", {})
-        none_combo = modifier_combos.get("none", {})
-        preceded_by = none_combo.get("preceded_by", {})
-
+        preceded_by = agg.predecessors_index.get(target_key_code)
         if not preceded_by:
             return []
 
-        predecessors = []
-        for pred_code, count in preceded_by.items():
-            pred_name = self._get_key_name_by_code(str(pred_code), key_stats)
-            predecessors.append({
-                "key_name": pred_name,
-                "count": count
-            })
-
-        predecessors.sort(key=lambda x: x["count"], reverse=True)
-        return predecessors[:top_n]
+        # 上位N件だけキー名を解決する（記録のないキーは特殊キー名で補完）
+        names = agg.key_name_by_code
+        return [
+            {"key_name": names.get(pred_code) or _SPECIAL_KEYS.get(pred_code) or f"Key{pred_code}", "count": count}
+            for pred_code, count in nlargest(top_n, preceded_by.items(), key=itemgetter(1))
+        ]
 
-    def _get_top_successors(self, target_key_code: str, key_stats: Dict, top_n: int = 3) -> List[Dict[str, Any]]:
+    def _get_top_successors(self, target_key_code: str, agg: _Aggregates, top_n: int = 3) -> List[Dict[str, Any]]:
         """指定キーの直後に押されるキーのトップN"""
-        successors = {}
+        # preceded_byの逆引きインデックスから取得
+        successors = agg.successors_index.get(target_key_code)
+        if not successors:
+            return []
 
-        # 全キーのpreceded_byを調べて、target_key_codeが含まれているものを探す
-        for key_code, key_data in key_stats.items():
-            key_name = key_data.get("key_name", f"Key{key_code}")
-            modifier_combos = key_data.get("modifier_combinations", {})
-            none_combo = modifier_combos.get("none", {})
-            preceded_by = none_combo.get("preceded_by", {})
-
-            # target_key_codeがpreceded_byに含まれているかチェック
-            if target_key_code in preceded_by:
-                count = preceded_by[target_key_code]
-                successors[key_name] = count
-
-        # 頻度順でソート
-        successor_list = []
-        for key_name, count in successors.items():
-            successor_list.append({
-                "key_name": key_name,
-                "count": count
-            })
-
-        successor_list.sort(key=lambda x: x["count"], reverse=True)
-        return successor_list[:top_n]
-
-    def _get_key_name_by_code(self, key_code: str, key_stats: Dict) -> str:
-        """キーコードからキー名を取得"""
-        if key_code in key_stats:
-            return key_stats[key_code].get("key_name", f"Key{key_code}")
-
-        # 特殊キーのマッピング
-        special_keys = {
-            "13": "Enter",
-            "32": "Space",
-            "8": "Backspace",
-            "9": "Tab",
-            "27": "Escape",
-            "16": "Shift",
-            "17": "Ctrl",
-            "18": "Alt"
-        }
-        return special_keys.get(key_code, f"Key{key_code}")
+        # 頻度順で上位N件
+        return [
+            {"key_name": key_name, "count": count}
+            for key_name, count in successors.most_common(top_n)
+        ]
 
     def export_data(self, format_type: str = "json") -> str:
         """統計データをエクスポート"""
@@ -379,17 +558,39 @@ class DataAnalyzer:
             "key_frequency": self.analyze_key_frequency(),
             "modifier_usage": self.analyze_modifier_usage(),
             "sequence_analysis": self.create_integrated_sequence_analysis(),
-            "export_timestamp": datetime.now().isoformat()
+            "export_timestamp": datetime.now().isoformat(timespec="seconds")
         }
 
         if format_type.lower() == "json":
+            if orjson is not None:
+                return orjson.dumps(
+                    analysis_result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
             return json.dumps(analysis_result, indent=2, ensure_ascii=False)
         elif format_type.lower() == "csv":
-            # CSVフォーマットの実装（簡易版）
-            lines = ["Type,Key,Count,Percentage"]
-            for item in analysis_result["key_frequency"]["overall_top5"]:
-                lines.append(f"Overall,{item['key_name']},{item['count']},{item['percentage']:.1f}")
-            return "\n".join(lines)
+            # キー名にカンマや引用符が含まれてもよいようcsv.writerで出力
+            key_frequency = analysis_result["key_frequency"]
+            modifier_usage = analysis_result["modifier_usage"]
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator="\n")
+            writer.writerow(["Type", "Key", "Count", "Percentage"])
+            writer.writerows(
+                ("Overall", item["key_name"], item["count"], f"{item['percentage']:.1f}")
+                for item in key_frequency["overall_top5"]
+            )
+            writer.writerows(
+                ("NoModifier", item["key_name"], item["count"], f"{item['percentage']:.1f}")
+                for item in key_frequency["no_modifier_top5"]
+            )
+            writer.writerows(
+                ("Modifier", modifier, count, f"{modifier_usage['usage_ratios'].get(modifier, 0.0):.1f}")
+                for modifier, count in modifier_usage["modifier_usage"].items()
+            )
+            writer.writerows(
+                ("Shortcut", item["combination"], item["count"], "")
+                for item in modifier_usage["top_shortcuts"]
+            )
+            return buf.getvalue()
         else:
             raise ValueError(f"Unsupported format: {format_type}")
 
@@ -418,47 +619,30 @@ class DataAnalyzer:
                 count = key_data.get("count", 0)
                 frequency_dict[key_name] = count
 
-            print(f"DataAnalyzer: 生成されたキー頻度データ = {frequency_dict}")
+            logger.debug("DataAnalyzer: 生成されたキー頻度データ = %s", frequency_dict)
             return frequency_dict
 
         except Exception as e:
-            print(f"キー頻度取得エラー: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("キー頻度取得エラー: %s", e)
             return {}
 
     def _get_key_name_from_code(self, key_code: str) -> str:
         """キーコードからキー名を推定"""
-        # 数字のキーコードを文字に変換
         try:
             # 数字コードの場合
             if key_code.isdigit():
+                special_name = _SPECIAL_KEYS.get(key_code)
+                if special_name is not None:
+                    return special_name
                 code = int(key_code)
-                # アルファベット（A=65, Z=90）
-                if 65 <= code <= 90:
-                    return chr(code)
-                # 数字（0=48, 9=57）
-                elif 48 <= code <= 57:
+                # アルファベット（A=65〜Z=90）と数字（0=48〜9=57）は文字に変換
+                if 65 <= code <= 90 or 48 <= code <= 57:
                     return chr(code)
-                # スペース
-                elif code == 32:
-                    return "Space"
-                # Enter
-                elif code == 13:
-                    return "Enter"
-                # Backspace
-                elif code == 8:
-                    return "Backspace"
-                # Tab
-                elif code == 9:
-                    return "Tab"
                 # その他は数字コードをそのまま表示
-                else:
-                    return f"Key{code}"
+                return f"Key{code}"
             # 文字列の場合はそのまま返す
-            else:
-                return key_code
-        except:
+            return key_code
+        except Exception:
             return key_code or "Unknown"
 
     def get_modifier_usage(self) -> Dict[str, Any]:
@@ -466,7 +650,7 @@ class DataAnalyzer:
         try:
             return self.analyze_modifier_usage()
         except Exception as e:
-            print(f"修飾キー使用状況取得エラー: {e}")
+            logger.error("修飾キー使用状況取得エラー: %s", e)
             return {
                 "modifier_usage": {"none": 0, "shift": 0, "ctrl": 0, "alt": 0, "super": 0},
                 "usage_ratios": {"none": 100.0, "shift": 0.0, "ctrl": 0.0, "alt": 0.0, "super": 0.0},
@@ -489,32 +673,26 @@ class DataAnalyzer:
                 }
             return result
         except Exception as e:
-            print(f"統合シーケンス分析取得エラー: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("統合シーケンス分析取得エラー: %s", e)
             return {}
 
     def has_data(self) -> bool:
         """データが存在するかチェック"""
         try:
-            print(f"has_data: ファイルパス確認 {self.data_file_path}")
-            print(f"has_data: ファイル存在 {self.data_file_path.exists()}")
-
             data = self._load_data()
-            print(f"has_data: 読み込んだデータキー {list(data.keys()) if data else 'None'}")
 
             total_stats = data.get("total_statistics", {})
             key_stats = data.get("key_statistics", {})
 
-            print(f"has_data: total_stats存在 {bool(total_stats)}")
-            print(f"has_data: key_stats存在 {bool(key_stats)}")
-
             result = bool(total_stats or key_stats)
-            print(f"has_data: 結果 {result}")
+            logger.debug(
+                "has_data: path=%s total_stats存在=%s key_stats存在=%s 結果=%s",
+                self.data_file_path, bool(total_stats), bool(key_stats), result
+            )
             return result
 
         except Exception as e:
-            print(f"has_data: エラー {e}")
+            logger.error("has_data: エラー %s", e)
             return False
 
     def get_data_file_path(self) -> str:
@@ -537,8 +715,10 @@ class DataAnalyzer:
                 debug_info["file_size"] = self.data_file_path.stat().st_size
 
                 # ファイルを直接読み込んでテスト
-                with open(self.data_file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                if ijson is not None:
+                    debug_info.update(self._scan_data_structure())
+                else:
+                    data, _ = _read_json(self.data_file_path)
                     debug_info["data_keys"] = list(data.keys())
                     debug_info["total_stats_keys"] = list(data.get("total_statistics", {}).keys())
                     debug_info["key_stats_count"] = len(data.get("key_statistics", {}))
@@ -548,158 +728,40 @@ class DataAnalyzer:
 
         return debug_info
 
-    def _extract_all_shortcuts(self, key_stats: Dict) -> List[Dict]:
-        """ユーザーが実際に使用したすべての修飾キー組み合わせを抽出"""
-        shortcuts = []
-
-        for key_code, key_data in key_stats.items():
-            key_name = key_data.get("key_name", f"Key{key_code}")
-            modifier_combos = key_data.get("modifier_combinations", {})
-
-            for modifier, mod_data in modifier_combos.items():
-                if modifier == "none":
-                    continue  # 修飾キーなしはスキップ
+    def _scan_data_structure(self) -> Dict[str, Any]:
+        """ファイル構造をijsonで逐次解析して取得（データ全体を展開しない）"""
+        data_keys: List[str] = []
+        total_stats_keys: List[str] = []
+        key_stats_count = 0
 
-                # 修飾キー自体とその修飾キーの組み合わせはスキップ
-                if self._is_modifier_key_itself(key_name, modifier):
+        with open(self.data_file_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if event != "map_key":
                     continue
+                if prefix == "":
+                    data_keys.append(value)
+                elif prefix == "total_statistics":
+                    total_stats_keys.append(value)
+                elif prefix == "key_statistics":
+                    key_stats_count += 1
 
-                count = mod_data.get("count", 0)
-                if count > 0:  # 1回でも使用されていれば表示
-                    display_combo = self._format_shortcut_display(modifier, key_name)
-                    shortcuts.append({
-                        "combination": display_combo,
-                        "count": count,
-                        "key_name": key_name,
-                        "modifier": modifier
-                    })
-
-        return sorted(shortcuts, key=lambda x: x["count"], reverse=True)
+        return {
+            "data_keys": data_keys,
+            "total_stats_keys": total_stats_keys,
+            "key_stats_count": key_stats_count
+        }
 
     def _is_modifier_key_itself(self, key_name: str, modifier: str) -> bool:
         """修飾キー自体かどうかを判定（Shift+Shift等の重複を避ける）"""
-        modifier_keys = {
-            "shift": ["Left Shift", "Right Shift"],
-            "ctrl": ["Left Ctrl", "Right Ctrl"],
-            "alt": ["Left Alt", "Right Alt"],
-            "super": ["Left Super", "Right Super", "Super", "Left Win", "Right Win", "Windows"]  # 新旧データ互換性のため
-        }
-
-        # シンプルな修飾キーの場合
-        if modifier in modifier_keys:
-            return key_name in modifier_keys[modifier]
-
-        # 複合修飾キーの場合（ctrl+shift等）
-        if "+" in modifier:
-            modifier_parts = modifier.split("+")
-            for part in modifier_parts:
-                if part.strip() in modifier_keys and key_name in modifier_keys[part.strip()]:
-                    return True
-
-        return False
+        key_bit = _MODIFIER_KEY_BITS.get(key_name, 0)
+        return bool(key_bit and key_bit & _modifier_mask(modifier))
 
     def _format_shortcut_display(self, modifier: str, key_name: str) -> str:
         """ショートカットの表示形式を統一（判定フィルタなし）"""
-        # 修飾キー名の正規化
-        modifier_names = {
-            "ctrl": "Ctrl",
-            "shift": "Shift",
-            "alt": "Alt",
-            "super": "Super",
-            "win": "Super",  # 既存データ互換性のため
-            "ctrl+shift": "Ctrl+Shift",
-            "shift+ctrl": "Ctrl+Shift",  # 順序統一
-            "ctrl+alt": "Ctrl+Alt",
-            "alt+ctrl": "Ctrl+Alt",      # 順序統一
-            "shift+alt": "Shift+Alt",
-            "alt+shift": "Shift+Alt",    # 順序統一
-            "ctrl+super": "Ctrl+Super",
-            "super+ctrl": "Ctrl+Super",      # 順序統一
-            "ctrl+win": "Ctrl+Super",        # 既存データ互換性
-            "win+ctrl": "Ctrl+Super",        # 既存データ互換性
-            "shift+super": "Shift+Super",
-            "super+shift": "Shift+Super",    # 順序統一
-            "shift+win": "Shift+Super",      # 既存データ互換性
-            "win+shift": "Shift+Super",      # 既存データ互換性
-            "alt+super": "Alt+Super",
-            "super+alt": "Alt+Super",        # 順序統一
-            "alt+win": "Alt+Super",          # 既存データ互換性
-            "win+alt": "Alt+Super",          # 既存データ互換性
-            "ctrl+shift+alt": "Ctrl+Shift+Alt",
-            "ctrl+alt+shift": "Ctrl+Shift+Alt",  # 順序統一
-            "shift+ctrl+alt": "Ctrl+Shift+Alt",  # 順序統一
-            "shift+alt+ctrl": "Ctrl+Shift+Alt",  # 順序統一
-            "alt+ctrl+shift": "Ctrl+Shift+Alt",  # 順序統一
-            "alt+shift+ctrl": "Ctrl+Shift+Alt",  # 順序統一
-            "ctrl+shift+super": "Ctrl+Shift+Super",
-            "ctrl+super+shift": "Ctrl+Shift+Super",  # 順序統一
-            "shift+ctrl+super": "Ctrl+Shift+Super",  # 順序統一
-            "shift+super+ctrl": "Ctrl+Shift+Super",  # 順序統一
-            "super+ctrl+shift": "Ctrl+Shift+Super",  # 順序統一
-            "super+shift+ctrl": "Ctrl+Shift+Super",  # 順序統一
-            "ctrl+shift+win": "Ctrl+Shift+Super",    # 既存データ互換性
-            "ctrl+win+shift": "Ctrl+Shift+Super",    # 既存データ互換性
-            "shift+ctrl+win": "Ctrl+Shift+Super",    # 既存データ互換性
-            "shift+win+ctrl": "Ctrl+Shift+Super",    # 既存データ互換性
-            "win+ctrl+shift": "Ctrl+Shift+Super",    # 既存データ互換性
-            "win+shift+ctrl": "Ctrl+Shift+Super",    # 既存データ互換性
-            "ctrl+alt+super": "Ctrl+Alt+Super",
-            "ctrl+super+alt": "Ctrl+Alt+Super",      # 順序統一
-            "alt+ctrl+super": "Ctrl+Alt+Super",      # 順序統一
-            "alt+super+ctrl": "Ctrl+Alt+Super",      # 順序統一
-            "super+ctrl+alt": "Ctrl+Alt+Super",      # 順序統一
-            "super+alt+ctrl": "Ctrl+Alt+Super",      # 順序統一
-            "ctrl+alt+win": "Ctrl+Alt+Super",        # 既存データ互換性
-            "ctrl+win+alt": "Ctrl+Alt+Super",        # 既存データ互換性
-            "alt+ctrl+win": "Ctrl+Alt+Super",        # 既存データ互換性
-            "alt+win+ctrl": "Ctrl+Alt+Super",        # 既存データ互換性
-            "win+ctrl+alt": "Ctrl+Alt+Super",        # 既存データ互換性
-            "win+alt+ctrl": "Ctrl+Alt+Super",        # 既存データ互換性
-            "shift+alt+super": "Shift+Alt+Super",
-            "shift+super+alt": "Shift+Alt+Super",    # 順序統一
-            "alt+shift+super": "Shift+Alt+Super",    # 順序統一
-            "alt+super+shift": "Shift+Alt+Super",    # 順序統一
-            "super+shift+alt": "Shift+Alt+Super",    # 順序統一
-            "super+alt+shift": "Shift+Alt+Super",    # 順序統一
-            "shift+alt+win": "Shift+Alt+Super",      # 既存データ互換性
-            "shift+win+alt": "Shift+Alt+Super",      # 既存データ互換性
-            "alt+shift+win": "Shift+Alt+Super",      # 既存データ互換性
-            "alt+win+shift": "Shift+Alt+Super",      # 既存データ互換性
-            "win+shift+alt": "Shift+Alt+Super",      # 既存データ互換性
-            "win+alt+shift": "Shift+Alt+Super",      # 既存データ互換性
-            "ctrl+shift+alt+super": "Ctrl+Shift+Alt+Super",
-            # その他のSuperキー含む4キー組み合わせも順序統一
-            "ctrl+alt+shift+super": "Ctrl+Shift+Alt+Super",
-            "shift+ctrl+alt+super": "Ctrl+Shift+Alt+Super",
-            "shift+alt+ctrl+super": "Ctrl+Shift+Alt+Super",
-            "alt+ctrl+shift+super": "Ctrl+Shift+Alt+Super",
-            "alt+shift+ctrl+super": "Ctrl+Shift+Alt+Super",
-            "super+ctrl+shift+alt": "Ctrl+Shift+Alt+Super",
-            "super+ctrl+alt+shift": "Ctrl+Shift+Alt+Super",
-            "super+shift+ctrl+alt": "Ctrl+Shift+Alt+Super",
-            "super+shift+alt+ctrl": "Ctrl+Shift+Alt+Super",
-            "super+alt+ctrl+shift": "Ctrl+Shift+Alt+Super",
-            "super+alt+shift+ctrl": "Ctrl+Shift+Alt+Super",
-            # Winキー含む4キー組み合わせの既存データ互換性
-            "ctrl+shift+alt+win": "Ctrl+Shift+Alt+Super",
-            "ctrl+alt+shift+win": "Ctrl+Shift+Alt+Super",
-            "shift+ctrl+alt+win": "Ctrl+Shift+Alt+Super",
-            "shift+alt+ctrl+win": "Ctrl+Shift+Alt+Super",
-            "alt+ctrl+shift+win": "Ctrl+Shift+Alt+Super",
-            "alt+shift+ctrl+win": "Ctrl+Shift+Alt+Super",
-            "win+ctrl+shift+alt": "Ctrl+Shift+Alt+Super",
-            "win+ctrl+alt+shift": "Ctrl+Shift+Alt+Super",
-            "win+shift+ctrl+alt": "Ctrl+Shift+Alt+Super",
-            "win+shift+alt+ctrl": "Ctrl+Shift+Alt+Super",
-            "win+alt+ctrl+shift": "Ctrl+Shift+Alt+Super",
-            "win+alt+shift+ctrl": "Ctrl+Shift+Alt+Super"
-        }
-
         # キー名の正規化（表示を見やすくするためのみ）
         key_display = self._normalize_key_name(key_name)
 
-        modifier_display = modifier_names.get(modifier, modifier.title())
-        return f"{modifier_display}+{key_display}"
+        return f"{_canonical_modifier(modifier)}+{key_display}"
 
     def _normalize_key_name(self, key_name: str) -> str:
         """キー名を表示用に正規化（見やすさのためのみ）"""
@@ -734,12 +796,8 @@ class DataAnalyzer:
 
     def _add_compound_modifier_counts(self, modifier: str, count: int, modifier_counts: Dict):
         """複合修飾キー（ctrl+shift等）を適切に分解して統計に加算"""
-        modifiers = modifier.split("+")
-        for mod in modifiers:
-            mod = mod.strip()
+        for mod in _split_modifier(modifier):
             if mod in modifier_counts:
                 modifier_counts[mod] += count
             elif mod == "win":  # 既存データ互換性
                 modifier_counts["super"] += count
-            elif mod == "win":  # 既存データ互換性
-                modifier_counts["super"] += count
@@ -5,16 +5,49 @@
 上位5キーの前後関係を視覚的に表示
 """
 
-from typing import Any, Dict, List, Tuple
+import logging
+from heapq import nlargest
+from typing import Any, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
+from ._card_base import DeferredUpdateCard
+from ._key_format import format_key_name, rank_color, rank_label
+from ._shared import font_set
 
-class IntegratedSequenceCard(ctk.CTkFrame):
+logger = logging.getLogger(__name__)
+
+# カードのフォント（用途名 -> (サイズ, 太さ)）
+_FONT_SPECS = {
+    "title": (16, "bold"),
+    "header": (13, "bold"),
+    "body": (12, "normal"),
+    "small": (10, "normal"),
+    "list_key": (11, "bold"),
+    "list_count": (9, "normal"),
+    "main_rank": (14, "bold"),
+    "main_key": (18, "bold"),
+}
+
+
+def _key_and_count(item: Any) -> Tuple[str, int]:
+    """前後キーの1件を (キー名, 回数) に変換（辞書形式とタプル形式の両方に対応）"""
+    if isinstance(item, dict):
+        return item.get('key_name', ''), item.get('count', 0)
+    return item[0], item[1]
+
+
+class IntegratedSequenceCard(DeferredUpdateCard):
     """統合シーケンス分析を表示するカードコンポーネント"""
 
+    # 表示するキーの最大数
+    MAX_ROWS = 5
+    # この行数までは全行がカードに収まるため、スクロールなしで表示する
+    MAX_UNSCROLLED_ROWS = 5
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        self._fonts = font_set(_FONT_SPECS)
 
         # カードの設定
         self.configure(corner_radius=10, fg_color=("gray95", "gray10"))
@@ -23,7 +56,7 @@ class IntegratedSequenceCard(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text="統合シーケンス分析",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._fonts["title"],
             text_color=("gray10", "gray90")
         )
         self.title_label.pack(pady=(15, 10), padx=15, anchor="w")
@@ -32,7 +65,7 @@ class IntegratedSequenceCard(ctk.CTkFrame):
         self.desc_label = ctk.CTkLabel(
             self,
             text="よく使用されるキーの前後に押されるキーを分析",
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["body"],
             text_color=("gray40", "gray60")
         )
         self.desc_label.pack(pady=(0, 10), padx=15, anchor="w")
@@ -48,13 +81,26 @@ class IntegratedSequenceCard(ctk.CTkFrame):
         # ヘッダーラベル
         self._create_header()
 
-        # スクロール可能なコンテンツフレーム
-        self.scrollable_frame = ctk.CTkScrollableFrame(
-            self.content_frame,
-            height=300,
-            fg_color="transparent"
-        )
-        self.scrollable_frame.pack(fill="both", expand=True)
+        # 行を並べるフレーム（全行が収まらない場合のみスクロール可能にする）
+        if self.MAX_ROWS > self.MAX_UNSCROLLED_ROWS:
+            self.rows_frame = ctk.CTkScrollableFrame(
+                self.content_frame,
+                height=300,
+                fg_color="transparent"
+            )
+        else:
+            self.rows_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self.rows_frame.pack(fill="both", expand=True)
+
+        # 行ウィジェットは更新のたびに作り直さず再利用する
+        self._row_pool: List[Dict[str, Any]] = []
+        self._shown_rows = 0
+        self._no_data_label: Optional[ctk.CTkLabel] = None
+        # 表示状態（"empty" / "populated" / "error"）
+        self._state: Optional[str] = None
+
+        # 前回表示したデータ（同じなら更新を省略）
+        self._last_snapshot: Optional[Tuple] = None
 
     def _create_header(self):
         """ヘッダーの作成"""
@@ -66,7 +112,7 @@ class IntegratedSequenceCard(ctk.CTkFrame):
             header_label = ctk.CTkLabel(
                 self.header_frame,
                 text=header,
-                font=ctk.CTkFont(size=13, weight="bold"),
+                font=self._fonts["header"],
                 text_color=color
             )
             header_label.grid(row=0, column=i, padx=10, pady=10, sticky="ew")
@@ -76,109 +122,141 @@ class IntegratedSequenceCard(ctk.CTkFrame):
             self.header_frame.grid_columnconfigure(i, weight=1)
 
     def update_data(self, sequence_data: Dict[str, Any]):
+        """シーケンス分析データの更新を予約（短時間の連続呼び出しは最後の1回にまとめる）"""
+        self._schedule_update(sequence_data)
+
+    def _do_update_data(self, sequence_data: Dict[str, Any]):
         """シーケンス分析データを更新して表示"""
         try:
-            print(f"IntegratedSequenceCard: 受信データキー数 = {len(sequence_data)}")
-            print(f"IntegratedSequenceCard: データキー = {list(sequence_data.keys())}")
-
-            # 既存のウィジェットをクリア
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
+            logger.debug("IntegratedSequenceCard: 受信データキー数 = %d", len(sequence_data))
 
             if not sequence_data:
-                # データがない場合
-                no_data_label = ctk.CTkLabel(
-                    self.scrollable_frame,
-                    text="データがありません",
-                    font=ctk.CTkFont(size=12),
-                    text_color=("gray50", "gray50")
-                )
-                no_data_label.pack(pady=20)
+                # データがない場合（既に空表示なら何もしない）
+                if self._state != "empty":
+                    for row in self._row_pool:
+                        row["frame"].pack_forget()
+                    self._shown_rows = 0
+                    self._get_no_data_label().pack(pady=20)
+                    self._state = "empty"
                 return
 
-            # 各キーの分析結果を表示
-            for i, (main_key, analysis) in enumerate(sequence_data.items()):
-                if i >= 5:  # 上位5キーまで
-                    break
-
-                self._create_key_analysis_row(main_key, analysis, i)
+            # 表示内容が前回と同じであれば何もしない
+            rows = self._top_items(sequence_data)
+            snapshot = self._snapshot(rows)
+            if self._state == "populated" and snapshot == self._last_snapshot:
+                return
+            self._last_snapshot = snapshot
+
+            if self._no_data_label is not None:
+                self._no_data_label.pack_forget()
+
+            # 各キーの分析結果を表示（上位5キーまで、行ウィジェットは再利用）
+            for i, (main_key, analysis) in enumerate(rows):
+                if i == len(self._row_pool):
+                    self._row_pool.append(self._create_key_analysis_row(i))
+                self._update_key_analysis_row(self._row_pool[i], main_key, analysis)
+
+            # 行数が変わった場合のみ表示行を付け直す
+            if len(rows) != self._shown_rows:
+                for row in self._row_pool:
+                    row["frame"].pack_forget()
+                for row in self._row_pool[:len(rows)]:
+                    row["frame"].pack(fill="x", pady=5, padx=5)
+                self._shown_rows = len(rows)
+            self._state = "populated"
 
         except Exception as e:
-            print(f"IntegratedSequenceCard update_data エラー: {e}")
-            import traceback
-            traceback.print_exc()
+            # 表示が中途半端になった可能性があるため、次回は必ず更新する
+            self._last_snapshot = None
+            logger.exception("IntegratedSequenceCard update_data エラー: %s", e)
+            self._state = "error"
+
+    def _snapshot(self, rows: List[Tuple[str, Dict[str, Any]]]) -> Tuple:
+        """表示に使う値だけを比較用のタプルにまとめる"""
+        return tuple(
+            (
+                main_key,
+                analysis.get('count', 0),
+                tuple(_key_and_count(item) for item in analysis.get('predecessors', [])[:3]),
+                tuple(_key_and_count(item) for item in analysis.get('successors', [])[:3]),
+            )
+            for main_key, analysis in rows
+        )
+
+    def _top_items(self, sequence_data: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """使用回数の多い順に上位キーを取得（同数の場合は受信順）"""
+        return nlargest(
+            self.MAX_ROWS, sequence_data.items(), key=lambda item: item[1].get('count', 0)
+        )
 
-    def _create_key_analysis_row(self, main_key: str, analysis: Dict[str, Any], index: int):
-        """個別キーの分析行を作成"""
+    def _get_no_data_label(self) -> ctk.CTkLabel:
+        """データなし表示用のラベルを取得（初回のみ作成）"""
+        if self._no_data_label is None:
+            self._no_data_label = ctk.CTkLabel(
+                self.rows_frame,
+                text="データがありません",
+                font=self._fonts["body"],
+                text_color=("gray50", "gray50")
+            )
+        return self._no_data_label
+
+    def _create_key_analysis_row(self, index: int) -> Dict[str, Any]:
+        """個別キーの分析行を作成（作成した行は再利用する）"""
         # 行のメインフレーム
         row_frame = ctk.CTkFrame(
-            self.scrollable_frame,
+            self.rows_frame,
             fg_color=("gray90", "gray20") if index % 2 == 0 else ("gray85", "gray25")
         )
-        row_frame.pack(fill="x", pady=5, padx=5)
 
         # 3列のレイアウト
         # 列1: 前任キー
-        predecessors = analysis.get('predecessors', [])
-        pred_frame = self._create_key_list_frame(
-            row_frame,
-            predecessors,
-            "#FF9800",
-            "前任キー"
-        )
-        pred_frame.grid(row=0, column=0, padx=10, pady=15, sticky="nsew")
+        pred = self._create_key_list_frame(row_frame, "#FF9800")
+        pred["frame"].grid(row=0, column=0, padx=10, pady=15, sticky="nsew")
 
         # 列2: メインキー
-        main_frame = self._create_main_key_frame(
-            row_frame,
-            main_key,
-            analysis.get('count', 0),
-            index + 1
-        )
-        main_frame.grid(row=0, column=1, padx=10, pady=15, sticky="nsew")
+        main = self._create_main_key_frame(row_frame, index + 1)
+        main["frame"].grid(row=0, column=1, padx=10, pady=15, sticky="nsew")
 
         # 列3: 後続キー
-        successors = analysis.get('successors', [])
-        succ_frame = self._create_key_list_frame(
-            row_frame,
-            successors,
-            "#4CAF50",
-            "後続キー"
-        )
-        succ_frame.grid(row=0, column=2, padx=10, pady=15, sticky="nsew")
+        succ = self._create_key_list_frame(row_frame, "#4CAF50")
+        succ["frame"].grid(row=0, column=2, padx=10, pady=15, sticky="nsew")
 
         # グリッドの列を均等に配置
         for i in range(3):
             row_frame.grid_columnconfigure(i, weight=1)
 
-    def _create_key_list_frame(self, parent, key_list: List[Tuple[str, int]], color: str, title: str):
-        """キーリストフレームを作成"""
-        frame = ctk.CTkFrame(parent, fg_color="transparent")
+        return {"frame": row_frame, "pred": pred, "main": main, "succ": succ}
 
-        # 上位3キーを表示
-        top_keys = key_list[:3] if key_list else []
+    def _update_key_analysis_row(self, row: Dict[str, Any], main_key: str, analysis: Dict[str, Any]):
+        """既存の分析行の表示内容を更新"""
+        self._update_key_list_frame(row["pred"], analysis.get('predecessors', []))
+        self._update_main_key_frame(row["main"], main_key, analysis.get('count', 0))
+        self._update_key_list_frame(row["succ"], analysis.get('successors', []))
+
+    def _create_key_list_frame(self, parent, color: str) -> Dict[str, Any]:
+        """キーリストフレームを作成（上位3キー分の表示枠を用意）"""
+        frame = ctk.CTkFrame(parent, fg_color="transparent")
 
-        for i, (key, count) in enumerate(top_keys):
+        slots = []
+        for i in range(3):
             # キー表示フレーム
             key_frame = ctk.CTkFrame(frame, fg_color=("gray80", "gray30"))
-            key_frame.pack(fill="x", pady=2)
 
             # 順位表示
-            rank_label = ctk.CTkLabel(
+            rank_widget = ctk.CTkLabel(
                 key_frame,
-                text=f"{i+1}.",
-                font=ctk.CTkFont(size=10),
+                text=rank_label(i + 1),
+                font=self._fonts["small"],
                 text_color=("gray40", "gray60"),
                 width=20
             )
-            rank_label.pack(side="left", padx=(5, 0), pady=5)
+            rank_widget.pack(side="left", padx=(5, 0), pady=5)
 
             # キー名
-            key_display = self._format_key_name(key)
             key_label = ctk.CTkLabel(
                 key_frame,
-                text=key_display,
-                font=ctk.CTkFont(size=11, weight="bold"),
+                text="",
+                font=self._fonts["list_key"],
                 text_color=color
             )
             key_label.pack(side="left", padx=5, pady=5)
@@ -186,43 +264,62 @@ class IntegratedSequenceCard(ctk.CTkFrame):
             # 回数
             count_label = ctk.CTkLabel(
                 key_frame,
-                text=f"({count})",
-                font=ctk.CTkFont(size=9),
+                text="",
+                font=self._fonts["list_count"],
                 text_color=("gray50", "gray50")
             )
             count_label.pack(side="right", padx=(0, 5), pady=5)
 
-        # データがない場合
-        if not top_keys:
-            no_data_label = ctk.CTkLabel(
-                frame,
-                text="データなし",
-                font=ctk.CTkFont(size=10),
-                text_color=("gray50", "gray50")
-            )
-            no_data_label.pack(pady=10)
+            slots.append((key_frame, key_label, count_label))
 
-        return frame
+        # データがない場合の表示
+        no_data_label = ctk.CTkLabel(
+            frame,
+            text="データなし",
+            font=self._fonts["small"],
+            text_color=("gray50", "gray50")
+        )
 
-    def _create_main_key_frame(self, parent, main_key: str, count: int, rank: int):
+        return {"frame": frame, "slots": slots, "no_data": no_data_label, "shown": -1}
+
+    def _update_key_list_frame(self, key_list: Dict[str, Any], items: List[Any]):
+        """キーリストの表示内容を更新"""
+        # 上位3キーを表示
+        top_keys = [_key_and_count(item) for item in items[:3]] if items else []
+
+        for (_, key_label, count_label), (key, count) in zip(key_list["slots"], top_keys):
+            key_label.configure(text=format_key_name(key))
+            count_label.configure(text=f"({count})")
+
+        # 表示件数が変わった場合のみ付け直す
+        if len(top_keys) != key_list["shown"]:
+            key_list["no_data"].pack_forget()
+            for key_frame, _, _ in key_list["slots"]:
+                key_frame.pack_forget()
+            for key_frame, _, _ in key_list["slots"][:len(top_keys)]:
+                key_frame.pack(fill="x", pady=2)
+            if not top_keys:
+                key_list["no_data"].pack(pady=10)
+            key_list["shown"] = len(top_keys)
+
+    def _create_main_key_frame(self, parent, rank: int) -> Dict[str, Any]:
         """メインキーフレームを作成"""
         frame = ctk.CTkFrame(parent, fg_color=("gray75", "gray35"))
 
-        # 順位表示
-        rank_label = ctk.CTkLabel(
+        # 順位表示（行ごとに固定）
+        rank_widget = ctk.CTkLabel(
             frame,
             text=f"#{rank}",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=self._get_rank_color(rank)
+            font=self._fonts["main_rank"],
+            text_color=rank_color(rank)
         )
-        rank_label.pack(pady=(10, 5))
+        rank_widget.pack(pady=(10, 5))
 
         # メインキー名
-        key_display = self._format_key_name(main_key)
         key_label = ctk.CTkLabel(
             frame,
-            text=key_display,
-            font=ctk.CTkFont(size=18, weight="bold"),
+            text="",
+            font=self._fonts["main_key"],
             text_color="#2196F3"
         )
         key_label.pack(pady=5)
@@ -230,62 +327,15 @@ class IntegratedSequenceCard(ctk.CTkFrame):
         # 使用回数
         count_label = ctk.CTkLabel(
             frame,
-            text=f"{count:,} 回",
-            font=ctk.CTkFont(size=12),
+            text="",
+            font=self._fonts["body"],
             text_color=("gray30", "gray70")
         )
         count_label.pack(pady=(0, 10))
 
-        return frame
-
-    def _format_key_name(self, key: str) -> str:
-        """キー名を表示用にフォーマット"""
-        # 特殊キーの表示名マッピング
-        special_keys = {
-            'space': 'Space',
-            'backspace': 'BS',
-            'enter': 'Enter',
-            'shift': 'Shift',
-            'ctrl': 'Ctrl',
-            'alt': 'Alt',
-            'tab': 'Tab',
-            'escape': 'Esc',
-            'delete': 'Del',
-            'insert': 'Ins',
-            'home': 'Home',
-            'end': 'End',
-            'page_up': 'PgUp',
-            'page_down': 'PgDn',
-            'up': '↑',
-            'down': '↓',
-            'left': '←',
-            'right': '→',
-            'caps_lock': 'Caps',
-            'num_lock': 'Num',
-            'scroll_lock': 'Scrl'
-        }
-
-        # 小文字に変換してチェック
-        key_lower = key.lower()
-        if key_lower in special_keys:
-            return special_keys[key_lower]
-
-        # ファンクションキー
-        if key_lower.startswith('f') and key_lower[1:].isdigit():
-            return key.upper()
-
-        # 通常のキー（大文字で表示）
-        return key.upper()
-
-    def _get_rank_color(self, rank: int) -> str:
-        """順位に応じた色を取得"""
-        if rank == 1:
-            return "#FFD700"  # ゴールド
-        elif rank == 2:
-            return "#C0C0C0"  # シルバー
-        elif rank == 3:
-            return "#CD7F32"  # ブロンズ
-        elif rank <= 5:
-            return "#4CAF50"  # グリーン
-        else:
-            return ("gray20", "gray80")  # デフォルト
+        return {"frame": frame, "key": key_label, "count": count_label}
+
+    def _update_main_key_frame(self, main: Dict[str, Any], main_key: str, count: int):
+        """メインキーの表示内容を更新"""
+        main["key"].configure(text=format_key_name(main_key))
+        main["count"].configure(text=f"{count:,} 回")
@@ -4,16 +4,39 @@
 最も頻繁に使用されるキーをランキング形式で表示
 """
 
-from typing import Any, Dict
+import logging
+from heapq import nlargest
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import customtkinter as ctk
 
+from ._card_base import DeferredUpdateCard
+from ._key_format import format_key_name, rank_label
+from ._shared import font_set
 
-class KeyFrequencyCard(ctk.CTkFrame):
+logger = logging.getLogger(__name__)
+
+# カードのフォント（用途名 -> (サイズ, 太さ)）
+_FONT_SPECS = {
+    "title": (14, "bold"),
+    "header": (12, "bold"),
+    "body": (12, "normal"),
+    "row_bold": (11, "bold"),
+    "row": (11, "normal"),
+    "small": (10, "normal"),
+}
+
+
+class KeyFrequencyCard(DeferredUpdateCard):
     """キー頻度を表示するカードコンポーネント"""
 
+    # 表示する上位キーの件数
+    TOP_N = 10
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        self._fonts = font_set(_FONT_SPECS)
 
         # カードの設定
         self.configure(
@@ -27,12 +50,12 @@ class KeyFrequencyCard(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text="上位キー",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._fonts["title"],
             text_color=("gray10", "gray90")
         )
         self.title_label.pack(pady=(12, 8), padx=12, anchor="w")
 
-        # スクロール可能なフレーム
+        # スクロール可能なフレーム（上位10件はカードの高さに収まらないため）
         self.scrollable_frame = ctk.CTkScrollableFrame(
             self,
             height=180,
@@ -44,184 +67,203 @@ class KeyFrequencyCard(ctk.CTkFrame):
         self.content_frame = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
         self.content_frame.pack(fill="both", expand=True)
 
-    def update_data(self, key_frequency: Dict[str, int]):
-        """キー頻度データを更新して表示"""
-        try:
-            print(f"KeyFrequencyCard: 受信データ = {key_frequency}")
-            print(f"KeyFrequencyCard: データキー数 = {len(key_frequency)}")
+        # ランキング表（ウィジェットは最初に作成し、更新時は表示内容だけを変更する）
+        self.table_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self._rows = self._create_table(self.table_frame)
 
-            # 既存のウィジェットをクリア
-            for widget in self.content_frame.winfo_children():
-                widget.destroy()
+        # データなし・エラー表示用のラベル
+        self.message_label = ctk.CTkLabel(
+            self.content_frame,
+            text="",
+            font=self._fonts["body"]
+        )
+
+        # 表示状態（"empty" / "populated" / "error"）
+        self._state: Optional[str] = None
+
+        # 合計未指定時に計算した (辞書, 合計) の組
+        self._total_cache: Optional[Tuple[Dict[str, int], int]] = None
+
+        # 前回表示したデータ（同じなら更新を省略）
+        self._last_snapshot: Optional[Tuple] = None
+
+    def update_data(
+        self,
+        key_frequency: Union[Dict[str, int], List[Tuple[str, int]]],
+        total: Optional[int] = None
+    ):
+        """
+        キー頻度データの更新を予約（短時間の連続呼び出しは最後の1回にまとめる）
+
+        Args:
+            key_frequency: キー名→回数の辞書、または回数の降順に並んだ (キー名, 回数) のリスト
+            total: 使用率計算に使う総キーストローク数（省略時はデータから合計）
+        """
+        self._schedule_update(key_frequency, total)
+
+    def _do_update_data(
+        self,
+        key_frequency: Union[Dict[str, int], List[Tuple[str, int]]],
+        total: Optional[int] = None
+    ):
+        """
+        キー頻度データを更新して表示
+
+        Args:
+            key_frequency: キー名→回数の辞書、または回数の降順に並んだ (キー名, 回数) のリスト
+            total: 使用率計算に使う総キーストローク数（省略時はデータから合計。
+                   同じ辞書を書き換えて渡す場合は必ず指定する）
+        """
+        try:
+            logger.debug("KeyFrequencyCard: データキー数 = %d", len(key_frequency))
 
             if not key_frequency:
-                # データがない場合
-                no_data_label = ctk.CTkLabel(
-                    self.content_frame,
-                    text="データがありません",
-                    font=ctk.CTkFont(size=12),
-                    text_color=("gray50", "gray50")
-                )
-                no_data_label.pack(pady=20)
+                # データがない場合（既に空表示なら何もしない）
+                if self._state != "empty":
+                    self._show_message("データがありません", ("gray50", "gray50"))
+                    self._state = "empty"
+                return
+
+            # 頻度順の上位キーを取得（並べ替え済みのリストはそのまま使用）
+            if isinstance(key_frequency, dict):
+                top_keys = nlargest(self.TOP_N, key_frequency.items(), key=itemgetter(1))
+                if total is None:
+                    total = self._total_of(key_frequency)
+            else:
+                top_keys = key_frequency[:self.TOP_N]
+                if total is None:
+                    total = sum(count for _, count in top_keys)
+
+            logger.debug("KeyFrequencyCard: 上位3キー = %s", top_keys[:3])
+
+            # 表示内容が前回と同じであれば何もしない
+            snapshot = (tuple(top_keys), total)
+            if self._state == "populated" and snapshot == self._last_snapshot:
                 return
+            self._last_snapshot = snapshot
 
-            # 頻度順にソート（上位10位まで表示）
-            sorted_keys = sorted(key_frequency.items(), key=lambda x: x[1], reverse=True)
-            top_keys = sorted_keys[:10]
+            total_keystrokes = total
 
-            print(f"KeyFrequencyCard: ソート後上位10キー = {top_keys}")
+            # 各キーの情報を表示（使わない行は非表示）
+            for row, widgets in enumerate(self._rows):
+                if row >= len(top_keys):
+                    for widget in widgets:
+                        widget.grid_remove()
+                    continue
 
-            # 最大値を取得（プログレスバーの基準用）
-            max_count = top_keys[0][1] if top_keys else 1
-            total_keystrokes = sum(key_frequency.values())
+                _, key_label, count_label, progress_bar, perc_label = widgets
+                key, count = top_keys[row]
+                percentage = (count / total_keystrokes) * 100
+
+                key_label.configure(text=format_key_name(key))
+                count_label.configure(text=f"{count:,}")
+                perc_label.configure(text=f"{percentage:.1f}%")
+                progress_bar.set(percentage / 100)
+                for widget in widgets:
+                    widget.grid()
 
-            # ヘッダー
-            header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-            header_frame.pack(fill="x", pady=(0, 5))
+            if self._state != "populated":
+                self.message_label.pack_forget()
+                self.table_frame.pack(fill="both", expand=True)
+                self._state = "populated"
 
-            ctk.CTkLabel(
-                header_frame,
-                text="順位",
-                font=ctk.CTkFont(size=12, weight="bold"),
+        except Exception as e:
+            # 表示が中途半端になった可能性があるため、次回は必ず更新する
+            self._last_snapshot = None
+            logger.exception("KeyFrequencyCard update_data エラー: %s", e)
+            # エラー時は「エラー」表示
+            self._show_message("データ表示エラー", ("red", "red"))
+            self._state = "error"
+
+    def _total_of(self, key_frequency: Dict[str, int]) -> int:
+        """辞書の回数合計を取得（同じ辞書オブジェクトが続けて渡された場合は前回の値を使う）"""
+        cached = self._total_cache
+        if cached is not None and cached[0] is key_frequency:
+            return cached[1]
+        total = sum(key_frequency.values())
+        # 辞書への参照も保持し、id の再利用で別の辞書と取り違えないようにする
+        self._total_cache = (key_frequency, total)
+        return total
+
+    def _show_message(self, text: str, color: Tuple[str, str]):
+        """ランキング表の代わりにメッセージを表示"""
+        self.table_frame.pack_forget()
+        self.message_label.configure(text=text, text_color=color)
+        self.message_label.pack(pady=20)
+
+    def _create_table(self, parent) -> List[Tuple[Any, ...]]:
+        """ヘッダーと上位キー分の行を持つランキング表を作成"""
+        # ヘッダー
+        header_font = self._fonts["header"]
+        ctk.CTkLabel(
+            parent, text="順位", font=header_font, width=40, anchor="center"
+        ).grid(row=0, column=0, padx=(0, 5), pady=(0, 5))
+        ctk.CTkLabel(
+            parent, text="キー", font=header_font, width=60, anchor="center"
+        ).grid(row=0, column=1, padx=5, pady=(0, 5))
+        ctk.CTkLabel(
+            parent, text="回数", font=header_font, width=60, anchor="center"
+        ).grid(row=0, column=2, padx=5, pady=(0, 5))
+        ctk.CTkLabel(
+            parent, text="頻度", font=header_font, anchor="center"
+        ).grid(row=0, column=3, columnspan=2, padx=(5, 0), pady=(0, 5), sticky="ew")
+
+        rows = []
+        for rank in range(1, self.TOP_N + 1):
+            # 上位3位は太字
+            row_font = self._fonts["row_bold"] if rank <= 3 else self._fonts["row"]
+
+            # 順位
+            rank_widget = ctk.CTkLabel(
+                parent,
+                text=rank_label(rank),
+                font=self._fonts["header"],
                 width=40,
                 anchor="center"
-            ).pack(side="left", padx=(0, 5))
+            )
+            rank_widget.grid(row=rank, column=0, padx=(0, 5), pady=2)
 
-            ctk.CTkLabel(
-                header_frame,
-                text="キー",
-                font=ctk.CTkFont(size=12, weight="bold"),
+            # キー名
+            key_label = ctk.CTkLabel(
+                parent,
+                text="",
+                font=row_font,
                 width=60,
                 anchor="center"
-            ).pack(side="left", padx=5)
+            )
+            key_label.grid(row=rank, column=1, padx=5, pady=2)
 
-            ctk.CTkLabel(
-                header_frame,
-                text="回数",
-                font=ctk.CTkFont(size=12, weight="bold"),
+            # 回数
+            count_label = ctk.CTkLabel(
+                parent,
+                text="",
+                font=row_font,
                 width=60,
                 anchor="center"
-            ).pack(side="left", padx=5)
+            )
+            count_label.grid(row=rank, column=2, padx=5, pady=2)
 
-            ctk.CTkLabel(
-                header_frame,
-                text="頻度",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                anchor="center"
-            ).pack(side="left", fill="x", expand=True, padx=(5, 0))
+            # プログレスバー
+            progress_bar = ctk.CTkProgressBar(
+                parent,
+                width=80,
+                height=8
+            )
+            progress_bar.grid(row=rank, column=3, padx=(10, 5), pady=2, sticky="e")
+
+            # 使用率テキスト
+            perc_label = ctk.CTkLabel(
+                parent,
+                text="",
+                font=self._fonts["small"],
+                text_color=("gray30", "gray70"),
+                anchor="e"
+            )
+            perc_label.grid(row=rank, column=4, padx=(0, 5), pady=2, sticky="e")
 
-            # 各キーの情報を表示
-            for rank, (key, count) in enumerate(top_keys, 1):
-                # キー表示用の文字列を作成
-                display_key = self._format_key_name(key)
-                percentage = (count / total_keystrokes) * 100
+            rows.append((rank_widget, key_label, count_label, progress_bar, perc_label))
 
-                # 行のフレーム
-                row_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-                row_frame.pack(fill="x", pady=2)
-
-                # 順位
-                rank_label = ctk.CTkLabel(
-                    row_frame,
-                    text=f"{rank}.",
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    width=40,
-                    anchor="center"
-                )
-                rank_label.pack(side="left", padx=(0, 5))
-
-                # キー名
-                key_label = ctk.CTkLabel(
-                    row_frame,
-                    text=display_key,
-                    font=ctk.CTkFont(size=11, weight="bold" if rank <= 3 else "normal"),
-                    width=60,
-                    anchor="center"
-                )
-                key_label.pack(side="left", padx=5)
-
-                # 回数
-                count_label = ctk.CTkLabel(
-                    row_frame,
-                    text=f"{count:,}",
-                    font=ctk.CTkFont(size=11, weight="bold" if rank <= 3 else "normal"),
-                    width=60,
-                    anchor="center"
-                )
-                count_label.pack(side="left", padx=5)
-
-                # 使用率とプログレスバー
-                freq_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-                freq_frame.pack(side="left", fill="x", expand=True, padx=(5, 0))
-
-                # 使用率テキスト
-                percentage_text = f"{percentage:.1f}%"
-                perc_label = ctk.CTkLabel(
-                    freq_frame,
-                    text=percentage_text,
-                    font=ctk.CTkFont(size=10),
-                    text_color=("gray30", "gray70"),
-                    anchor="e"
-                )
-                perc_label.pack(side="right", padx=(0, 5))
-
-                # プログレスバー
-                progress_bar = ctk.CTkProgressBar(
-                    freq_frame,
-                    width=80,
-                    height=8
-                )
-                progress_bar.pack(side="right", padx=(5, 10), pady=3)
-                progress_bar.set(percentage / 100)
+        # 頻度列を残りの幅に広げる
+        parent.grid_columnconfigure(3, weight=1)
 
-        except Exception as e:
-            print(f"KeyFrequencyCard update_data エラー: {e}")
-            import traceback
-            traceback.print_exc()
-            # エラー時は「エラー」表示
-            error_label = ctk.CTkLabel(
-                self.content_frame,
-                text="データ表示エラー",
-                font=ctk.CTkFont(size=12),
-                text_color=("red", "red")
-            )
-            error_label.pack(pady=20)
-
-    def _format_key_name(self, key: str) -> str:
-        """キー名を表示用にフォーマット"""
-        # 特殊キーの表示名マッピング
-        special_keys = {
-            'space': 'Space',
-            'backspace': 'BS',
-            'enter': 'Enter',
-            'shift': 'Shift',
-            'ctrl': 'Ctrl',
-            'alt': 'Alt',
-            'tab': 'Tab',
-            'escape': 'Esc',
-            'delete': 'Del',
-            'insert': 'Ins',
-            'home': 'Home',
-            'end': 'End',
-            'page_up': 'PgUp',
-            'page_down': 'PgDn',
-            'up': '↑',
-            'down': '↓',
-            'left': '←',
-            'right': '→',
-            'caps_lock': 'Caps',
-            'num_lock': 'Num',
-            'scroll_lock': 'Scrl'
-        }
-
-        # 小文字に変換してチェック
-        key_lower = key.lower()
-        if key_lower in special_keys:
-            return special_keys[key_lower]
-
-        # ファンクションキー
-        if key_lower.startswith('f') and key_lower[1:].isdigit():
-            return key.upper()
-
-        # 通常のキー（大文字で表示）
-        return key.upper()
\ No newline at end of file
+        return rows
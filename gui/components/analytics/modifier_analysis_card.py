@@ -4,17 +4,51 @@
 Shift、Ctrl、Altなどの修飾キーの使用状況を表示
 """
 
+import logging
 import math
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
-
-class ModifierAnalysisCard(ctk.CTkFrame):
+from ._card_base import DeferredUpdateCard
+from ._key_format import MEDAL_COLORS, rank_color, rank_label
+from ._shared import font_set
+
+logger = logging.getLogger(__name__)
+
+# カードのフォント（用途名 -> (サイズ, 太さ)）
+_FONT_SPECS = {
+    "title": (14, "bold"),
+    "body": (12, "normal"),
+    "section": (11, "bold"),
+    "column": (10, "bold"),
+    "small": (9, "normal"),
+    "rank_bold": (8, "bold"),
+    "rank": (8, "normal"),
+}
+
+# 配色（ライトモード, ダークモード）
+_MUTED_FG = ("gray50", "gray50")
+_RANK_DEFAULT_FG = ("gray30", "gray70")
+
+# ランキングを表示する修飾キー（キー, 表示名, 色）
+_MODIFIER_COLUMNS = (
+    ("shift", "Shift", "#4CAF50"),
+    ("ctrl", "Ctrl", "#2196F3"),
+    ("alt", "Alt", "#FF9800"),
+    ("super", "Super", "#9C27B0")
+)
+
+
+class ModifierAnalysisCard(DeferredUpdateCard):
     """修飾キー使用状況を表示するカードコンポーネント"""
 
+    # 各修飾キーで表示するランキングの件数
+    MAX_RANKS = 5
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        self._fonts = font_set(_FONT_SPECS)
 
         # カードの設定（KeyFrequencyCardと同じサイズと設定）
         self.configure(
@@ -28,7 +62,7 @@ class ModifierAnalysisCard(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text="モディファイア詳細",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._fonts["title"],
             text_color=("gray10", "gray90")
         )
         self.title_label.pack(pady=(12, 8), padx=12, anchor="w")
@@ -37,86 +71,98 @@ class ModifierAnalysisCard(ctk.CTkFrame):
         self.content_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.content_frame.pack(fill="both", expand=True, padx=12, pady=(0, 12))
 
+        # ランキング表示（ウィジェットは最初に作成し、更新時は表示内容だけを変更する）
+        self.rankings_frame = ctk.CTkFrame(self.content_frame, fg_color=("gray85", "gray25"))
+        # ランキングのラベルごとに最後に設定した (フォント, 色)
+        self._cell_styles: Dict[ctk.CTkLabel, Tuple[str, Any]] = {}
+        self._rank_cells = self._create_rankings_grid(self.rankings_frame)
+
+        # データなし・エラー表示用のラベル
+        self.message_label = ctk.CTkLabel(
+            self.content_frame,
+            text="",
+            font=self._fonts["body"]
+        )
+
+        # 表示状態（"empty" / "populated" / "error"）
+        self._state: Optional[str] = None
+
+        # 前回表示したデータ（同じなら更新を省略）
+        self._last_snapshot: Optional[Tuple] = None
+
     def update_data(self, modifier_data: Dict[str, Any]):
+        """修飾キーデータの更新を予約（短時間の連続呼び出しは最後の1回にまとめる）"""
+        self._schedule_update(modifier_data)
+
+    def _do_update_data(self, modifier_data: Dict[str, Any]):
         """修飾キーデータを更新して表示"""
         try:
-            print(f"ModifierAnalysisCard: 受信データ = {modifier_data}")
-
-            # 既存のウィジェットをクリア
-            for widget in self.content_frame.winfo_children():
-                widget.destroy()
+            logger.debug("ModifierAnalysisCard: 受信データキー数 = %d", len(modifier_data))
+
+            modifier_key_rankings = modifier_data.get('modifier_key_rankings', {}) if modifier_data else {}
+            if not modifier_key_rankings:
+                # データがない場合（既に空表示なら何もしない）
+                if self._state != "empty":
+                    self._show_message("データがありません", _MUTED_FG)
+                    self._state = "empty"
+                return
 
-            if not modifier_data:
-                # データがない場合
-                no_data_label = ctk.CTkLabel(
-                    self.content_frame,
-                    text="データがありません",
-                    font=ctk.CTkFont(size=12),
-                    text_color=("gray50", "gray50")
-                )
-                no_data_label.pack(pady=20)
+            # 表示内容が前回と同じであれば何もしない
+            snapshot = self._snapshot(modifier_key_rankings)
+            if self._state == "populated" and snapshot == self._last_snapshot:
                 return
+            self._last_snapshot = snapshot
 
             # 詳細分析を表示
-            self._create_detailed_analysis(modifier_data)
+            self._update_rankings_grid(modifier_key_rankings)
+            if self._state != "populated":
+                self.message_label.pack_forget()
+                self.rankings_frame.pack(fill="both", expand=True)
+                self._state = "populated"
 
         except Exception as e:
-            print(f"ModifierAnalysisCard update_data エラー: {e}")
-            import traceback
-            traceback.print_exc()
+            # 表示が中途半端になった可能性があるため、次回は必ず更新する
+            self._last_snapshot = None
+            logger.exception("ModifierAnalysisCard update_data エラー: %s", e)
             # エラー時は「エラー」表示
-            error_label = ctk.CTkLabel(
-                self.content_frame,
-                text="データ表示エラー",
-                font=ctk.CTkFont(size=12),
-                text_color=("red", "red")
+            self._show_message("データ表示エラー", ("red", "red"))
+            self._state = "error"
+
+    def _show_message(self, text: str, color: Tuple[str, str]):
+        """ランキング表示の代わりにメッセージを表示"""
+        self.rankings_frame.pack_forget()
+        self.message_label.configure(text=text, text_color=color)
+        self.message_label.pack(pady=20)
+
+    def _snapshot(self, rankings: Dict[str, List[Dict[str, Any]]]) -> Tuple:
+        """表示に使うランキングだけを比較用のタプルにまとめる"""
+        return tuple(
+            (
+                modifier_key,
+                tuple(
+                    (r.get("rank", 0), r.get("key_name", "Unknown"), r.get("count", 0))
+                    for r in ranking_list
+                ),
             )
-            error_label.pack(pady=20)
-
-    def _create_detailed_analysis(self, modifier_data: Dict[str, Any]):
-        """詳細分析の作成 - 4列グリッド形式で各修飾キーを横並び表示"""
-        # 各修飾キーごとの上位キーランキングを4列グリッドで表示
-        self._create_modifier_key_rankings_grid(self.content_frame, modifier_data)
-
-    def _create_modifier_key_rankings_grid(self, parent, modifier_data: Dict[str, Any]):
-        """各修飾キーごとの上位キーランキングを4列グリッドで表示"""
-        modifier_key_rankings = modifier_data.get('modifier_key_rankings', {})
-
-        if not modifier_key_rankings:
-            no_data_label = ctk.CTkLabel(
-                parent,
-                text="データがありません",
-                font=ctk.CTkFont(size=12),
-                text_color=("gray50", "gray50")
-            )
-            no_data_label.pack(pady=20)
-            return
-
-        # ランキング表示フレーム
-        rankings_frame = ctk.CTkFrame(parent, fg_color=("gray85", "gray25"))
-        rankings_frame.pack(fill="both", expand=True)
+            for modifier_key, ranking_list in sorted(rankings.items())
+        )
 
+    def _create_rankings_grid(self, parent) -> Dict[str, List[ctk.CTkLabel]]:
+        """各修飾キーの上位キーランキング用の4列グリッドを作成"""
         rankings_title = ctk.CTkLabel(
-            rankings_frame,
+            parent,
             text="各修飾キーでよく使うキー（上位5個）",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=self._fonts["section"],
             text_color=("gray10", "gray90")
         )
         rankings_title.pack(pady=(8, 5), padx=8, anchor="w")
 
         # 4列グリッドを作成
-        grid_frame = ctk.CTkFrame(rankings_frame, fg_color="transparent")
+        grid_frame = ctk.CTkFrame(parent, fg_color="transparent")
         grid_frame.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
-        # 修飾キー情報
-        modifier_info = [
-            ("shift", "Shift", "#4CAF50"),
-            ("ctrl", "Ctrl", "#2196F3"),
-            ("alt", "Alt", "#FF9800"),
-            ("super", "Super", "#9C27B0")
-        ]
-
-        for col, (modifier_key, display_name, color) in enumerate(modifier_info):
+        cells = {}
+        for col, (modifier_key, display_name, color) in enumerate(_MODIFIER_COLUMNS):
             # 各修飾キーのカラムフレーム
             column_frame = ctk.CTkFrame(grid_frame, fg_color=("gray90", "gray20"))
             column_frame.grid(row=0, column=col, padx=3, pady=3, sticky="nsew")
@@ -125,106 +171,77 @@ class ModifierAnalysisCard(ctk.CTkFrame):
             header_label = ctk.CTkLabel(
                 column_frame,
                 text=display_name,
-                font=ctk.CTkFont(size=10, weight="bold"),
+                font=self._fonts["column"],
                 text_color=color
             )
             header_label.pack(pady=(6, 3))
 
-            # そのキーのランキングを表示
-            rankings = modifier_key_rankings.get(modifier_key, [])
-
-            if not rankings:
-                # データがない場合
-                no_data_label = ctk.CTkLabel(
+            # ランキング行（上位5個分）
+            labels = []
+            for _ in range(self.MAX_RANKS):
+                cell = ctk.CTkLabel(
                     column_frame,
-                    text="データなし",
-                    font=ctk.CTkFont(size=9),
-                    text_color=("gray50", "gray50")
+                    text="",
+                    font=self._fonts["rank"],
+                    text_color=_RANK_DEFAULT_FG,
+                    anchor="w"
                 )
-                no_data_label.pack(pady=10)
-            else:
-                # 上位キーを表示
-                for ranking in rankings:
-                    rank = ranking.get("rank", 0)
-                    key_name = ranking.get("key_name", "Unknown")
-                    count = ranking.get("count", 0)
-
-                    # ランキング行
-                    rank_frame = ctk.CTkFrame(column_frame, fg_color="transparent")
-                    rank_frame.pack(fill="x", padx=4, pady=1)
-
-                    # 順位に応じた色
-                    rank_color = self._get_ranking_color(rank)
-
-                    # コンパクトに表示: 順位. キー名 (回数)
-                    if len(key_name) > 8:
-                        display_name = key_name[:7] + "…"
-                    else:
-                        display_name = key_name
-
-                    rank_text = f"{rank}. {display_name}"
-                    if count > 0:
-                        rank_text += f" ({count})"
-
-                    rank_label = ctk.CTkLabel(
-                        rank_frame,
-                        text=rank_text,
-                        font=ctk.CTkFont(size=8, weight="bold" if rank <= 3 else "normal"),
-                        text_color=rank_color,
-                        anchor="w"
-                    )
-                    rank_label.pack(side="left", padx=2)
+                cell.pack(fill="x", padx=6, pady=1)
+                labels.append(cell)
+                self._cell_styles[cell] = ("rank", _RANK_DEFAULT_FG)
+            cells[modifier_key] = labels
 
         # グリッドの列を均等に配置（4列）
         for i in range(4):
             grid_frame.grid_columnconfigure(i, weight=1)
 
-    def _get_ranking_color(self, rank: int) -> str:
-        """ランキング順位に応じた色を取得"""
-        if rank == 1:
-            return "#FFD700"  # ゴールド
-        elif rank == 2:
-            return "#C0C0C0"  # シルバー
-        elif rank == 3:
-            return "#CD7F32"  # ブロンズ
+        return cells
+
+    def _update_rankings_grid(self, modifier_key_rankings: Dict[str, List[Dict[str, Any]]]):
+        """各修飾キーのランキング表示を更新"""
+        for modifier_key, labels in self._rank_cells.items():
+            # そのキーのランキングを表示
+            rankings = modifier_key_rankings.get(modifier_key, [])[:self.MAX_RANKS]
+
+            if not rankings:
+                # データがない場合
+                self._set_cell(labels[0], "データなし", "small", _MUTED_FG)
+                for label in labels[1:]:
+                    label.configure(text="")
+                continue
+
+            for label, ranking in zip(labels, rankings):
+                rank = ranking.get("rank", 0)
+                key_name = ranking.get("key_name", "Unknown")
+                count = ranking.get("count", 0)
+
+                # コンパクトに表示: 順位. キー名 (回数)
+                if len(key_name) > 8:
+                    display_name = key_name[:7] + "…"
+                else:
+                    display_name = key_name
+
+                if count > 0:
+                    rank_text = "%s %s (%d)" % (rank_label(rank), display_name, count)
+                else:
+                    rank_text = "%s %s" % (rank_label(rank), display_name)
+
+                self._set_cell(
+                    label,
+                    rank_text,
+                    "rank_bold" if rank <= 3 else "rank",
+                    rank_color(rank, MEDAL_COLORS, _RANK_DEFAULT_FG)
+                )
+
+            # 使わない行は空にする
+            for label in labels[len(rankings):]:
+                label.configure(text="")
+
+    def _set_cell(self, label: ctk.CTkLabel, text: str, font_key: str, color: Any):
+        """ランキングのラベルを更新（フォントと色は変わった場合のみ設定し直す）"""
+        style = (font_key, color)
+        if self._cell_styles.get(label) == style:
+            label.configure(text=text)
         else:
-            return ("gray30", "gray70")  # デフォルト
-
-    def _format_key_name(self, key: str) -> str:
-        """キー名を表示用にフォーマット"""
-        # 特殊キーの表示名マッピング
-        special_keys = {
-            'space': 'Space',
-            'backspace': 'BS',
-            'enter': 'Enter',
-            'shift': 'Shift',
-            'ctrl': 'Ctrl',
-            'alt': 'Alt',
-            'tab': 'Tab',
-            'escape': 'Esc',
-            'delete': 'Del',
-            'insert': 'Ins',
-            'home': 'Home',
-            'end': 'End',
-            'page_up': 'PgUp',
-            'page_down': 'PgDn',
-            'up': '↑',
-            'down': '↓',
-            'left': '←',
-            'right': '→',
-            'caps_lock': 'Caps',
-            'num_lock': 'Num',
-            'scroll_lock': 'Scrl'
-        }
-
-        # 小文字に変換してチェック
-        key_lower = key.lower()
-        if key_lower in special_keys:
-            return special_keys[key_lower]
-
-        # ファンクションキー
-        if key_lower.startswith('f') and key_lower[1:].isdigit():
-            return key.upper()
-
-        # 通常のキー（大文字で表示）
-        return key.upper()
+            label.configure(text=text, font=self._fonts[font_key], text_color=color)
+            self._cell_styles[label] = style
@@ -5,14 +5,51 @@
 """
 
 import customtkinter as ctk
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple
+from collections import deque
+import queue
 import threading
 import time
 
+from styles.fonts import font
+
+
+class _DashboardStats(NamedTuple):
+    """ダッシュボードに表示する統計（ワーカースレッドで辞書から変換する）"""
+    keystrokes: int
+    elapsed_seconds: int
+    total_keystrokes: int
+    session_count: int
+    most_frequent_key: str
+
+    @classmethod
+    def from_dicts(cls, session_stats: Dict[str, Any],
+                   overall_stats: Dict[str, Any]) -> "_DashboardStats":
+        """セッション統計・全体統計の辞書から表示に使う値だけを取り出す"""
+        return cls(
+            keystrokes=session_stats.get('keystrokes', 0),
+            elapsed_seconds=int(session_stats.get('elapsed_seconds', 0)),
+            total_keystrokes=overall_stats.get('total_keystrokes', 0),
+            session_count=overall_stats.get('session_count', 0),
+            most_frequent_key=overall_stats.get('most_frequent_key', '-'),
+        )
+
 
 class Dashboard(ctk.CTkFrame):
     """メインダッシュボードコンポーネント（WPM機能なし）"""
 
+    # 統計更新の間隔（ミリ秒）
+    UPDATE_INTERVAL_MS = 1000  # 記録中（キー入力がなくても継続時間を進める）
+    DIRTY_CHECK_INTERVAL_MS = 100  # 記録中にキー入力の有無を確認する間隔
+    IDLE_UPDATE_INTERVAL_MS = 5000  # 記録停止中
+    HIDDEN_CHECK_INTERVAL_MS = 10000  # 非表示中（更新せず表示状態のみ確認）
+    ERROR_RETRY_MS = 5000  # エラー時
+    REFRESH_DELAY_MS = 100  # 即時更新を要求してから反映するまで
+    # アクティビティログへの反映間隔（ミリ秒）
+    LOG_DRAIN_INTERVAL_MS = 100
+    # アクティビティログに残す最大行数
+    MAX_LOG_LINES = 500
+
     def __init__(self, parent, keyboard_logger, statistics_analyzer):
         super().__init__(parent)
         
@@ -21,11 +58,38 @@ class Dashboard(ctk.CTkFrame):
         
         # 更新制御
         self.is_updating = True
-        self.update_thread = None
+        self._after_id = None
+        # 前回表示した統計（変化がなければUI更新を省略）
+        self._last_stats = None
+        # 統計の取得はワーカースレッドで行い、最新の結果だけをキューで受け取る
+        self._stats_queue = queue.Queue(maxsize=1)
+        self._stats_request = threading.Event()
+        self._stop_event = threading.Event()
+        self._stats_thread = None
+        # キー入力があったか（記録スレッドから立てられる）
+        self._dirty = False
+        self._last_request_time = 0.0
+        # ラベルごとに最後に設定した文字列
+        self._label_cache: Dict[str, str] = {}
+        # 最後に表示した継続時間（秒）とキーストローク数
+        self._last_elapsed_int = -1
+        self._last_session_keys = -1
+        self._last_total_keys = -1
+        # アクティビティログの未反映メッセージ（どのスレッドからでも追加可能）
+        self._log_queue = deque()
+        self._log_after_id = None
         
+        # キー入力の通知を受け取る（他のコールバックはそのまま残す）
+        self.keyboard_logger.set_callbacks(
+            on_key_event=self.keyboard_logger.on_key_event,
+            on_statistics_update=self._on_statistics_update
+        )
+
         # UI作成
         self.setup_ui()
         self._start_updates()
+        # 再表示されたらすぐに最新の統計を反映
+        self.bind("<Map>", lambda event: self._request_refresh(), add="+")
 
     def setup_ui(self):
         """UI要素の作成"""
@@ -50,7 +114,7 @@ class Dashboard(ctk.CTkFrame):
         title = ctk.CTkLabel(
             self,
             text="📊 キーボードモニター ダッシュボード",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=font(20, "bold")
         )
         title.grid(row=0, column=0, columnspan=2, pady=(20, 10))
 
@@ -71,7 +135,7 @@ class Dashboard(ctk.CTkFrame):
             command=self._toggle_recording,
             width=200,
             height=60,
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=font(18, "bold"),
             corner_radius=15
         )
         self.start_button.grid(row=0, column=1, padx=20, pady=20)
@@ -80,7 +144,7 @@ class Dashboard(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             control_frame,
             text="準備完了 - 記録を開始してください",
-            font=ctk.CTkFont(size=14),
+            font=font(14),
             text_color="gray"
         )
         self.status_label.grid(row=1, column=1, padx=20, pady=(0, 20))
@@ -94,7 +158,7 @@ class Dashboard(ctk.CTkFrame):
         session_title = ctk.CTkLabel(
             session_frame,
             text="📈 セッション統計",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         )
         session_title.pack(pady=(15, 10))
 
@@ -115,7 +179,7 @@ class Dashboard(ctk.CTkFrame):
         total_title = ctk.CTkLabel(
             total_frame,
             text="🏆 全体統計",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         )
         total_title.pack(pady=(15, 10))
 
@@ -129,6 +193,9 @@ class Dashboard(ctk.CTkFrame):
         for label in self.total_stats.values():
             label.pack(pady=5)
 
+        # 統計ラベルをキーから直接引けるようにまとめる
+        self._stat_labels = {**self.session_stats, **self.total_stats}
+
     def _create_activity_log(self):
         """アクティビティログの作成"""
         log_frame = ctk.CTkFrame(self)
@@ -137,7 +204,7 @@ class Dashboard(ctk.CTkFrame):
         log_title = ctk.CTkLabel(
             log_frame,
             text="📋 最近のアクティビティ",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         )
         log_title.pack(pady=(15, 10))
 
@@ -160,8 +227,9 @@ class Dashboard(ctk.CTkFrame):
                 fg_color=["#3B8ED0", "#1F6AA5"],  # デフォルトの青色
                 hover_color=["#36719F", "#144870"]
             )
-            self.status_label.configure(
-                text="記録停止 - セッションをリセットしました",
+            self._set_text(
+                'status', self.status_label,
+                "記録停止 - セッションをリセットしました",
                 text_color="orange"
             )
             self._log_activity("🛑 キーボード記録を停止しました。")
@@ -173,88 +241,210 @@ class Dashboard(ctk.CTkFrame):
                 fg_color=["#DC143C", "#B91C1C"],  # 赤色
                 hover_color=["#B91C1C", "#991B1B"]
             )
-            self.status_label.configure(
-                text="🔴 記録中 - キーストロークを監視しています",
+            self._set_text(
+                'status', self.status_label,
+                "🔴 記録中 - キーストロークを監視しています",
                 text_color="green"
             )
             self._log_activity("🎯 キーボード記録を開始しました。")
 
+        # 記録状態に合わせた間隔ですぐに更新
+        self._request_refresh()
+
     def _start_updates(self):
         """定期的な統計更新を開始"""
         self.is_updating = True
-        self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.update_thread.start()
-
-    def _update_loop(self):
-        """統計データの定期更新ループ"""
-        while self.is_updating:
+        self._stats_request.set()
+        self._stats_thread = threading.Thread(target=self._stats_worker, daemon=True)
+        self._stats_thread.start()
+        self._after_id = self.after(self.REFRESH_DELAY_MS, self._tick)
+        self._log_after_id = self.after(self.LOG_DRAIN_INTERVAL_MS, self._drain_log)
+
+    def _tick(self):
+        """統計データの定期更新（Tkのafterでメインスレッドから呼び出す）"""
+        if not self.is_updating:
+            return
+        if not self.winfo_ismapped():
+            # 非表示中は更新しない
+            self._after_id = self.after(self.HIDDEN_CHECK_INTERVAL_MS, self._tick)
+            return
+
+        # 記録中はキー入力を細かく確認し、停止中は間隔を空けて更新
+        recording = self.keyboard_logger.is_running()
+        if recording:
+            interval = self.DIRTY_CHECK_INTERVAL_MS
+        else:
+            interval = self.IDLE_UPDATE_INTERVAL_MS
+        try:
+            self._update_stats()
+        except Exception as e:
+            print(f"統計更新エラー: {e}")
+            interval = self.ERROR_RETRY_MS
+        finally:
+            # 次回の反映に向けて統計の取得を依頼（記録中は変化があった時だけ）
+            if not recording or self._stats_due():
+                self._stats_request.set()
+            self._after_id = self.after(interval, self._tick)
+
+    def _stats_due(self) -> bool:
+        """記録中に統計を取得し直す必要があるか（キー入力があったか、1秒経過したか）"""
+        now = time.monotonic()
+        if not self._dirty and now - self._last_request_time < self.UPDATE_INTERVAL_MS / 1000:
+            return False
+        self._dirty = False
+        self._last_request_time = now
+        return True
+
+    def _on_statistics_update(self, session_stats: Dict[str, Any]):
+        """キー入力ごとに呼ばれるコールバック（記録スレッドから呼ばれるため印を付けるだけ）"""
+        self._dirty = True
+
+    def _request_refresh(self):
+        """最新の統計を取得させ、取得後すぐに反映する"""
+        self._stats_request.set()
+        self._reschedule(self.REFRESH_DELAY_MS)
+
+    def _reschedule(self, delay_ms: int):
+        """次回の統計更新を指定時間後に予約し直す"""
+        if not self.is_updating:
+            return
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self._after_id = self.after(delay_ms, self._tick)
+
+    def _stats_worker(self):
+        """統計データを取得してキューに渡す（ワーカースレッド）"""
+        while not self._stop_event.is_set():
+            self._stats_request.wait()
+            self._stats_request.clear()
+            if self._stop_event.is_set():
+                break
             try:
-                self._update_stats()
-                time.sleep(1)  # 1秒ごとに更新
+                # セッション統計をKeyboardLoggerから直接取得
+                session_stats = self.keyboard_logger.get_session_statistics()
+
+                # 全体統計をStatisticsAnalyzerから取得
+                overall_stats = self.statistics_analyzer.get_basic_statistics()
+
+                stats = _DashboardStats.from_dicts(session_stats, overall_stats)
             except Exception as e:
-                print(f"統計更新エラー: {e}")
-                time.sleep(5)  # エラー時は5秒待機
+                print(f"統計データ取得エラー: {e}")
+                continue
+
+            # 未反映の古い結果は捨てて最新の結果だけを残す
+            try:
+                self._stats_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._stats_queue.put_nowait(stats)
 
     def _update_stats(self):
-        """統計データの更新"""
+        """ワーカーが取得した最新の統計を反映（取得待ちはしない）"""
         try:
-            # セッション統計をKeyboardLoggerから直接取得
-            session_stats = self.keyboard_logger.get_session_statistics()
-            
-            # 全体統計をStatisticsAnalyzerから取得
-            overall_stats = self.statistics_analyzer.get_basic_statistics()
+            stats = self._stats_queue.get_nowait()
+        except queue.Empty:
+            return
 
-            # UI要素を安全に更新（メインスレッドで実行）
-            self.after(0, self._update_ui_stats, session_stats, overall_stats)
+        # 前回から変化がなければ何もしない
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
 
-        except Exception as e:
-            print(f"統計データ取得エラー: {e}")
+        # メインスレッドから呼ばれるため、そのままUIを更新
+        self._update_ui_stats(stats)
 
-    def _update_ui_stats(self, session_stats: Dict[str, Any], overall_stats: Dict[str, Any]):
+    def _update_ui_stats(self, stats: _DashboardStats):
         """UI統計表示の更新（メインスレッド実行）"""
         try:
-            # セッション統計の更新
-            session_keys = session_stats.get('keystrokes', 0)
-            self.session_stats['keystrokes'].configure(text=f"キーストローク: {session_keys:,}")
+            # 表示する文字列を先にすべて組み立ててから、変化したラベルだけをまとめて更新
+            updates = []
 
-            # 継続時間の表示
-            elapsed_seconds = session_stats.get('elapsed_seconds', 0)
-            hours, remainder = divmod(int(elapsed_seconds), 3600)
-            minutes, seconds = divmod(remainder, 60)
-            duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            self.session_stats['duration'].configure(text=f"継続時間: {duration}")
+            # セッション統計の更新
+            session_keys = stats.keystrokes
+            if session_keys != self._last_session_keys:
+                self._last_session_keys = session_keys
+                updates.append(('keystrokes', f"キーストローク: {session_keys:,}"))
+
+            # 継続時間の表示（秒が変わった時だけ組み立てる）
+            elapsed = stats.elapsed_seconds
+            if elapsed != self._last_elapsed_int:
+                self._last_elapsed_int = elapsed
+                hours, minutes, seconds = elapsed // 3600, (elapsed // 60) % 60, elapsed % 60
+                updates.append(('duration', f"継続時間: {hours:02d}:{minutes:02d}:{seconds:02d}"))
 
             # 効率計算（仮実装）
             efficiency = 85.0  # 仮の値
-            self.session_stats['accuracy'].configure(text=f"効率: {efficiency:.0f}%")
+            updates.append(('accuracy', f"効率: {efficiency:.0f}%"))
 
             # 全体統計の更新
-            total_keys = overall_stats.get('total_keystrokes', 0)
-            self.total_stats['total_keys'].configure(text=f"総キーストローク: {total_keys:,}")
+            total_keys = stats.total_keystrokes
+            if total_keys != self._last_total_keys:
+                self._last_total_keys = total_keys
+                updates.append(('total_keys', f"総キーストローク: {total_keys:,}"))
+
+            updates.append(('sessions', f"セッション数: {stats.session_count}"))
 
-            sessions_count = overall_stats.get('session_count', 0)
-            self.total_stats['sessions'].configure(text=f"セッション数: {sessions_count}")
+            updates.append(('most_used', f"最頻出キー: {stats.most_frequent_key}"))
 
-            most_used = overall_stats.get('most_frequent_key', '-')
-            self.total_stats['most_used'].configure(text=f"最頻出キー: {most_used}")
+            for key, text in updates:
+                self._set_text(key, self._stat_labels[key], text)
 
         except Exception as e:
             print(f"UI統計更新エラー: {e}")
 
+    def _set_text(self, key: str, label: ctk.CTkLabel, text: str, **kwargs):
+        """ラベルの文字列を更新（前回と同じなら何もしない）"""
+        if self._label_cache.get(key) == text:
+            return
+        label.configure(text=text, **kwargs)
+        self._label_cache[key] = text
+
     def _log_activity(self, message: str):
         """アクティビティログにメッセージを追加"""
         timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-
-        def add_to_log():
-            self.activity_log.insert("end", log_entry)
+        # 反映は_drain_logでまとめて行う（deque.appendはスレッドセーフ）
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+
+    def _drain_log(self):
+        """溜まったログメッセージをまとめてテキストボックスに追加"""
+        if not self.is_updating:
+            return
+        if self._log_queue:
+            entries = []
+            while self._log_queue:
+                entries.append(self._log_queue.popleft())
+            self.activity_log.insert("end", "".join(entries))
+            self._trim_log()
             self.activity_log.see("end")
+        self._log_after_id = self.after(self.LOG_DRAIN_INTERVAL_MS, self._drain_log)
 
-        self.after(0, add_to_log)
+    def _trim_log(self):
+        """古いログ行を削除して最大行数に収める"""
+        # 末尾は改行で終わるため、最終行（空行）を除いた行数で判定する
+        last_line = int(self.activity_log.index("end-1c").split(".")[0])
+        excess = last_line - 1 - self.MAX_LOG_LINES
+        if excess > 0:
+            self.activity_log.delete("1.0", f"{excess + 1}.0")
 
     def destroy(self):
         """コンポーネント破棄時のクリーンアップ"""
         self.is_updating = False
-        if self.update_thread and self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
+        # キー入力の通知を解除
+        if self.keyboard_logger.on_statistics_update == self._on_statistics_update:
+            self.keyboard_logger.set_callbacks(
+                on_key_event=self.keyboard_logger.on_key_event,
+                on_statistics_update=None
+            )
+        # 待機中のワーカーを起こして終了を待つ
+        self._stop_event.set()
+        self._stats_request.set()
+        if self._stats_thread is not None:
+            self._stats_thread.join(timeout=1.5)
+            self._stats_thread = None
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        if self._log_after_id is not None:
+            self.after_cancel(self._log_after_id)
+            self._log_after_id = None
         super().destroy()
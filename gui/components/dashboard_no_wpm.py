@@ -10,8 +10,10 @@ from typing import Any, Dict
 
 import customtkinter as ctk
 
+from _ui_thread import UiPostMixin
 
-class Dashboard(ctk.CTkFrame):
+
+class Dashboard(UiPostMixin, ctk.CTkFrame):
     """メインダッシュボードコンポーネント（WPM機能なし）"""
 
     def __init__(self, parent, keyboard_logger, statistics_analyzer):
@@ -20,9 +22,11 @@ class Dashboard(ctk.CTkFrame):
         self.keyboard_logger = keyboard_logger
         self.statistics_analyzer = statistics_analyzer
 
-        # 更新制御
-        self.is_updating = True
+        # 更新制御（停止要求はイベントで通知し、待機中でもすぐに止まれるようにする）
+        self._stop_event = threading.Event()
         self.update_thread = None
+        # 統計更新が連続で失敗した回数
+        self._fail_count = 0
 
         # UI作成
         self.setup_ui()
@@ -182,34 +186,34 @@ class Dashboard(ctk.CTkFrame):
 
     def _start_updates(self):
         """定期的な統計更新を開始"""
-        self.is_updating = True
+        self._stop_event.clear()
         self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
         self.update_thread.start()
 
     def _update_loop(self):
         """統計データの定期更新ループ"""
-        while self.is_updating:
+        while not self._stop_event.is_set():
             try:
                 self._update_stats()
-                time.sleep(1)  # 1秒ごとに更新
+                self._fail_count = 0
+                wait = 1.0  # 1秒ごとに更新
             except Exception as e:
                 print(f"統計更新エラー: {e}")
-                time.sleep(5)  # エラー時は5秒待機
+                # エラー時は0.5秒から倍々に待機（最大2秒）
+                wait = min(2.0, 0.5 * 2 ** self._fail_count)
+                self._fail_count += 1
+            self._stop_event.wait(wait)
 
     def _update_stats(self):
-        """統計データの更新"""
-        try:
-            # セッション統計をKeyboardLoggerから直接取得
-            session_stats = self.keyboard_logger.get_session_statistics()
+        """統計データの更新（取得に失敗した場合の再試行は_update_loopで行う）"""
+        # セッション統計をKeyboardLoggerから直接取得
+        session_stats = self.keyboard_logger.get_session_statistics()
 
-            # 全体統計をStatisticsAnalyzerから取得
-            overall_stats = self.statistics_analyzer.get_basic_statistics()
+        # 全体統計をStatisticsAnalyzerから取得
+        overall_stats = self.statistics_analyzer.get_basic_statistics()
 
-            # UI要素を安全に更新（メインスレッドで実行）
-            self.after(0, self._update_ui_stats, session_stats, overall_stats)
-
-        except Exception as e:
-            print(f"統計データ取得エラー: {e}")
+        # UI要素を安全に更新（メインスレッドで実行）
+        self._post_to_ui(self._update_ui_stats, session_stats, overall_stats)
 
     def _update_ui_stats(self, session_stats: Dict[str, Any], overall_stats: Dict[str, Any]):
         """UI統計表示の更新（メインスレッド実行）"""
@@ -255,7 +259,7 @@ class Dashboard(ctk.CTkFrame):
 
     def destroy(self):
         """コンポーネント破棄時のクリーンアップ"""
-        self.is_updating = False
+        self._stop_event.set()
         if self.update_thread and self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
+            self.update_thread.join(timeout=1.5)
         super().destroy()
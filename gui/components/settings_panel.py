@@ -5,19 +5,115 @@
 """
 
 import customtkinter as ctk
+import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 import tkinter.filedialog as filedialog
 import tkinter.messagebox as messagebox
 
-
-class SettingsPanel(ctk.CTkFrame):
+from _ui_thread import UiPostMixin
+from styles.fonts import font
+
+try:
+    import orjson
+except ImportError:  # 任意依存：未インストール時は標準のjsonを使用
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # 任意依存：未インストール時は全体を読み込んで確認
+    ijson = None
+
+
+# 設定項目の定義（キー, 変数の型, デフォルト値, 選択肢）
+SETTINGS_SCHEMA = [
+    # 一般
+    ("auto_start", ctk.BooleanVar, False, None),
+    ("minimize_to_tray", ctk.BooleanVar, True, None),
+    ("language", ctk.StringVar, "日本語", ["日本語", "English"]),
+    # 記録
+    ("save_interval", ctk.StringVar, "5分", ["1分", "5分", "10分", "30分", "1時間"]),
+    ("auto_backup", ctk.BooleanVar, True, None),
+    ("backup_days", ctk.StringVar, "30日", ["7日", "30日", "90日", "1年", "無制限"]),
+    ("exclude_passwords", ctk.BooleanVar, True, None),
+    # 表示
+    ("appearance", ctk.StringVar, "ダーク", ["ダーク", "ライト", "システム"]),
+    ("show_notifications", ctk.BooleanVar, True, None),
+    ("notify_timing", ctk.StringVar, "重要なイベント", ["すべて", "重要なイベント", "エラーのみ", "なし"]),
+    ("animated_charts", ctk.BooleanVar, True, None),
+    # 高度な設定
+    ("cpu_limit", ctk.StringVar, "標準", ["低", "標準", "高", "無制限"]),
+    ("memory_limit", ctk.StringVar, "512MB", ["256MB", "512MB", "1GB", "2GB", "無制限"]),
+]
+
+# 選択肢を持つ設定項目の選択肢
+SETTING_VALUES = {key: values for key, _, _, values in SETTINGS_SCHEMA if values}
+
+# インポートファイルに必要な項目（DataStoreの検証と同じ）
+_REQUIRED_IMPORT_KEYS = ("total_statistics", "key_statistics")
+
+# 除外アプリケーションのデフォルト値
+DEFAULT_EXCLUDED_APPS = "notepad.exe\ncalc.exe"
+
+def _read_json(path) -> Any:
+    """JSONファイルを読み込む"""
+    with open(path, 'rb') as f:
+        buf = f.read()
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _scan_import_file(path) -> int:
+    """インポートファイルの構造を確認し、キー統計の件数を返す"""
+    if ijson is None:
+        data = _read_json(path)
+        top_keys = set(data) if isinstance(data, dict) else set()
+        key_stats_count = len(data.get("key_statistics") or ()) if top_keys else 0
+    else:
+        # ファイル全体を展開せず、イベントを逐次読み取って確認する
+        top_keys = set()
+        key_stats_count = 0
+        with open(path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if event != "map_key":
+                    continue
+                if prefix == "":
+                    top_keys.add(value)
+                elif prefix == "key_statistics":
+                    key_stats_count += 1
+
+    missing = [key for key in _REQUIRED_IMPORT_KEYS if key not in top_keys]
+    if missing:
+        raise ValueError(f"必要な項目がありません: {', '.join(missing)}")
+    return key_stats_count
+
+
+def _write_json(path, data: Any):
+    """データをJSONファイルに書き出す"""
+    with open(path, 'wb') as f:
+        if orjson is not None:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            f.write(json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+
+
+class SettingsPanel(UiPostMixin, ctk.CTkFrame):
     """設定パネルコンポーネント"""
 
+    # 連続した設定変更の表示更新をまとめる待ち時間（ミリ秒）
+    DIRTY_DELAY_MS = 200
+
     def __init__(self, parent, config, **kwargs):
         super().__init__(parent, **kwargs)
 
         self.config = config
         self.settings_changed = False
+        # 未保存表示の更新予約（連続した変更をまとめる）
+        self._dirty_after_id = None
+        # エクスポート・インポートのファイル処理はワーカースレッドで行う
+        self._io_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings-io")
+        self._io_buttons = []
 
         self._setup_ui()
         self._load_current_settings()
@@ -32,26 +128,60 @@ class SettingsPanel(ctk.CTkFrame):
         header = ctk.CTkLabel(
             self,
             text="⚙️ 設定",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=font(24, "bold")
         )
         header.grid(row=0, column=0, pady=(20, 30), sticky="w")
 
-        # 設定タブビュー
-        self.settings_tabs = ctk.CTkTabview(self)
+        # 設定値の変数（タブの中身より先に用意する）
+        self._create_variables()
+
+        # 設定タブビュー（タブの中身は初めて表示された時に作成）
+        self.settings_tabs = ctk.CTkTabview(self, command=self._on_tab_changed)
         self.settings_tabs.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
 
-        # 各設定タブの作成
-        self._create_general_tab()
-        self._create_recording_tab()
-        self._create_display_tab()
-        self._create_advanced_tab()
+        self._tab_builders = {
+            "一般": self._create_general_tab,
+            "記録": self._create_recording_tab,
+            "表示": self._create_display_tab,
+            "高度な設定": self._create_advanced_tab,
+        }
+        self._built_tabs = set()
+        for name in self._tab_builders:
+            self.settings_tabs.add(name)
+        self._on_tab_changed()
 
         # 保存・リセットボタン
         self._create_action_buttons()
 
-    def _create_general_tab(self):
+    def _create_variables(self):
+        """設定値を保持する変数の作成"""
+        self.vars = {
+            key: var_type(value=default)
+            for key, var_type, default, _ in SETTINGS_SCHEMA
+        }
+        self._excluded_apps_text = DEFAULT_EXCLUDED_APPS
+        self.excluded_apps = None
+
+        # 現在の設定値（変数が書き換えられた時にその値だけを更新する）
+        self._settings_snapshot: Dict[str, Any] = {}
+        for key, var in self.vars.items():
+            self._settings_snapshot[key] = var.get()
+            var.trace_add("write", lambda *_, k=key, v=var: self._on_var_change(k, v))
+
+    def _on_var_change(self, key: str, var):
+        """変数が書き換えられた時に設定値を更新"""
+        self._settings_snapshot[key] = var.get()
+
+    def _on_tab_changed(self):
+        """表示中のタブの中身を初回表示時に作成"""
+        name = self.settings_tabs.get()
+        if name in self._built_tabs:
+            return
+        self._built_tabs.add(name)
+        self._tab_builders[name](self.settings_tabs.tab(name))
+
+    def _create_general_tab(self, tab):
         """一般設定タブの作成"""
-        tab = self.settings_tabs.add("一般")
 
         # 自動起動設定
         startup_frame = ctk.CTkFrame(tab)
@@ -60,23 +190,21 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             startup_frame,
             text="スタートアップ設定",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
-        self.auto_start_var = ctk.BooleanVar()
         auto_start_cb = ctk.CTkCheckBox(
             startup_frame,
             text="Windowsスタートアップ時に自動起動",
-            variable=self.auto_start_var,
+            variable=self.vars["auto_start"],
             command=self._on_setting_changed
         )
         auto_start_cb.pack(anchor="w", padx=15, pady=(0, 15))
 
-        self.minimize_to_tray_var = ctk.BooleanVar()
         minimize_cb = ctk.CTkCheckBox(
             startup_frame,
             text="起動時にシステムトレイに最小化",
-            variable=self.minimize_to_tray_var,
+            variable=self.vars["minimize_to_tray"],
             command=self._on_setting_changed
         )
         minimize_cb.pack(anchor="w", padx=15, pady=(0, 15))
@@ -88,25 +216,23 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             lang_frame,
             text="言語・地域設定",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         lang_container = ctk.CTkFrame(lang_frame, fg_color="transparent")
         lang_container.pack(anchor="w", padx=15, pady=(0, 15))
 
         ctk.CTkLabel(lang_container, text="言語:").pack(side="left")
-        self.language_var = ctk.StringVar(value="日本語")
         lang_menu = ctk.CTkOptionMenu(
             lang_container,
-            variable=self.language_var,
-            values=["日本語", "English"],
+            variable=self.vars["language"],
+            values=SETTING_VALUES["language"],
             command=self._on_setting_changed
         )
         lang_menu.pack(side="left", padx=(10, 0))
 
-    def _create_recording_tab(self):
+    def _create_recording_tab(self, tab):
         """記録設定タブの作成"""
-        tab = self.settings_tabs.add("記録")
 
         # データ保存設定
         save_frame = ctk.CTkFrame(tab)
@@ -115,7 +241,7 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             save_frame,
             text="データ保存設定",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         # 保存間隔
@@ -123,21 +249,19 @@ class SettingsPanel(ctk.CTkFrame):
         interval_container.pack(anchor="w", padx=15, pady=(0, 10))
 
         ctk.CTkLabel(interval_container, text="自動保存間隔:").pack(side="left")
-        self.save_interval_var = ctk.StringVar(value="5分")
         interval_menu = ctk.CTkOptionMenu(
             interval_container,
-            variable=self.save_interval_var,
-            values=["1分", "5分", "10分", "30分", "1時間"],
+            variable=self.vars["save_interval"],
+            values=SETTING_VALUES["save_interval"],
             command=self._on_setting_changed
         )
         interval_menu.pack(side="left", padx=(10, 0))
 
         # バックアップ設定
-        self.auto_backup_var = ctk.BooleanVar()
         backup_cb = ctk.CTkCheckBox(
             save_frame,
             text="自動バックアップを有効化",
-            variable=self.auto_backup_var,
+            variable=self.vars["auto_backup"],
             command=self._on_setting_changed
         )
         backup_cb.pack(anchor="w", padx=15, pady=(0, 10))
@@ -147,11 +271,10 @@ class SettingsPanel(ctk.CTkFrame):
         backup_container.pack(anchor="w", padx=15, pady=(0, 15))
 
         ctk.CTkLabel(backup_container, text="バックアップ保持期間:").pack(side="left")
-        self.backup_days_var = ctk.StringVar(value="30日")
         backup_menu = ctk.CTkOptionMenu(
             backup_container,
-            variable=self.backup_days_var,
-            values=["7日", "30日", "90日", "1年", "無制限"],
+            variable=self.vars["backup_days"],
+            values=SETTING_VALUES["backup_days"],
             command=self._on_setting_changed
         )
         backup_menu.pack(side="left", padx=(10, 0))
@@ -163,14 +286,13 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             exclude_frame,
             text="記録除外設定",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
-        self.exclude_passwords_var = ctk.BooleanVar()
         pwd_cb = ctk.CTkCheckBox(
             exclude_frame,
             text="パスワードフィールドでの記録を除外",
-            variable=self.exclude_passwords_var,
+            variable=self.vars["exclude_passwords"],
             command=self._on_setting_changed
         )
         pwd_cb.pack(anchor="w", padx=15, pady=(0, 10))
@@ -183,11 +305,10 @@ class SettingsPanel(ctk.CTkFrame):
 
         self.excluded_apps = ctk.CTkTextbox(app_container, height=80)
         self.excluded_apps.pack(fill="x", pady=(5, 0))
-        self.excluded_apps.insert("1.0", "notepad.exe\ncalc.exe")
+        self.excluded_apps.insert("1.0", self._excluded_apps_text)
 
-    def _create_display_tab(self):
+    def _create_display_tab(self, tab):
         """表示設定タブの作成"""
-        tab = self.settings_tabs.add("表示")
 
         # テーマ設定
         theme_frame = ctk.CTkFrame(tab)
@@ -196,18 +317,17 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             theme_frame,
             text="テーマ設定",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         theme_container = ctk.CTkFrame(theme_frame, fg_color="transparent")
         theme_container.pack(anchor="w", padx=15, pady=(0, 15))
 
         ctk.CTkLabel(theme_container, text="外観モード:").pack(side="left")
-        self.appearance_var = ctk.StringVar(value="ダーク")
         appearance_menu = ctk.CTkOptionMenu(
             theme_container,
-            variable=self.appearance_var,
-            values=["ダーク", "ライト", "システム"],
+            variable=self.vars["appearance"],
+            values=SETTING_VALUES["appearance"],
             command=self._on_appearance_changed
         )
         appearance_menu.pack(side="left", padx=(10, 0))
@@ -219,14 +339,13 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             notify_frame,
             text="通知設定",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
-        self.show_notifications_var = ctk.BooleanVar()
         notify_cb = ctk.CTkCheckBox(
             notify_frame,
             text="デスクトップ通知を表示",
-            variable=self.show_notifications_var,
+            variable=self.vars["show_notifications"],
             command=self._on_setting_changed
         )
         notify_cb.pack(anchor="w", padx=15, pady=(0, 10))
@@ -236,11 +355,10 @@ class SettingsPanel(ctk.CTkFrame):
         timing_container.pack(anchor="w", padx=15, pady=(0, 15))
 
         ctk.CTkLabel(timing_container, text="通知タイミング:").pack(side="left")
-        self.notify_timing_var = ctk.StringVar(value="重要なイベント")
         timing_menu = ctk.CTkOptionMenu(
             timing_container,
-            variable=self.notify_timing_var,
-            values=["すべて", "重要なイベント", "エラーのみ", "なし"],
+            variable=self.vars["notify_timing"],
+            values=SETTING_VALUES["notify_timing"],
             command=self._on_setting_changed
         )
         timing_menu.pack(side="left", padx=(10, 0))
@@ -252,21 +370,19 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             chart_frame,
             text="グラフ表示設定",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
-        self.animated_charts_var = ctk.BooleanVar()
         animated_cb = ctk.CTkCheckBox(
             chart_frame,
             text="アニメーション効果を有効化",
-            variable=self.animated_charts_var,
+            variable=self.vars["animated_charts"],
             command=self._on_setting_changed
         )
         animated_cb.pack(anchor="w", padx=15, pady=(0, 15))
 
-    def _create_advanced_tab(self):
+    def _create_advanced_tab(self, tab):
         """高度な設定タブの作成"""
-        tab = self.settings_tabs.add("高度な設定")
 
         # パフォーマンス設定
         perf_frame = ctk.CTkFrame(tab)
@@ -275,7 +391,7 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             perf_frame,
             text="パフォーマンス設定",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         # CPU使用率制限
@@ -283,11 +399,10 @@ class SettingsPanel(ctk.CTkFrame):
         cpu_container.pack(anchor="w", padx=15, pady=(0, 10))
 
         ctk.CTkLabel(cpu_container, text="CPU使用率制限:").pack(side="left")
-        self.cpu_limit_var = ctk.StringVar(value="標準")
         cpu_menu = ctk.CTkOptionMenu(
             cpu_container,
-            variable=self.cpu_limit_var,
-            values=["低", "標準", "高", "無制限"],
+            variable=self.vars["cpu_limit"],
+            values=SETTING_VALUES["cpu_limit"],
             command=self._on_setting_changed
         )
         cpu_menu.pack(side="left", padx=(10, 0))
@@ -297,11 +412,10 @@ class SettingsPanel(ctk.CTkFrame):
         mem_container.pack(anchor="w", padx=15, pady=(0, 15))
 
         ctk.CTkLabel(mem_container, text="メモリ使用量制限:").pack(side="left")
-        self.memory_limit_var = ctk.StringVar(value="512MB")
         mem_menu = ctk.CTkOptionMenu(
             mem_container,
-            variable=self.memory_limit_var,
-            values=["256MB", "512MB", "1GB", "2GB", "無制限"],
+            variable=self.vars["memory_limit"],
+            values=SETTING_VALUES["memory_limit"],
             command=self._on_setting_changed
         )
         mem_menu.pack(side="left", padx=(10, 0))
@@ -313,7 +427,7 @@ class SettingsPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             data_frame,
             text="データ管理",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         # データエクスポート
@@ -327,6 +441,7 @@ class SettingsPanel(ctk.CTkFrame):
             width=150
         )
         export_btn.pack(side="left")
+        self._io_buttons.append(export_btn)
 
         # データインポート
         import_btn = ctk.CTkButton(
@@ -336,6 +451,7 @@ class SettingsPanel(ctk.CTkFrame):
             width=150
         )
         import_btn.pack(side="left", padx=(10, 0))
+        self._io_buttons.append(import_btn)
 
         # データクリア
         clear_container = ctk.CTkFrame(data_frame, fg_color="transparent")
@@ -360,7 +476,7 @@ class SettingsPanel(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             button_frame,
             text="",
-            font=ctk.CTkFont(size=12)
+            font=font(12)
         )
         self.status_label.pack(side="left", padx=15, pady=10)
 
@@ -394,11 +510,23 @@ class SettingsPanel(ctk.CTkFrame):
             print(f"設定読み込みエラー: {e}")
 
     def _on_setting_changed(self, *args):
-        """設定変更時のコールバック"""
+        """設定変更時のコールバック（表示の更新は少し待ってまとめて行う）"""
         self.settings_changed = True
+        self._cancel_dirty_state()
+        self._dirty_after_id = self.after(self.DIRTY_DELAY_MS, self._apply_dirty_state)
+
+    def _apply_dirty_state(self):
+        """未保存の変更があることを表示"""
+        self._dirty_after_id = None
         self.status_label.configure(text="⚠️ 未保存の変更があります")
         self.save_btn.configure(fg_color="orange")
 
+    def _cancel_dirty_state(self):
+        """予約済みの未保存表示を取り消す"""
+        if self._dirty_after_id is not None:
+            self.after_cancel(self._dirty_after_id)
+            self._dirty_after_id = None
+
     def _on_appearance_changed(self, value):
         """外観モード変更時のコールバック"""
         appearance_map = {
@@ -417,6 +545,7 @@ class SettingsPanel(ctk.CTkFrame):
             # self.config.save(settings_data)
 
             self.settings_changed = False
+            self._cancel_dirty_state()
             self.status_label.configure(text="✅ 設定が保存されました")
             self.save_btn.configure(fg_color=["#3B8ED0", "#1F6AA5"])
 
@@ -436,41 +565,25 @@ class SettingsPanel(ctk.CTkFrame):
 
     def _collect_settings(self) -> Dict[str, Any]:
         """現在のUI状態から設定データを収集"""
-        return {
-            'auto_start': self.auto_start_var.get(),
-            'minimize_to_tray': self.minimize_to_tray_var.get(),
-            'language': self.language_var.get(),
-            'save_interval': self.save_interval_var.get(),
-            'auto_backup': self.auto_backup_var.get(),
-            'backup_days': self.backup_days_var.get(),
-            'exclude_passwords': self.exclude_passwords_var.get(),
-            'excluded_apps': self.excluded_apps.get("1.0", "end-1c"),
-            'appearance': self.appearance_var.get(),
-            'show_notifications': self.show_notifications_var.get(),
-            'notify_timing': self.notify_timing_var.get(),
-            'animated_charts': self.animated_charts_var.get(),
-            'cpu_limit': self.cpu_limit_var.get(),
-            'memory_limit': self.memory_limit_var.get()
-        }
+        settings = dict(self._settings_snapshot)
+        # テキストボックスは変数を持たないため、ここで読み取る
+        settings['excluded_apps'] = self._get_excluded_apps()
+        return settings
+
+    def _get_excluded_apps(self) -> str:
+        """除外アプリケーションの一覧を取得（タブ未作成なら保持している値）"""
+        if self.excluded_apps is None:
+            return self._excluded_apps_text
+        return self.excluded_apps.get("1.0", "end-1c")
 
     def _load_default_settings(self):
         """デフォルト設定値を読み込み"""
-        # デフォルト値の設定
-        self.auto_start_var.set(False)
-        self.minimize_to_tray_var.set(True)
-        self.language_var.set("日本語")
-        self.save_interval_var.set("5分")
-        self.auto_backup_var.set(True)
-        self.backup_days_var.set("30日")
-        self.exclude_passwords_var.set(True)
-        self.excluded_apps.delete("1.0", "end")
-        self.excluded_apps.insert("1.0", "notepad.exe\ncalc.exe")
-        self.appearance_var.set("ダーク")
-        self.show_notifications_var.set(True)
-        self.notify_timing_var.set("重要なイベント")
-        self.animated_charts_var.set(True)
-        self.cpu_limit_var.set("標準")
-        self.memory_limit_var.set("512MB")
+        for key, _, default, _ in SETTINGS_SCHEMA:
+            self.vars[key].set(default)
+        self._excluded_apps_text = DEFAULT_EXCLUDED_APPS
+        if self.excluded_apps is not None:
+            self.excluded_apps.delete("1.0", "end")
+            self.excluded_apps.insert("1.0", self._excluded_apps_text)
 
     def _export_data(self):
         """データエクスポート"""
@@ -480,11 +593,20 @@ class SettingsPanel(ctk.CTkFrame):
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if filename:
-            try:
-                # 実際のエクスポート処理を実装
-                messagebox.showinfo("完了", f"データを {filename} にエクスポートしました。")
-            except Exception as e:
-                messagebox.showerror("エラー", f"エクスポートに失敗しました: {e}")
+            self._set_io_busy(True)
+            self._io_exec.submit(self._do_export, filename)
+
+    def _do_export(self, filename: str):
+        """記録データをエクスポートファイルに書き出す（ワーカースレッドで実行）"""
+        try:
+            data = _read_json(self.config.get_data_file_path())
+            _write_json(filename, data)
+        except Exception as e:
+            self._post_io_result(messagebox.showerror,
+                                 "エラー", f"エクスポートに失敗しました: {e}")
+        else:
+            self._post_io_result(messagebox.showinfo,
+                                 "完了", f"データを {filename} にエクスポートしました。")
 
     def _import_data(self):
         """データインポート"""
@@ -493,11 +615,35 @@ class SettingsPanel(ctk.CTkFrame):
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if filename:
-            try:
-                # 実際のインポート処理を実装
-                messagebox.showinfo("完了", f"{filename} からデータをインポートしました。")
-            except Exception as e:
-                messagebox.showerror("エラー", f"インポートに失敗しました: {e}")
+            self._set_io_busy(True)
+            self._io_exec.submit(self._do_import, filename)
+
+    def _do_import(self, filename: str):
+        """インポートファイルを読み込む（ワーカースレッドで実行）"""
+        try:
+            _scan_import_file(filename)
+            # 実際のインポート処理を実装
+        except Exception as e:
+            self._post_io_result(messagebox.showerror,
+                                 "エラー", f"インポートに失敗しました: {e}")
+        else:
+            self._post_io_result(messagebox.showinfo,
+                                 "完了", f"{filename} からデータをインポートしました。")
+
+    def _set_io_busy(self, busy: bool):
+        """ファイル処理中はエクスポート・インポートボタンを無効化"""
+        state = "disabled" if busy else "normal"
+        for button in self._io_buttons:
+            button.configure(state=state)
+
+    def _post_io_result(self, show_message, title: str, message: str):
+        """ファイル処理の結果をメインスレッドに渡す（ワーカースレッドから呼ぶ）"""
+        self._post_to_ui(self._finish_io, show_message, title, message)
+
+    def _finish_io(self, show_message, title: str, message: str):
+        """ファイル処理の完了をメインスレッドで通知"""
+        self._set_io_busy(False)
+        show_message(title, message)
 
     def _clear_all_data(self):
         """すべてのデータをクリア"""
@@ -510,3 +656,9 @@ class SettingsPanel(ctk.CTkFrame):
                 messagebox.showinfo("完了", "すべてのデータをクリアしました。")
             except Exception as e:
                 messagebox.showerror("エラー", f"データクリアに失敗しました: {e}")
+
+    def destroy(self):
+        """コンポーネント破棄時のクリーンアップ"""
+        self._cancel_dirty_state()
+        self._io_exec.shutdown(wait=False)
+        super().destroy()
@@ -23,24 +23,25 @@ except ImportError as e:
     print("pip install -r requirements-gui.txt")
     sys.exit(1)
 
-from statistics import StatisticsAnalyzer
-
-from components.analytics.analytics_page import AnalyticsPage
 # GUIコンポーネントのインポート
+# （統合分析・設定ページは初めて表示する時に読み込む）
 from components.dashboard import Dashboard
-from components.settings_panel import SettingsPanel
 from styles.themes import ThemeManager
 
 # 既存のバックエンドモジュールをインポート
-from config import get_config
-from data_store import DataStore
-from logger import KeyboardLogger
+from _bootstrap import backend
 from save_manager import SaveManager
 
+# タスクバーアイコンのハンドル（Windowsのみ、プロセス内で使い回す）
+_ICON_HANDLE = None
+
 
 class KeyboardMonitorGUI:
     """キーボードモニター GUI メインクラス"""
 
+    # AppUserModelIDはプロセス単位の設定のため、1回だけ行う
+    _app_id_set = False
+
     def __init__(self):
         """GUIアプリケーションの初期化"""
         # アプリケーションユーザーモデルIDを設定（タスクバー識別用）
@@ -76,25 +77,20 @@ class KeyboardMonitorGUI:
             # self.root.iconbitmap("gui/styles/icons/app_icon.ico")
 
         # バックエンドコンポーネントの初期化
-        self.config = get_config()
-        self.data_store = DataStore(str(self.config.get_data_file_path()))
-        self.keyboard_logger = KeyboardLogger(self.data_store)
+        self.config, self.data_store, self.keyboard_logger, self.statistics_analyzer = backend()
         self.save_manager = SaveManager(self.config, self.data_store)
-        self.statistics_analyzer = StatisticsAnalyzer(self.data_store)
 
         # テーマ管理
         self.theme_manager = ThemeManager()
 
+        # 現在のページと作成済みのページ（再表示時は作り直さない）
+        self.current_page = None
+        self._pages = {}
+
         # GUI初期化
         self._setup_ui()
         self._setup_bindings()
 
-        # 現在のページ
-        self.current_page = None
-
-        # アプリケーションユーザーモデルIDの設定
-        self._set_app_user_model_id()
-
     def _setup_ui(self):
         """UI要素のセットアップ"""
         # メインフレームの構成
@@ -121,6 +117,8 @@ class KeyboardMonitorGUI:
 
         # ナビゲーションボタン
         self.nav_buttons = {}
+        # ハイライト中のボタン名
+        self._active_nav = None
 
         # ダッシュボード
         dashboard_btn = ctk.CTkButton(
@@ -194,55 +192,73 @@ class KeyboardMonitorGUI:
 
     def show_dashboard(self):
         """ダッシュボード画面の表示"""
-        self._clear_main_content()
-        self.current_page = Dashboard(
+        self._show_page('dashboard', lambda: Dashboard(
             self.main_frame,
             self.keyboard_logger,
             self.statistics_analyzer
-        )
-        self.current_page.pack(fill="both", expand=True)
+        ))
         self._highlight_nav_button('dashboard')
         self.update_status("ダッシュボード表示中")
 
     def show_statistics(self):
         """統計・分析画面の表示"""
-        self._clear_main_content()
+        from components.analytics.analytics_page import AnalyticsPage
 
         # データファイルパスを取得
         data_file_path = self.data_store.data_file
 
-        # 統合分析ページを作成
-        self.current_page = AnalyticsPage(
+        # 作成済みのページは、データファイルが更新されていれば再読み込みする
+        page = self._pages.get('statistics')
+        if page is not None:
+            page.refresh_if_needed()
+
+        # 統合分析ページを作成（初回のみ）
+        self._show_page('statistics', lambda: AnalyticsPage(
             self.main_frame,
             data_file_path=str(data_file_path)
-        )
-        self.current_page.pack(fill="both", expand=True)
+        ))
         self._highlight_nav_button('statistics')
         self.update_status("統合分析ページ表示中")
 
     def show_settings(self):
         """設定画面の表示"""
-        self._clear_main_content()
-        self.current_page = SettingsPanel(
+        from components.settings_panel import SettingsPanel
+
+        self._show_page('settings', lambda: SettingsPanel(
             self.main_frame,
             self.config
-        )
-        self.current_page.pack(fill="both", expand=True)
+        ))
         self._highlight_nav_button('settings')
         self.update_status("設定画面表示中")
 
-    def _clear_main_content(self):
-        """メインコンテンツエリアのクリア"""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+    def _show_page(self, name, create_page):
+        """ページを表示（初回のみ作成し、以降は作成済みのページを再表示）"""
+        page = self._pages.get(name)
+        if page is None:
+            page = self._pages[name] = create_page()
+        if page is self.current_page:
+            return
+        self._hide_current()
+        page.pack(fill="both", expand=True)
+        self.current_page = page
+
+    def _hide_current(self):
+        """表示中のページを隠す（破棄はしない）"""
+        if self.current_page is not None:
+            self.current_page.pack_forget()
 
     def _highlight_nav_button(self, active_button):
-        """ナビゲーションボタンのハイライト"""
-        for name, button in self.nav_buttons.items():
-            if name == active_button:
-                button.configure(fg_color=("gray75", "gray25"))
-            else:
+        """ナビゲーションボタンのハイライト（状態が変わるボタンだけを更新）"""
+        if active_button == self._active_nav:
+            return
+        if self._active_nav is None:
+            # 初回はすべてのボタンを非選択の色にそろえる
+            for button in self.nav_buttons.values():
                 button.configure(fg_color=("gray90", "gray20"))
+        else:
+            self.nav_buttons[self._active_nav].configure(fg_color=("gray90", "gray20"))
+        self.nav_buttons[active_button].configure(fg_color=("gray75", "gray25"))
+        self._active_nav = active_button
 
     def update_status(self, message):
         """ステータスバーの更新"""
@@ -265,51 +281,64 @@ class KeyboardMonitorGUI:
 
             # ウィンドウを閉じる
             self.root.destroy()
+            _release_taskbar_icon()
 
     def _set_taskbar_icon(self, icon_path):
         """Windows固有のタスクバーアイコン設定"""
+        global _ICON_HANDLE
+        if sys.platform != "win32":
+            return
         try:
             import ctypes
 
-            # ウィンドウが作成されるまで待機
-            self.root.update()
+            # アイコンハンドルを取得（プロセス内で1回だけ読み込む）
+            if _ICON_HANDLE is None:
+                hinstance = ctypes.windll.kernel32.GetModuleHandleW(None)
+                icon_handle = ctypes.windll.shell32.ExtractIconW(hinstance, icon_path, 0)
+                if not icon_handle or icon_handle == 1:
+                    print(f"アイコンハンドル取得失敗: {icon_handle}")
+                    return
+                _ICON_HANDLE = icon_handle
+
+            # ウィンドウが作成された後に設定（update()で待機しない）
+            self.root.after(0, self._apply_taskbar_icon, _ICON_HANDLE)
+
+        except Exception as e:
+            print(f"タスクバーアイコン設定エラー: {e}")
+
+    def _apply_taskbar_icon(self, icon_handle):
+        """ウィンドウにアイコンを設定（タスクバーに反映される）"""
+        try:
+            import ctypes
 
             # ウィンドウハンドルを取得
             hwnd = self.root.winfo_id()
-
-            # User32.dllとShell32.dllを読み込み
             user32 = ctypes.windll.user32
-            shell32 = ctypes.windll.shell32
-
-            # アイコンハンドルを取得
-            hinstance = ctypes.windll.kernel32.GetModuleHandleW(None)
-            icon_handle = shell32.ExtractIconW(hinstance, icon_path, 0)
 
-            if icon_handle and icon_handle != 1:
-                # ウィンドウアイコンを設定（タスクバーに反映される）
-                WM_SETICON = 0x0080
-                ICON_SMALL = 0
-                ICON_BIG = 1
+            WM_SETICON = 0x0080
+            ICON_SMALL = 0
+            ICON_BIG = 1
 
-                # 小アイコン（タスクバー用）と大アイコン（ウィンドウ用）を設定
-                user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, icon_handle)
-                user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, icon_handle)
+            # 小アイコン（タスクバー用）と大アイコン（ウィンドウ用）を設定
+            user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, icon_handle)
+            user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, icon_handle)
 
-                print(f"タスクバーアイコン設定成功")
-            else:
-                print(f"アイコンハンドル取得失敗: {icon_handle}")
+            print(f"タスクバーアイコン設定成功")
 
         except Exception as e:
             print(f"タスクバーアイコン設定エラー: {e}")
 
     def _set_app_user_model_id(self):
         """アプリケーションユーザーモデルIDを設定してタスクバーでの識別を改善"""
+        if KeyboardMonitorGUI._app_id_set:
+            return
         try:
             import ctypes
 
             # アプリケーション固有のIDを設定
             app_id = "KeyboardMonitor.GUI.Application"
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
+            KeyboardMonitorGUI._app_id_set = True
             print(f"AppUserModelID設定: {app_id}")
 
         except Exception as e:
@@ -320,6 +349,19 @@ class KeyboardMonitorGUI:
         self.root.mainloop()
 
 
+def _release_taskbar_icon():
+    """タスクバーアイコンのハンドルを解放"""
+    global _ICON_HANDLE
+    if _ICON_HANDLE is None:
+        return
+    try:
+        import ctypes
+        ctypes.windll.user32.DestroyIcon(_ICON_HANDLE)
+    except Exception as e:
+        print(f"アイコン解放エラー: {e}")
+    _ICON_HANDLE = None
+
+
 def main():
     """メイン関数"""
     print("🚀 キーボードモニター - 統合分析ダッシュボード起動中...")
@@ -9,7 +9,7 @@ import sys
 import threading
 import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict
 
 # プロジェクトルートをパスに追加
 project_root = Path(__file__).parent.parent
@@ -17,16 +17,35 @@ sys.path.insert(0, str(project_root / "src"))
 
 import customtkinter as ctk
 
-from analyzer import StatisticsAnalyzer
-from config import get_config
-from data_store import DataStore
-from logger import KeyboardLogger
+if TYPE_CHECKING:
+    from analyzer import StatisticsAnalyzer
+    from data_store import StatsSnapshot
+    from logger import KeyboardLogger
 
 
 class ModernDashboard(ctk.CTkFrame):
     """モダンなカード風ダッシュボード"""
 
-    def __init__(self, parent, keyboard_logger: KeyboardLogger, statistics_analyzer: StatisticsAnalyzer):
+    # キー入力がなくても統計を更新する間隔（ミリ秒、継続時間の表示用）
+    UPDATE_INTERVAL_MS = 1000
+    # キー入力の有無を確認する間隔（ミリ秒、キー入力が続く時の最短更新間隔）
+    DIRTY_CHECK_INTERVAL_MS = 100
+    # エラー時に次の更新まで待つ時間（ミリ秒、連続で失敗するたびに倍にし、上限で止める）
+    ERROR_RETRY_BASE_MS = 500
+    ERROR_RETRY_MAX_MS = 2000
+    # アクティビティログに残す最大行数
+    MAX_LOG_LINES = 500
+    # 統計カードの高さ（文字列の変化でレイアウトを計算し直さないよう固定）
+    STAT_CARD_HEIGHT = 190
+    # 項目ごとの値の書式（指定のない項目はそのまま表示）
+    VALUE_FORMATS = {
+        'keystrokes': "{0:,}",
+        'duration': "{0:02d}:{1:02d}:{2:02d}",
+        'wpm': "{0:.1f}",
+        'total_keys': "{0:,}",
+    }
+
+    def __init__(self, parent, keyboard_logger: "KeyboardLogger", statistics_analyzer: "StatisticsAnalyzer"):
         super().__init__(parent)
 
         self.keyboard_logger = keyboard_logger
@@ -34,7 +53,22 @@ class ModernDashboard(ctk.CTkFrame):
 
         # 更新制御
         self.is_updating = True
-        self.update_thread = None
+        self._after_id = None
+        # キー入力があった時に立てるフラグ（記録スレッドから設定される）
+        self._dirty = threading.Event()
+        self._last_update_time = 0.0
+        # 統計更新が連続で失敗した回数
+        self._fail_count = 0
+        # 項目ごとに最後に表示した値
+        self._last_values: Dict[str, Any] = {}
+        # 項目ごとの表示文字列の組み立て（「キーストローク: {0:,}」のformatメソッド）
+        self._formatters: Dict[str, Callable[..., str]] = {}
+
+        # キー入力の通知を受け取る（他のコールバックはそのまま残す）
+        self.keyboard_logger.set_callbacks(
+            on_key_event=self.keyboard_logger.on_key_event,
+            on_statistics_update=self._on_statistics_update
+        )
 
         # UI作成
         self.setup_ui()
@@ -138,8 +172,10 @@ class ModernDashboard(ctk.CTkFrame):
 
     def _create_stat_card(self, parent, title: str, column: int, stats: Dict[str, str]):
         """統計カードの作成"""
-        card = ctk.CTkFrame(parent)
+        card = ctk.CTkFrame(parent, height=self.STAT_CARD_HEIGHT)
         card.grid(row=0, column=column, padx=10, pady=10, sticky="nsew")
+        # 統計値の文字列が変わってもカードの大きさを変えない
+        card.pack_propagate(False)
 
         # カードタイトル
         title_label = ctk.CTkLabel(
@@ -149,9 +185,11 @@ class ModernDashboard(ctk.CTkFrame):
         )
         title_label.pack(pady=(15, 10))
 
-        # 統計値表示
+        # 統計値表示（表示文字列のテンプレートは更新のたびに組み立てないよう保持しておく）
         stat_labels = {}
         for key, label_text in stats.items():
+            template = f"{label_text}: " + self.VALUE_FORMATS.get(key, "{0}")
+            self._formatters[key] = template.format
             label = ctk.CTkLabel(card, text=f"{label_text}: -")
             label.pack(pady=2)
             stat_labels[key] = label
@@ -182,6 +220,7 @@ class ModernDashboard(ctk.CTkFrame):
         self.activity_log = ctk.CTkTextbox(log_frame, height=80, wrap="word")
         self.activity_log.pack(fill="x", padx=15, pady=(0, 10))
         self.activity_log.insert("1.0", "アプリケーション準備完了\n")
+        self._log_lines = 1
 
     def _toggle_recording(self):
         """記録の開始/停止切り替え"""
@@ -206,82 +245,130 @@ class ModernDashboard(ctk.CTkFrame):
 
     def _start_updates(self):
         """定期的な統計更新を開始"""
-        self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.update_thread.start()
+        self._after_id = self.after_idle(self._tick)
 
-    def _update_loop(self):
-        """統計データの定期更新ループ"""
-        while self.is_updating:
-            try:
+    def _tick(self):
+        """統計データの定期更新（Tkのafterでメインスレッドから呼び出す）"""
+        if not self.is_updating:
+            return
+        interval = self.DIRTY_CHECK_INTERVAL_MS
+        try:
+            # キー入力があった時か、一定時間が経った時だけ更新
+            if self._update_due():
                 self._update_stats()
-                time.sleep(1)
-            except Exception as e:
-                print(f"統計更新エラー: {e}")
-                time.sleep(5)
+                self._fail_count = 0
+        except Exception as e:
+            print(f"統計更新エラー: {e}")
+            interval = min(self.ERROR_RETRY_MAX_MS, self.ERROR_RETRY_BASE_MS * 2 ** self._fail_count)
+            self._fail_count += 1
+            # 待ち時間が過ぎたらキー入力がなくても再試行する
+            self._dirty.set()
+        finally:
+            self._after_id = self.after(interval, self._tick)
+
+    def _update_due(self) -> bool:
+        """統計を更新する必要があるか（キー入力があったか、一定時間が経ったか）"""
+        now = time.monotonic()
+        if not self._dirty.is_set() and now - self._last_update_time < self.UPDATE_INTERVAL_MS / 1000:
+            return False
+        self._dirty.clear()
+        self._last_update_time = now
+        return True
+
+    def _on_statistics_update(self, session_stats: Dict[str, Any]):
+        """キー入力ごとに呼ばれるコールバック（記録スレッドから呼ばれるため通知するだけ）"""
+        self._dirty.set()
 
     def _update_stats(self):
-        """統計データの更新"""
-        try:
-            session_stats = self.keyboard_logger.get_session_statistics()
-            overall_stats = self.statistics_analyzer.get_basic_statistics()
+        """統計データの更新（取得に失敗した場合の再試行は_tickで行う）"""
+        session_stats = self.keyboard_logger.get_session_statistics()
 
-            self.after(0, self._update_ui_stats, session_stats, overall_stats)
-        except Exception as e:
-            print(f"統計データ取得エラー: {e}")
+        # 全体統計はDataStoreの要約を使う（キー入力がなければ再計算されない）
+        overall_stats = self.statistics_analyzer.data_store.snapshot_stats()
+
+        # メインスレッドから呼ばれるため、そのままUIを更新
+        self._update_ui_stats(session_stats, overall_stats)
 
-    def _update_ui_stats(self, session_stats: Dict[str, Any], overall_stats: Dict[str, Any]):
-        """UI統計表示の更新"""
+    def _update_ui_stats(self, session_stats: Dict[str, Any], overall_stats: "StatsSnapshot"):
+        """UI統計表示の更新（値が前回と同じ項目は文字列の組み立ても省略）"""
         try:
             # セッション統計
-            self.session_stats['keystrokes'].configure(
-                text=f"キーストローク: {session_stats.get('keystrokes', 0):,}"
-            )
-
-            elapsed_seconds = session_stats.get('elapsed_seconds', 0)
-            hours, remainder = divmod(int(elapsed_seconds), 3600)
-            minutes, seconds = divmod(remainder, 60)
-            duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            self.session_stats['duration'].configure(text=f"継続時間: {duration}")
+            keystrokes = session_stats.get('keystrokes', 0)
+            if self._changed('keystrokes', keystrokes):
+                self.session_stats['keystrokes'].configure(text=self._formatters['keystrokes'](keystrokes))
+
+            # 継続時間は秒が変わった時だけ組み立てる
+            elapsed = int(session_stats.get('elapsed_seconds', 0))
+            if self._changed('duration', elapsed):
+                hours, remainder = divmod(elapsed, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                self.session_stats['duration'].configure(
+                    text=self._formatters['duration'](hours, minutes, seconds))
 
             wpm = session_stats.get('wpm', 0.0)
-            self.session_stats['wpm'].configure(text=f"WPM: {wpm:.1f}")
+            if self._changed('wpm', wpm):
+                self.session_stats['wpm'].configure(text=self._formatters['wpm'](wpm))
 
             last_key = session_stats.get('last_key', '-')
-            self.session_stats['last_key'].configure(text=f"最後のキー: {last_key}")
+            if self._changed('last_key', last_key):
+                self.session_stats['last_key'].configure(text=self._formatters['last_key'](last_key))
 
             # 全体統計
-            self.total_stats['total_keys'].configure(
-                text=f"総キーストローク: {overall_stats.get('total_keystrokes', 0):,}"
-            )
-            self.total_stats['sessions'].configure(
-                text=f"セッション数: {overall_stats.get('session_count', 0)}"
-            )
-            self.total_stats['avg_wpm'].configure(
-                text=f"平均WPM: {overall_stats.get('average_wpm', 0.0):.1f}"
-            )
-            self.total_stats['most_used'].configure(
-                text=f"最頻出キー: {overall_stats.get('most_frequent_key', '-')}"
-            )
+            # （セッション数・平均WPMは記録されていないため、作成時の「-」のまま）
+            total_keys = overall_stats.total_keystrokes
+            if self._changed('total_keys', total_keys):
+                self.total_stats['total_keys'].configure(text=self._formatters['total_keys'](total_keys))
+
+            most_used = overall_stats.most_frequent_key or '-'
+            if self._changed('most_used', most_used):
+                self.total_stats['most_used'].configure(text=self._formatters['most_used'](most_used))
 
         except Exception as e:
+            # 表示が中途半端になった可能性があるため、次回はすべて更新する
+            self._last_values.clear()
             print(f"UI統計更新エラー: {e}")
 
+    def _changed(self, key: str, value: Any) -> bool:
+        """前回表示した値から変わったかを判定し、変わっていれば記録する"""
+        if key in self._last_values and self._last_values[key] == value:
+            return False
+        self._last_values[key] = value
+        return True
+
     def _log_activity(self, message: str):
         """アクティビティログにメッセージを追加"""
         timestamp = time.strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
 
         def add_to_log():
+            # 末尾を表示している時だけ、追加後に末尾までスクロールする
+            at_end = self.activity_log.yview()[1] >= 0.99
             self.activity_log.insert("end", log_entry)
-            self.activity_log.see("end")
+            self._log_lines += 1
+
+            # 古い行を削除して最大行数に収める
+            excess = self._log_lines - self.MAX_LOG_LINES
+            if excess > 0:
+                self.activity_log.delete("1.0", f"{excess + 1}.0")
+                self._log_lines = self.MAX_LOG_LINES
+
+            if at_end:
+                self.activity_log.see("end")
 
         self.after(0, add_to_log)
 
     def destroy(self):
         """コンポーネント破棄時のクリーンアップ"""
         self.is_updating = False
-        if self.update_thread and self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
+        # キー入力の通知を解除
+        if self.keyboard_logger.on_statistics_update == self._on_statistics_update:
+            self.keyboard_logger.set_callbacks(
+                on_key_event=self.keyboard_logger.on_key_event,
+                on_statistics_update=None
+            )
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
         super().destroy()
 
 
@@ -295,11 +382,10 @@ class ModernTestApp:
         self.root.title("🎯 モダンキーボードモニター")
         self.root.geometry("1000x700")
 
-        # バックエンド初期化
-        config = get_config()
-        data_store = DataStore(str(config.get_data_file_path()))
-        self.keyboard_logger = KeyboardLogger(data_store)
-        self.statistics_analyzer = StatisticsAnalyzer(data_store)
+        # バックエンド初期化（モジュールの読み込み時にはバックエンドを読み込まない）
+        from _bootstrap import backend
+
+        _, _, self.keyboard_logger, self.statistics_analyzer = backend()
 
         # モダンダッシュボード
         self.dashboard = ModernDashboard(
@@ -14,10 +14,7 @@ sys.path.insert(0, str(project_root / "src"))
 
 import customtkinter as ctk
 
-from analyzer import StatisticsAnalyzer
-from config import get_config
-from data_store import DataStore
-from logger import KeyboardLogger
+from _bootstrap import backend
 
 # dashboard_no_wpmをimport
 sys.path.insert(0, str(Path(__file__).parent / "components"))
@@ -34,10 +31,7 @@ class SimpleGUI:
         self.root.geometry("900x700")
 
         # バックエンド初期化
-        config = get_config()
-        self.data_store = DataStore(str(config.get_data_file_path()))
-        self.keyboard_logger = KeyboardLogger(self.data_store)
-        self.statistics_analyzer = StatisticsAnalyzer(self.data_store)
+        _, self.data_store, self.keyboard_logger, self.statistics_analyzer = backend()
 
         # ダッシュボード作成
         self.dashboard = Dashboard(
@@ -0,0 +1,26 @@
+"""
+フォント管理
+
+GUI全体で共有するCTkFontのキャッシュ
+"""
+
+from typing import Dict, Mapping, Tuple
+
+import customtkinter as ctk
+
+# CTkFontはTkルート生成後にしか作れないため、初回使用時に生成して使い回す
+_FONTS: Dict[Tuple[int, str], ctk.CTkFont] = {}
+
+
+def font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """指定サイズ・太さのフォントを取得（未生成なら生成）"""
+    key = (size, weight)
+    cached = _FONTS.get(key)
+    if cached is None:
+        cached = _FONTS[key] = ctk.CTkFont(size=size, weight=weight)
+    return cached
+
+
+def font_set(specs: Mapping[str, Tuple[int, str]]) -> Dict[str, ctk.CTkFont]:
+    """用途名 -> (サイズ, 太さ) の定義から、用途名 -> フォントの辞書を作成"""
+    return {name: font(size, weight) for name, (size, weight) in specs.items()}
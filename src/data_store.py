@@ -12,7 +12,16 @@ import shutil
 from datetime import date, datetime
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+class StatsSnapshot(NamedTuple):
+    """表示用の統計の要約"""
+    total_keystrokes: int
+    unique_keys: int
+    most_frequent_key: Optional[str]
+    first_record_date: Optional[str]
+    last_record_date: Optional[str]
 
 
 class DataStore:
@@ -29,6 +38,8 @@ class DataStore:
         self.backup_dir = self.data_file.parent / "backup"
         self.logger = logging.getLogger(__name__)
         self._lock = Lock()  # スレッドセーフティのためのロック
+        # 統計の要約のキャッシュ（データ, 要約）
+        self._snapshot_cache: Optional[Tuple[Dict[str, Any], StatsSnapshot]] = None
 
         # データファイルとバックアップディレクトリを初期化
         self._initialize_storage()
@@ -194,6 +205,37 @@ class DataStore:
             # 基本的には全データを返す（日付フィルタリングは将来実装）
             return self.data.copy()
 
+    def snapshot_stats(self) -> StatsSnapshot:
+        """
+        統計の要約を取得する
+
+        キー入力が記録されるまでは前回計算した要約を返す
+
+        Returns:
+            統計の要約
+        """
+        with self._lock:
+            total_stats = self.data["total_statistics"]
+            total_keystrokes = total_stats["total_keystrokes"]
+
+            # キー入力ごとに総キーストローク数が増えるため、変わっていなければ再計算しない
+            cached = self._snapshot_cache
+            if (cached is not None and cached[0] is self.data
+                    and cached[1].total_keystrokes == total_keystrokes):
+                return cached[1]
+
+            key_stats = self.data["key_statistics"]
+            top = max(key_stats.values(), key=lambda stats: stats["count"], default=None)
+            snapshot = StatsSnapshot(
+                total_keystrokes=total_keystrokes,
+                unique_keys=len(key_stats),
+                most_frequent_key=top["key_name"] if top else None,
+                first_record_date=total_stats["first_record_date"],
+                last_record_date=total_stats["last_record_date"]
+            )
+            self._snapshot_cache = (self.data, snapshot)
+            return snapshot
+
     def get_top_keys(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         使用頻度上位のキーを取得する
@@ -0,0 +1,152 @@
+"""
+Test module for examples/auto_save_example.py
+
+自動保存・バックアップのスケジューラのテスト
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+# テスト対象モジュールをインポート
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'examples'))
+
+import auto_save_example
+from auto_save_example import AutoSaveManager
+
+
+class FakeConfig:
+    """テスト用の設定（間隔は秒単位の小さな値）"""
+
+    def __init__(self, save_interval, backup_interval, auto_save=True):
+        self.save_interval = save_interval
+        self.backup_interval = backup_interval
+        self.auto_save = auto_save
+
+    def get_save_interval(self):
+        return self.save_interval
+
+    def get_backup_interval(self):
+        return self.backup_interval
+
+    def is_auto_save_enabled(self):
+        return self.auto_save
+
+
+class FakeDataStore:
+    """save_dataの呼び出しを記録するテスト用データストア"""
+
+    def __init__(self, block=None):
+        self.calls = []
+        self.block = block
+        self.lock = threading.Lock()
+
+    def save_data(self, create_backup=False):
+        with self.lock:
+            self.calls.append(create_backup)
+        if self.block is not None:
+            self.block.wait(5)
+        return True
+
+    def count(self, create_backup):
+        with self.lock:
+            return self.calls.count(create_backup)
+
+
+@patch.object(auto_save_example, 'MIN_INTERVAL', 0.01)
+class TestAutoSaveManager(unittest.TestCase):
+    """AutoSaveManagerクラスのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.logger = Mock()
+
+    def _start(self, config, data_store):
+        manager = AutoSaveManager(config, data_store, self.logger)
+        manager.start()
+        self.addCleanup(manager.stop)
+        return manager
+
+    def test_periodic_save(self):
+        """保存間隔ごとに保存される"""
+        data_store = FakeDataStore()
+        self._start(FakeConfig(0.05, 10), data_store)
+
+        time.sleep(0.3)
+
+        self.assertGreaterEqual(data_store.count(False), 3)
+        self.assertEqual(data_store.count(True), 0)
+
+    def test_auto_save_disabled(self):
+        """自動保存が無効の場合はバックアップのみ実行される"""
+        data_store = FakeDataStore()
+        self._start(FakeConfig(0.05, 0.1, auto_save=False), data_store)
+
+        time.sleep(0.35)
+
+        self.assertEqual(data_store.count(False), 0)
+        self.assertGreaterEqual(data_store.count(True), 2)
+
+    def test_coalesce_save_into_backup(self):
+        """期限が重なった保存はバックアップにまとめられる"""
+        data_store = FakeDataStore()
+        self._start(FakeConfig(0.1, 0.1), data_store)
+
+        time.sleep(0.35)
+
+        self.assertGreaterEqual(data_store.count(True), 2)
+        self.assertEqual(data_store.count(False), 0)
+
+    def test_zero_interval_does_not_hang(self):
+        """間隔が0でもスケジューラが止まらず、停止できる"""
+        data_store = FakeDataStore()
+        manager = self._start(FakeConfig(0, 0), data_store)
+
+        time.sleep(0.1)
+        manager.stop()
+
+        self.assertGreater(len(data_store.calls), 0)
+        self.assertIsNone(manager._thread)
+
+    @patch.object(auto_save_example, 'STOP_TIMEOUT', 0.1)
+    def test_stop_does_not_block_on_running_save(self):
+        """書き込み中でもstop()はタイムアウトで戻る"""
+        release = threading.Event()
+        data_store = FakeDataStore(block=release)
+        manager = self._start(FakeConfig(0.01, 10), data_store)
+
+        time.sleep(0.1)
+        started = time.monotonic()
+        manager.stop()
+        elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertLess(elapsed, 1.0)
+        self.logger.warning.assert_called_once()
+
+    def test_stop_and_restart(self):
+        """停止後に再開でき、前回のスレッドは終了している"""
+        data_store = FakeDataStore()
+        manager = self._start(FakeConfig(0.05, 10), data_store)
+
+        time.sleep(0.1)
+        old_thread = manager._thread
+        manager.stop()
+        self.assertFalse(old_thread.is_alive())
+        self.assertFalse(manager.running)
+
+        count = len(data_store.calls)
+        time.sleep(0.15)
+        self.assertEqual(len(data_store.calls), count)
+
+        manager.start()
+        time.sleep(0.2)
+        self.assertGreater(len(data_store.calls), count)
+        self.assertIsNot(manager._thread, old_thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,308 @@
+"""
+Test module for gui/components/analytics/data_analyzer.py
+
+統合分析用のデータ分析クラスのテスト
+"""
+
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# テスト対象モジュールをインポート（パッケージの__init__はGUIを読み込むため直接追加）
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'gui', 'components', 'analytics'))
+
+import data_analyzer
+from data_analyzer import DataAnalyzer
+
+# テスト用のキーボードログ
+SAMPLE_DATA = {
+    "total_statistics": {
+        "total_keystrokes": 40,
+        "first_record_date": "2026-01-05",
+        "last_record_date": "2026-02-10"
+    },
+    "key_statistics": {
+        "65": {"key_name": "A", "count": 10, "modifier_combinations": {
+            "none": {"count": 7, "preceded_by": {"66": 3, "32": 2}},
+            "shift": {"count": 3}}},
+        "32": {"key_name": "Space", "count": 8, "modifier_combinations": {
+            "none": {"count": 8, "preceded_by": {"65": 1, "66": 2}}}},
+        "16": {"key_name": "Left Shift", "count": 6, "modifier_combinations": {
+            "shift": {"count": 6}}},
+        "66": {"key_name": "B", "count": 5, "modifier_combinations": {
+            "none": {"count": 5, "preceded_by": {"65": 4, "13": 1}}}},
+        # key_nameがないキー（Key27 / ランキングではEscape）
+        "27": {"count": 4, "modifier_combinations": {
+            "none": {"count": 2, "preceded_by": {"65": 2}},
+            "shift+ctrl": {"count": 2}}},
+        "67": {"key_name": "C", "count": 2, "modifier_combinations": {
+            "fn+ctrl+super": {"count": 2}}},
+        # 別のコードで同じ名前のキー
+        "97": {"key_name": "A", "count": 1, "modifier_combinations": {
+            "none": {"count": 1, "preceded_by": {"66": 1}}}},
+        # 旧データの表記（win）
+        "68": {"key_name": "D", "count": 4, "modifier_combinations": {
+            "alt+win": {"count": 4}}}
+    }
+}
+
+EMPTY_MODIFIER_USAGE = {
+    "modifier_usage": {"none": 0, "shift": 0, "ctrl": 0, "alt": 0, "super": 0},
+    "usage_ratios": {"none": 100.0, "shift": 0.0, "ctrl": 0.0, "alt": 0.0, "super": 0.0},
+    "raw_counts": {"none": 0, "shift": 0, "ctrl": 0, "alt": 0, "super": 0},
+    "top_shortcuts": []
+}
+
+
+class DataAnalyzerTestCase(unittest.TestCase):
+    """テスト用データファイルを用意する基底クラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.test_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.test_dir, "keyboard_log.json")
+        self._write(SAMPLE_DATA)
+        self.analyzer = DataAnalyzer(self.data_file)
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write(self, data):
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+
+class TestDataAnalyzerResults(DataAnalyzerTestCase):
+    """各公開メソッドの分析結果のテストケース"""
+
+    def test_calculate_basic_stats(self):
+        """基本統計"""
+        self.assertEqual(self.analyzer.calculate_basic_stats(), {
+            "total_keystrokes": 40,
+            "recording_period": "2026/01/05 ～ 2026/02/10"
+        })
+        self.assertEqual(self.analyzer.get_basic_statistics(), self.analyzer.calculate_basic_stats())
+
+    def test_analyze_key_frequency(self):
+        """キー頻度ランキング"""
+        result = self.analyzer.analyze_key_frequency()
+
+        self.assertEqual(
+            [(item["key_name"], item["count"]) for item in result["overall_top5"]],
+            [("A", 10), ("Space", 8), ("Left Shift", 6), ("B", 5), ("Key27", 4)]
+        )
+        self.assertAlmostEqual(result["overall_top5"][0]["percentage"], 25.0)
+        self.assertEqual(
+            [(item["key_name"], item["count"]) for item in result["no_modifier_top5"]],
+            [("Space", 8), ("A", 7), ("B", 5), ("Key27", 2), ("A", 1)]
+        )
+        self.assertAlmostEqual(result["no_modifier_top5"][0]["percentage"], 8 / 23 * 100)
+
+    def test_analyze_modifier_usage(self):
+        """修飾キー使用状況（複合修飾キーは分解し、winはsuperとして集計）"""
+        result = self.analyzer.analyze_modifier_usage()
+
+        expected_counts = {"none": 23, "shift": 11, "ctrl": 4, "alt": 4, "super": 6}
+        self.assertEqual(result["modifier_usage"], expected_counts)
+        self.assertEqual(result["raw_counts"], expected_counts)
+        self.assertAlmostEqual(result["usage_ratios"]["none"], 23 / 48 * 100)
+        self.assertAlmostEqual(sum(result["usage_ratios"].values()), 100.0)
+
+        # 修飾キー自体との組み合わせ（Left Shift + shift）は含まない
+        self.assertEqual(result["top_shortcuts"], [
+            {"combination": "Alt+Super+D", "count": 4, "key_name": "D", "modifier": "alt+win"},
+            {"combination": "Shift+A", "count": 3, "key_name": "A", "modifier": "shift"},
+            {"combination": "Ctrl+Shift+Key27", "count": 2, "key_name": "Key27", "modifier": "shift+ctrl"},
+            {"combination": "Ctrl+Super+Fn+C", "count": 2, "key_name": "C", "modifier": "fn+ctrl+super"}
+        ])
+        self.assertEqual(result["modifier_key_rankings"], self.analyzer.analyze_modifier_key_rankings())
+        self.assertEqual(self.analyzer.get_modifier_usage(), result)
+
+    def test_analyze_modifier_key_rankings(self):
+        """修飾キー別ランキング（key_nameがないキーはコードから推定した名前）"""
+        self.assertEqual(self.analyzer.analyze_modifier_key_rankings(), {
+            "shift": [
+                {"rank": 1, "key_name": "Left Shift", "count": 6},
+                {"rank": 2, "key_name": "A", "count": 3},
+                {"rank": 3, "key_name": "Escape", "count": 2}
+            ],
+            "ctrl": [
+                {"rank": 1, "key_name": "Escape", "count": 2},
+                {"rank": 2, "key_name": "C", "count": 2}
+            ],
+            "alt": [{"rank": 1, "key_name": "D", "count": 4}],
+            "super": [{"rank": 1, "key_name": "C", "count": 2}]
+        })
+
+    def test_create_integrated_sequence_analysis(self):
+        """統合シーケンス分析（直後キーは同じ名前のキーを合算）"""
+        result = self.analyzer.create_integrated_sequence_analysis()
+
+        self.assertEqual(
+            [(item["rank"], item["key_name"], item["total_count"]) for item in result],
+            [(1, "A", 10), (2, "Space", 8), (3, "Left Shift", 6), (4, "B", 5), (5, "Key27", 4)]
+        )
+        self.assertEqual(result[0]["predecessors"], [
+            {"key_name": "B", "count": 3}, {"key_name": "Space", "count": 2}
+        ])
+        self.assertEqual(result[0]["successors"], [
+            {"key_name": "B", "count": 4}, {"key_name": "Key27", "count": 2}, {"key_name": "Space", "count": 1}
+        ])
+        # 記録のないキーコード（13）は特殊キー名で表示
+        self.assertEqual(result[3]["predecessors"], [
+            {"key_name": "A", "count": 4}, {"key_name": "Enter", "count": 1}
+        ])
+        # コード65と97のAを合算
+        self.assertEqual(result[3]["successors"], [
+            {"key_name": "A", "count": 4}, {"key_name": "Space", "count": 2}
+        ])
+        self.assertEqual(result[2]["predecessors"], [])
+        self.assertEqual(result[2]["successors"], [])
+
+    def test_get_integrated_sequence_analysis(self):
+        """統合シーケンス分析（辞書形式）"""
+        result = self.analyzer.get_integrated_sequence_analysis()
+
+        self.assertEqual(list(result), ["A", "Space", "Left Shift", "B", "Key27"])
+        self.assertEqual(result["Key27"], {
+            "count": 4,
+            "predecessors": [{"key_name": "A", "count": 2}],
+            "successors": []
+        })
+
+    def test_get_key_frequency(self):
+        """キー頻度（key_nameがないキーはコードから推定、同じ名前は後のキーで上書き）"""
+        self.assertEqual(self.analyzer.get_key_frequency(), {
+            "A": 1, "Space": 8, "Left Shift": 6, "B": 5, "Escape": 4, "C": 2, "D": 4
+        })
+
+    def test_export_json(self):
+        """JSONエクスポート"""
+        exported = json.loads(self.analyzer.export_data("json"))
+
+        self.assertEqual(exported["basic_stats"]["total_keystrokes"], 40)
+        self.assertEqual(len(exported["key_frequency"]["overall_top5"]), 5)
+        self.assertEqual(exported["modifier_usage"]["modifier_usage"]["shift"], 11)
+        self.assertEqual(len(exported["sequence_analysis"]), 5)
+        self.assertIn("export_timestamp", exported)
+
+    def test_export_csv(self):
+        """CSVエクスポート"""
+        rows = list(csv.reader(io.StringIO(self.analyzer.export_data("csv"))))
+
+        self.assertEqual(rows[0], ["Type", "Key", "Count", "Percentage"])
+        self.assertEqual(rows[1], ["Overall", "A", "10", "25.0"])
+        self.assertIn(["Modifier", "none", "23", "47.9"], rows)
+        self.assertIn(["Shortcut", "Ctrl+Super+Fn+C", "2", ""], rows)
+        self.assertEqual(len(rows), 1 + 5 + 5 + 5 + 4)
+
+    def test_export_unsupported_format(self):
+        """未対応の形式"""
+        with self.assertRaises(ValueError):
+            self.analyzer.export_data("xml")
+
+    def test_has_data(self):
+        """データの有無"""
+        self.assertTrue(self.analyzer.has_data())
+        self.assertEqual(self.analyzer.get_data_file_path(), self.data_file)
+
+
+class TestDataAnalyzerEmpty(DataAnalyzerTestCase):
+    """データがない場合のテストケース"""
+
+    def test_missing_file(self):
+        """データファイルが存在しない場合は既定値を返す"""
+        analyzer = DataAnalyzer(os.path.join(self.test_dir, "missing.json"))
+
+        self.assertFalse(analyzer.has_data())
+        self.assertEqual(analyzer.calculate_basic_stats(), {"total_keystrokes": 0, "recording_period": "記録なし"})
+        self.assertEqual(analyzer.analyze_key_frequency(), {"overall_top5": [], "no_modifier_top5": []})
+        self.assertEqual(analyzer.analyze_modifier_usage(), EMPTY_MODIFIER_USAGE)
+        self.assertEqual(analyzer.create_integrated_sequence_analysis(), [])
+        self.assertEqual(analyzer.get_key_frequency(), {})
+        self.assertEqual(analyzer.debug_data_loading()["file_exists"], False)
+
+    def test_invalid_json(self):
+        """JSONが不正な場合は既定値を返し、キャッシュしない"""
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write("{invalid")
+
+        self.assertEqual(self.analyzer.analyze_key_frequency(), {"overall_top5": [], "no_modifier_top5": []})
+        self.assertEqual(self.analyzer._analysis_cache, {})
+        self.assertFalse(self.analyzer.has_data())
+
+
+class TestDataAnalyzerCache(DataAnalyzerTestCase):
+    """読み込み・分析結果のキャッシュのテストケース"""
+
+    def _touch(self, offset):
+        """ファイルの更新時刻だけを変更"""
+        st = os.stat(self.data_file)
+        os.utime(self.data_file, ns=(st.st_atime_ns, st.st_mtime_ns + offset))
+
+    def test_reuse_result(self):
+        """ファイルが変わらなければ再解析・再計算しない"""
+        with patch.object(data_analyzer, '_read_json', wraps=data_analyzer._read_json) as read_json:
+            first = self.analyzer.analyze_key_frequency()
+            second = self.analyzer.analyze_key_frequency()
+
+        self.assertIs(first, second)
+        self.assertEqual(read_json.call_count, 1)
+
+    def test_aggregates_shared(self):
+        """集計は各分析で共有される"""
+        with patch.object(self.analyzer, '_compute_all', wraps=self.analyzer._compute_all) as compute_all:
+            self.analyzer.analyze_key_frequency()
+            self.analyzer.analyze_modifier_usage()
+            self.analyzer.create_integrated_sequence_analysis()
+
+        self.assertEqual(compute_all.call_count, 1)
+
+    def test_mtime_only_change_keeps_cache(self):
+        """更新時刻だけが変わり内容が同じ場合は再解析しない"""
+        first = self.analyzer.analyze_key_frequency()
+        self._touch(10 ** 9)
+
+        with patch.object(data_analyzer, '_read_json', wraps=data_analyzer._read_json) as read_json:
+            second = self.analyzer.analyze_key_frequency()
+
+        self.assertIs(first, second)
+        self.assertEqual(read_json.call_count, 0)
+
+    def test_size_change_invalidates(self):
+        """サイズが変わった場合は再解析する"""
+        first = self.analyzer.calculate_basic_stats()
+
+        data = json.loads(json.dumps(SAMPLE_DATA))
+        data["total_statistics"]["total_keystrokes"] = 12345
+        self._write(data)
+
+        second = self.analyzer.calculate_basic_stats()
+        self.assertIsNot(first, second)
+        self.assertEqual(second["total_keystrokes"], 12345)
+
+    def test_same_size_content_change_invalidates(self):
+        """サイズが同じでも内容が変わった場合は再解析する"""
+        first = self.analyzer.calculate_basic_stats()
+        size = os.path.getsize(self.data_file)
+
+        data = json.loads(json.dumps(SAMPLE_DATA))
+        data["total_statistics"]["total_keystrokes"] = 41
+        self._write(data)
+        self._touch(10 ** 9)
+        self.assertEqual(os.path.getsize(self.data_file), size)
+
+        second = self.analyzer.calculate_basic_stats()
+        self.assertIsNot(first, second)
+        self.assertEqual(second["total_keystrokes"], 41)
+
+
+if __name__ == '__main__':
+    unittest.main()
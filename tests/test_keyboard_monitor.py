@@ -4,6 +4,7 @@ Test module for keyboard_monitor.py
 キーボードモニターのメインアプリケーションのテスト
 """
 
+import json
 import os
 import sys
 import tempfile
@@ -15,7 +16,7 @@ from unittest.mock import MagicMock, Mock, patch
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from config import ConfigManager
-from data_store import DataStore
+from data_store import DataStore, StatsSnapshot
 from keyboard_monitor import KeyboardMonitor
 
 
@@ -288,6 +289,78 @@ class TestKeyboardMonitorIntegration(unittest.TestCase):
         self.assertFalse(app.cli_running)
 
 
+
+class TestDataStoreSnapshot(unittest.TestCase):
+    """DataStore.snapshot_statsのテストケース"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.test_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.test_dir, 'data', 'keyboard_log.json')
+        self.data_store = DataStore(self.data_file)
+
+    def test_empty_store(self):
+        """データがない場合の要約"""
+        self.assertEqual(self.data_store.snapshot_stats(), StatsSnapshot(
+            total_keystrokes=0,
+            unique_keys=0,
+            most_frequent_key=None,
+            first_record_date=None,
+            last_record_date=None
+        ))
+
+    def test_reuse_when_unchanged(self):
+        """総キーストローク数が変わらなければ前回の要約を返す"""
+        self.data_store.update_key_statistics('65', 'A', 'none')
+
+        first = self.data_store.snapshot_stats()
+        second = self.data_store.snapshot_stats()
+
+        self.assertIs(first, second)
+
+    def test_invalidate_after_update(self):
+        """キー統計の更新後は再計算する"""
+        self.data_store.update_key_statistics('65', 'A', 'none')
+        first = self.data_store.snapshot_stats()
+
+        self.data_store.update_key_statistics('66', 'B', 'none')
+        self.data_store.update_key_statistics('66', 'B', 'shift', previous_key='66')
+        second = self.data_store.snapshot_stats()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.total_keystrokes, 3)
+        self.assertEqual(second.unique_keys, 2)
+        self.assertEqual(second.most_frequent_key, 'B')
+        self.assertIsNotNone(second.first_record_date)
+        self.assertEqual(second.last_record_date, second.first_record_date)
+
+    def test_invalidate_after_load_data(self):
+        """load_dataでデータが置き換わった場合は再計算する（総数が同じでも）"""
+        self.data_store.update_key_statistics('65', 'A', 'none')
+        first = self.data_store.snapshot_stats()
+
+        loaded = {
+            "total_statistics": {
+                "total_keystrokes": 1,
+                "first_record_date": "2026-01-01",
+                "last_record_date": "2026-01-02",
+                "version": "1.0"
+            },
+            "key_statistics": {
+                "90": {"key_name": "Z", "count": 1, "modifier_combinations": {}}
+            }
+        }
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(loaded, f)
+        self.assertTrue(self.data_store.load_data())
+
+        second = self.data_store.snapshot_stats()
+        self.assertIsNot(first, second)
+        self.assertEqual(second.total_keystrokes, 1)
+        self.assertEqual(second.most_frequent_key, 'Z')
+        self.assertEqual(second.first_record_date, '2026-01-01')
+
+
 if __name__ == '__main__':
     # テストスイートの実行
     unittest.main(verbosity=2)